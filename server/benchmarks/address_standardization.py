@@ -0,0 +1,66 @@
+"""
+Compares the throughput of the batch address standardization engine against the previous row-wise apply.
+
+Run from the server directory:
+    python -m benchmarks.address_standardization --rows 1000000 --distinct 20000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.controllers.address import standardize_eviction_addresses, _evictions_address_concat_standardize
+
+STREET_NAMES = ['Peachtree', 'Ponce De Leon', 'Memorial', 'Candler', 'Glenwood', 'Flat Shoals', 'Campbellton',
+                'Fulton Industrial', 'Old National', 'Buford']
+STREET_TYPES = ['Street', 'St', 'Road', 'Rd.', 'Avenue', 'Ave', 'Drive', 'Dr', 'Parkway', 'Pkwy', 'Circle']
+DIRECTIONALS = ['', 'NE', 'NW', 'SE', 'SW', 'North', 'South']
+CITIES = ['ATLANTA GA 30303', 'DECATUR GA 30032', 'EAST POINT GA 30344', 'COLLEGE PARK GA 30349']
+
+
+def generate_evictions(num_rows: int, num_distinct: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    distinct_addresses = [
+        f"{rng.integers(1, 9999)} {rng.choice(DIRECTIONALS)} {rng.choice(STREET_NAMES)} {rng.choice(STREET_TYPES)}"
+        f", APT {rng.integers(1, 500)}".replace('  ', ' ')
+        for _ in range(num_distinct)]
+    distinct_cities = [rng.choice(CITIES) for _ in range(num_distinct)]
+
+    # Skewed towards a small number of large complexes, as in the real filings
+    picks = np.minimum(rng.zipf(1.3, num_rows) - 1, num_distinct - 1)
+    return pd.DataFrame({
+        'defendantAddress1': np.array(distinct_addresses, dtype=object)[picks],
+        'defendantCity1': np.array(distinct_cities, dtype=object)[picks],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--distinct', type=int, default=20_000)
+    parser.add_argument('--apply-sample', type=int, default=20_000,
+                        help='Rows timed with the row-wise apply; its rate is extrapolated to the full file')
+    args = parser.parse_args()
+
+    df = generate_evictions(args.rows, args.distinct)
+    num_distinct = df.drop_duplicates().shape[0]
+    print(f"Generated {args.rows} rows with {num_distinct} distinct addresses")
+
+    sample = df.head(args.apply_sample)
+    start = time.perf_counter()
+    sample.apply(lambda row: _evictions_address_concat_standardize(row['defendantAddress1'], row['defendantCity1']),
+                 axis=1)
+    apply_rate = sample.shape[0] / (time.perf_counter() - start)
+    print(f"Row-wise apply: {apply_rate:,.0f} rows/sec (est. {args.rows / apply_rate:,.1f}s for the full file)")
+
+    start = time.perf_counter()
+    standardize_eviction_addresses(df)
+    batch_elapsed = time.perf_counter() - start
+    batch_rate = args.rows / batch_elapsed
+    print(f"Batch engine: {batch_rate:,.0f} rows/sec ({batch_elapsed:,.1f}s for the full file)")
+    print(f"Speedup: {batch_rate / apply_rate:,.1f}x")
+
+
+if __name__ == '__main__':
+    main()
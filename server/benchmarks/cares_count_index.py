@@ -0,0 +1,68 @@
+"""
+Compares answering the CARES map's date-range counts from the cares_daily_counts rollup in SQL against the in-memory
+prefix-sum index, over random date ranges, and checks that both return the same counts. Requires DB_URL to point at a
+database with the project schema and data; nothing is written.
+
+Run from the server directory:
+    python -m benchmarks.cares_count_index --ranges 200
+"""
+import argparse
+import datetime
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+from src.controllers import count_index
+from src.controllers.cares import get_all_cares_records_from_db
+from src.db.db import SessionLocal
+
+
+def generate_date_ranges(num_ranges: int, first_day: datetime.date, last_day: datetime.date, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    num_days = (last_day - first_day).days + 1
+    starts = rng.integers(0, num_days, num_ranges)
+    lengths = rng.integers(0, num_days, num_ranges)
+    return [(first_day + datetime.timedelta(days=int(start)),
+             first_day + datetime.timedelta(days=int(min(start + length, num_days - 1))))
+            for start, length in zip(starts, lengths)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ranges', type=int, default=200)
+    parser.add_argument('--min-count', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count_index.build_cares_count_index()
+    index = count_index._cares_count_index
+    print(f"Index build: {time.perf_counter() - start:.3f}s, {index.prefix_sums.shape[0]} counted properties x "
+          f"{index.prefix_sums.shape[1]} days, {index.prefix_sums.nbytes / 1e6:.1f}MB")
+
+    with SessionLocal() as db:
+        counties = db.execute(text('SELECT DISTINCT "countyName" FROM cares WHERE "countyName" IS NOT NULL'))\
+            .scalars().all()
+        date_ranges = generate_date_ranges(args.ranges, index.first_day, index.last_day)
+
+        sql_seconds = 0
+        index_seconds = 0
+        for date_from, date_to in date_ranges:
+            start = time.perf_counter()
+            sql_records, _ = get_all_cares_records_from_db(db, counties, date_from, date_to, args.min_count)
+            sql_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            cares_ids, _, counts = count_index.get_indexed_cares_counts(counties, date_from, date_to, args.min_count)
+            index_seconds += time.perf_counter() - start
+
+            sql_counts = {record['id']: record['count'] for record in sql_records}
+            assert sql_counts == dict(zip(cares_ids.tolist(), counts.tolist())), (date_from, date_to)
+
+    print(f"SQL rollup: {1000 * sql_seconds / args.ranges:.2f}ms per range")
+    print(f"Prefix-sum index: {1000 * index_seconds / args.ranges:.3f}ms per range "
+          f"({sql_seconds / index_seconds:.0f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Compares staging transformed upload records into the new-evictions temporary table with the previous executemany
+insert against the COPY-based loader. Requires DB_URL to point at a database with the project schema; every run is
+rolled back.
+
+Run from the server directory:
+    python -m benchmarks.eviction_staging --rows 100000 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert
+
+from src.controllers.eviction import _create_temp_tables, _stage_eviction_records
+from src.db.db import SessionLocal
+from src.db.models.Eviction import TempEviction
+
+
+def generate_transformed_evictions(num_rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    file_dates = pd.Timestamp('2020-03-01') + pd.to_timedelta(rng.integers(0, 1500, num_rows), unit='D')
+    street_numbers = rng.integers(1, 9999, num_rows).astype(str)
+    return pd.DataFrame({
+        'fileDate': file_dates.strftime('%Y-%m-%d'),
+        'caseID': [f"BENCH{i:09d}" for i in range(num_rows)],
+        'plaintiff': 'BENCHMARK PROPERTIES LLC',
+        'plaintiffAddress': '1 PEACHTREE ST NE',
+        'plaintiffCity': 'ATLANTA GA 30303',
+        'defendantAddress1': np.char.add(street_numbers, ' MEMORIAL DR SE, APT 1'),
+        'defendantCity1': 'ATLANTA GA 30316',
+        'standardizedAddress': np.char.add(street_numbers, ' memorial dr se'),
+    })
+
+
+def time_executemany(df: pd.DataFrame):
+    with SessionLocal() as db:
+        _create_temp_tables(db)
+        start = time.perf_counter()
+        db.execute(insert(TempEviction), df.to_dict(orient='records'))
+        elapsed = time.perf_counter() - start
+        db.rollback()
+    return elapsed
+
+
+def time_copy(df: pd.DataFrame):
+    with SessionLocal() as db:
+        _create_temp_tables(db)
+        start = time.perf_counter()
+        _stage_eviction_records(db, df)
+        elapsed = time.perf_counter() - start
+        db.rollback()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for num_rows in args.rows:
+        df = generate_transformed_evictions(num_rows)
+        executemany_elapsed = time_executemany(df)
+        copy_elapsed = time_copy(df)
+        print(f"{num_rows:>10,} rows | executemany: {executemany_elapsed:8.2f}s "
+              f"({num_rows / executemany_elapsed:>10,.0f} rows/sec) | COPY: {copy_elapsed:8.2f}s "
+              f"({num_rows / copy_elapsed:>10,.0f} rows/sec) | speedup: {executemany_elapsed / copy_elapsed:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Local stand-in for the Census batch geocoder, speaking the same addressbatch multipart protocol and CSV response
+layout. Addresses are answered from a fixture table when given one, and otherwise with deterministic synthetic points
+around metro Atlanta; the Tie/No_Match share, error rate and latency are configurable.
+
+Run from the server directory, then point the server at it with GEOCODING_API_URL:
+    python -m benchmarks.geocoder_standin --port 8090 --latency 0.5 --no-match-ratio 0.1
+    GEOCODING_API_URL=http://localhost:8090/geocoder/locations/addressbatch uvicorn src.main:app ...
+
+Fixture CSVs have the columns street, zip, lon, lat.
+"""
+import argparse
+import asyncio
+import csv
+import hashlib
+import random
+from io import StringIO
+
+import pandas as pd
+import uvicorn
+from fastapi import FastAPI, UploadFile, Form, Response
+
+# Bounding box synthetic points are spread over
+MIN_LON, MAX_LON = -84.55, -84.10
+MIN_LAT, MAX_LAT = 33.60, 33.95
+
+
+def _address_fraction(street: str, zip_code: str, salt: str):
+    # Deterministic value in [0, 1) per address, so repeated runs see the same matches and points
+    digest = hashlib.md5(f"{salt}|{street.strip().lower()}|{zip_code.strip()}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') / 2 ** 64
+
+
+def create_app(latency: float = 0.0, latency_per_address: float = 0.0, error_rate: float = 0.0,
+               tie_ratio: float = 0.0, no_match_ratio: float = 0.0, fixtures: pd.DataFrame | None = None,
+               seed: int = 0):
+    app = FastAPI()
+    rng = random.Random(seed)
+    fixture_points = {} if fixtures is None else {
+        (str(row.street).strip().lower(), str(row.zip).strip()): (row.lon, row.lat)
+        for row in fixtures.itertuples(index=False)}
+
+    def _geocode(street: str, zip_code: str):
+        fixture_point = fixture_points.get((street.strip().lower(), zip_code.strip()))
+        if fixture_point is not None:
+            return 'Match', fixture_point
+        if fixtures is not None:
+            return 'No_Match', None
+
+        outcome = _address_fraction(street, zip_code, 'outcome')
+        if outcome < no_match_ratio:
+            return 'No_Match', None
+        if outcome < no_match_ratio + tie_ratio:
+            return 'Tie', None
+        lon = MIN_LON + _address_fraction(street, zip_code, 'lon') * (MAX_LON - MIN_LON)
+        lat = MIN_LAT + _address_fraction(street, zip_code, 'lat') * (MAX_LAT - MIN_LAT)
+        return 'Match', (round(lon, 6), round(lat, 6))
+
+    @app.post("/geocoder/locations/addressbatch")
+    async def post_address_batch(addressFile: UploadFile, benchmark: str = Form('4')):
+        rows = list(csv.reader(StringIO((await addressFile.read()).decode('utf-8'))))
+
+        await asyncio.sleep(latency + latency_per_address * len(rows))
+        if rng.random() < error_rate:
+            return Response('Internal Server Error', status_code=500)
+
+        output = StringIO()
+        writer = csv.writer(output, quoting=csv.QUOTE_ALL, lineterminator='\n')
+        for row in rows:
+            record_id, street, city, state, zip_code = (row + [''] * 5)[:5]
+            input_address = f"{street}, {city}, {state}, {zip_code}"
+            match, point = _geocode(street, zip_code)
+            if match == 'Match':
+                lon, lat = point
+                matched_address = f"{street.upper()}, ATLANTA, {state}, {zip_code}"
+                tiger_id = int(_address_fraction(street, zip_code, 'tiger') * 10 ** 9)
+                writer.writerow([record_id, input_address, 'Match', 'Exact', matched_address, f"{lon},{lat}",
+                                 tiger_id, 'L'])
+            else:
+                writer.writerow([record_id, input_address, match])
+
+        return Response(output.getvalue(), media_type='text/csv')
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every request')
+    parser.add_argument('--latency-per-address', type=float, default=0.0, help='Seconds added per address')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with a 500')
+    parser.add_argument('--tie-ratio', type=float, default=0.0)
+    parser.add_argument('--no-match-ratio', type=float, default=0.0)
+    parser.add_argument('--fixtures', help='CSV of street, zip, lon, lat; other addresses are answered No_Match')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    fixtures = pd.read_csv(args.fixtures, dtype={'street': str, 'zip': str}) if args.fixtures else None
+    app = create_app(args.latency, args.latency_per_address, args.error_rate, args.tie_ratio, args.no_match_ratio,
+                     fixtures, args.seed)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
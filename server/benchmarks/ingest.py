@@ -0,0 +1,137 @@
+"""
+End-to-end upload ingest benchmark against the local geocoder stand-in. Generates a synthetic county export, starts
+the stand-in on a background thread and runs the ingest pipeline on it, reporting the time spent in each stage. The
+first run starts from cold caches; later runs re-upload the same file, as cumulative feeds do. Requires DB_URL to point
+at a database with the project schema; benchmark records (caseIDs prefixed BENCH-) are deleted afterwards unless
+--keep is given.
+
+Run from the server directory:
+    python -m benchmarks.ingest --rows 100000 --latency 0.5 --latency-per-address 0.0005
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import uvicorn
+
+from benchmarks.geocoder_standin import create_app
+
+COL_MAP = {
+    'Case Number': 'caseID',
+    'File Date': 'fileDate',
+    'Plaintiff': 'plaintiff',
+    'Plaintiff Address': 'plaintiffAddress',
+    'Plaintiff City': 'plaintiffCity',
+    'Defendant Address': 'defendantAddress1',
+    'Defendant City': 'defendantCity1',
+}
+
+
+def write_synthetic_export(path: str, num_rows: int, num_distinct: int, seed: int = 0):
+    # Imported here since it imports src, which must only happen once GEOCODING_API_URL is set (see main)
+    from benchmarks.address_standardization import generate_evictions
+
+    rng = np.random.default_rng(seed)
+    addresses = generate_evictions(num_rows, num_distinct, seed)
+    file_dates = pd.Timestamp('2020-03-01') + pd.to_timedelta(rng.integers(0, 1500, num_rows), unit='D')
+    pd.DataFrame({
+        'Case Number': [f"BENCH-{i:09d}" for i in range(num_rows)],
+        'File Date': file_dates.strftime('%-m/%-d/%y'),
+        'Plaintiff': 'BENCHMARK PROPERTIES LLC',
+        'Plaintiff Address': '1 PEACHTREE ST NE',
+        'Plaintiff City': 'ATLANTA GA 30303',
+        'Defendant Address': addresses['defendantAddress1'],
+        'Defendant City': addresses['defendantCity1'],
+    }).to_csv(path, index=False)
+
+
+def start_geocoder_standin(port: int, **standin_options):
+    server = uvicorn.Server(uvicorn.Config(create_app(**standin_options), host='127.0.0.1', port=port,
+                                          log_level='warning'))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+def run_ingest(path: str):
+    from src.controllers.eviction import stage_eviction_file, get_matches
+    from src.db.db import SessionLocal
+
+    stage_started_at = {}
+
+    def report_progress(stage: str, rows_processed: int | None = None):
+        stage_started_at.setdefault(stage, time.perf_counter())
+
+    start = time.perf_counter()
+    with SessionLocal() as db, open(path, 'rb') as file:
+        upload_summary = stage_eviction_file(db, file, COL_MAP, report_progress)
+        match_summary = asyncio.run(get_matches(db, report_progress))
+    end = time.perf_counter()
+
+    stage_started_at['staging'] = start
+    boundaries = sorted(stage_started_at.items(), key=lambda item: item[1]) + [('end', end)]
+    stage_seconds = {stage: boundaries[i + 1][1] - started_at for i, (stage, started_at) in
+                     enumerate(boundaries[:-1])}
+    return end - start, stage_seconds, {**upload_summary, **match_summary}
+
+
+def delete_benchmark_records():
+    from sqlalchemy import text
+    from src.controllers.suggestion import track_suggestion_changes
+    from src.db.db import SessionLocal
+
+    # Deleted like any other write to the records, so that the suggestion count, daily counts and the count index of
+    #   running servers are updated too
+    with SessionLocal() as db:
+        with track_suggestion_changes(db, """SELECT "caseID" FROM evictions WHERE "caseID" LIKE 'BENCH-%'"""):
+            db.execute(text("""DELETE FROM cares_eviction_proximity WHERE "caseID" LIKE 'BENCH-%'"""))
+            db.execute(text("""DELETE FROM "eviction-cares" WHERE "evictionId" LIKE 'BENCH-%'"""))
+            db.execute(text("""DELETE FROM evictions WHERE "caseID" LIKE 'BENCH-%'"""))
+        db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--distinct', type=int, default=20_000)
+    parser.add_argument('--runs', type=int, default=2)
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--latency', type=float, default=0.5)
+    parser.add_argument('--latency-per-address', type=float, default=0.0005)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--tie-ratio', type=float, default=0.02)
+    parser.add_argument('--no-match-ratio', type=float, default=0.08)
+    parser.add_argument('--keep', action='store_true', help='Keep the benchmark records in the database')
+    args = parser.parse_args()
+
+    # Must be set before src is imported, since the geocoder URL is read once at import time
+    os.environ['GEOCODING_API_URL'] = f"http://127.0.0.1:{args.port}/geocoder/locations/addressbatch"
+    server, thread = start_geocoder_standin(args.port, latency=args.latency,
+                                            latency_per_address=args.latency_per_address,
+                                            error_rate=args.error_rate, tie_ratio=args.tie_ratio,
+                                            no_match_ratio=args.no_match_ratio)
+
+    with tempfile.NamedTemporaryFile(suffix='.csv') as export:
+        write_synthetic_export(export.name, args.rows, args.distinct)
+        try:
+            for run in range(args.runs):
+                elapsed, stage_seconds, summary = run_ingest(export.name)
+                stages = ', '.join([f"{stage} {seconds:.2f}s" for stage, seconds in stage_seconds.items()])
+                print(f"Run {run + 1}: {elapsed:.2f}s ({args.rows / elapsed:,.0f} rows/sec) | {stages}")
+                print(f"    {summary}")
+        finally:
+            if not args.keep:
+                delete_benchmark_records()
+            server.should_exit = True
+            thread.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1935 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import usaddress
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..utils.consts import ADDRESS_STANDARDIZATION_WORKERS, ADDRESS_STANDARDIZATION_CHUNK_SIZE, \
+    ADDRESS_STANDARDIZATION_PARALLEL_THRESHOLD
+
+logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+usps_street_suffix_abbreviations = [
+    {
+        "primary_street_suffix_name": "ALLEY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ALLEE",
+            "ALLEY",
+            "ALLY",
+            "ALY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ALY"
+    },
+    {
+        "primary_street_suffix_name": "ANEX",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ANEX",
+            "ANNEX",
+            "ANNX",
+            "ANX"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ANX"
+    },
+    {
+        "primary_street_suffix_name": "ARCADE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ARC",
+            "ARCADE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ARC"
+    },
+    {
+        "primary_street_suffix_name": "AVENUE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "AV",
+            "AVE",
+            "AVEN",
+            "AVENU",
+            "AVENUE",
+            "AVN",
+            "AVNUE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "AVE"
+    },
+    {
+        "primary_street_suffix_name": "BAYOU",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BAYOO",
+            "BAYOU"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BYU"
+    },
+    {
+        "primary_street_suffix_name": "BEACH",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BCH",
+            "BEACH"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BCH"
+    },
+    {
+        "primary_street_suffix_name": "BEND",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BEND",
+            "BND"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BND"
+    },
+    {
+        "primary_street_suffix_name": "BLUFF",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BLF",
+            "BLUF",
+            "BLUFF"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BLF"
+    },
+    {
+        "primary_street_suffix_name": "BLUFFS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BLUFFS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BLFS"
+    },
+    {
+        "primary_street_suffix_name": "BOTTOM",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BOT",
+            "BTM",
+            "BOTTM",
+            "BOTTOM"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BTM"
+    },
+    {
+        "primary_street_suffix_name": "BOULEVARD",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BLVD",
+            "BOUL",
+            "BOULEVARD",
+            "BOULV"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BLVD"
+    },
+    {
+        "primary_street_suffix_name": "BRANCH",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BR",
+            "BRNCH",
+            "BRANCH"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BR"
+    },
+    {
+        "primary_street_suffix_name": "BRIDGE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BRDGE",
+            "BRG",
+            "BRIDGE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BRG"
+    },
+    {
+        "primary_street_suffix_name": "BROOK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BRK",
+            "BROOK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BRK"
+    },
+    {
+        "primary_street_suffix_name": "BROOKS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BROOKS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BRKS"
+    },
+    {
+        "primary_street_suffix_name": "BURG",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BURG"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BG"
+    },
+    {
+        "primary_street_suffix_name": "BURGS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BURGS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BGS"
+    },
+    {
+        "primary_street_suffix_name": "BYPASS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "BYP",
+            "BYPA",
+            "BYPAS",
+            "BYPASS",
+            "BYPS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "BYP"
+    },
+    {
+        "primary_street_suffix_name": "CAMP",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CAMP",
+            "CP",
+            "CMP"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CP"
+    },
+    {
+        "primary_street_suffix_name": "CANYON",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CANYN",
+            "CANYON",
+            "CNYN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CYN"
+    },
+    {
+        "primary_street_suffix_name": "CAPE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CAPE",
+            "CPE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CPE"
+    },
+    {
+        "primary_street_suffix_name": "CAUSEWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CAUSEWAY",
+            "CAUSWA",
+            "CSWY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CSWY"
+    },
+    {
+        "primary_street_suffix_name": "CENTER",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CEN",
+            "CENT",
+            "CENTER",
+            "CENTR",
+            "CENTRE",
+            "CNTER",
+            "CNTR",
+            "CTR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CTR"
+    },
+    {
+        "primary_street_suffix_name": "CENTERS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CENTERS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CTRS"
+    },
+    {
+        "primary_street_suffix_name": "CIRCLE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CIR",
+            "CIRC",
+            "CIRCL",
+            "CIRCLE",
+            "CRCL",
+            "CRCLE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CIR"
+    },
+    {
+        "primary_street_suffix_name": "CIRCLES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CIRCLES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CIRS"
+    },
+    {
+        "primary_street_suffix_name": "CLIFF",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CLF",
+            "CLIFF"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CLF"
+    },
+    {
+        "primary_street_suffix_name": "CLIFFS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CLFS",
+            "CLIFFS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CLFS"
+    },
+    {
+        "primary_street_suffix_name": "CLUB",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CLB",
+            "CLUB"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CLB"
+    },
+    {
+        "primary_street_suffix_name": "COMMON",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COMMON"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CMN"
+    },
+    {
+        "primary_street_suffix_name": "COMMONS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COMMONS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CMNS"
+    },
+    {
+        "primary_street_suffix_name": "CORNER",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COR",
+            "CORNER"
+        ],
+        "postal_service_standard_suffix_abbreviation": "COR"
+    },
+    {
+        "primary_street_suffix_name": "CORNERS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CORNERS",
+            "CORS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CORS"
+    },
+    {
+        "primary_street_suffix_name": "COURSE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COURSE",
+            "CRSE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CRSE"
+    },
+    {
+        "primary_street_suffix_name": "COURT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COURT",
+            "CT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CT"
+    },
+    {
+        "primary_street_suffix_name": "COURTS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COURTS",
+            "CTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CTS"
+    },
+    {
+        "primary_street_suffix_name": "COVE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COVE",
+            "CV"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CV"
+    },
+    {
+        "primary_street_suffix_name": "COVES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "COVES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CVS"
+    },
+    {
+        "primary_street_suffix_name": "CREEK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CREEK",
+            "CRK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CRK"
+    },
+    {
+        "primary_street_suffix_name": "CRESCENT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CRESCENT",
+            "CRES",
+            "CRSENT",
+            "CRSNT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CRES"
+    },
+    {
+        "primary_street_suffix_name": "CREST",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CREST"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CRST"
+    },
+    {
+        "primary_street_suffix_name": "CROSSING",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CROSSING",
+            "CRSSNG",
+            "XING"
+        ],
+        "postal_service_standard_suffix_abbreviation": "XING"
+    },
+    {
+        "primary_street_suffix_name": "CROSSROAD",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CROSSROAD"
+        ],
+        "postal_service_standard_suffix_abbreviation": "XRD"
+    },
+    {
+        "primary_street_suffix_name": "CROSSROADS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CROSSROADS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "XRDS"
+    },
+    {
+        "primary_street_suffix_name": "CURVE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "CURVE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "CURV"
+    },
+    {
+        "primary_street_suffix_name": "DALE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "DALE",
+            "DL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "DL"
+    },
+    {
+        "primary_street_suffix_name": "DAM",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "DAM",
+            "DM"
+        ],
+        "postal_service_standard_suffix_abbreviation": "DM"
+    },
+    {
+        "primary_street_suffix_name": "DIVIDE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "DIV",
+            "DIVIDE",
+            "DV",
+            "DVD"
+        ],
+        "postal_service_standard_suffix_abbreviation": "DV"
+    },
+    {
+        "primary_street_suffix_name": "DRIVE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "DR",
+            "DRIV",
+            "DRIVE",
+            "DRV"
+        ],
+        "postal_service_standard_suffix_abbreviation": "DR"
+    },
+    {
+        "primary_street_suffix_name": "DRIVES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "DRIVES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "DRS"
+    },
+    {
+        "primary_street_suffix_name": "ESTATE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "EST",
+            "ESTATE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "EST"
+    },
+    {
+        "primary_street_suffix_name": "ESTATES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ESTATES",
+            "ESTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ESTS"
+    },
+    {
+        "primary_street_suffix_name": "EXPRESSWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "EXP",
+            "EXPR",
+            "EXPRESS",
+            "EXPRESSWAY",
+            "EXPW",
+            "EXPY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "EXPY"
+    },
+    {
+        "primary_street_suffix_name": "EXTENSION",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "EXT",
+            "EXTENSION",
+            "EXTN",
+            "EXTNSN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "EXT"
+    },
+    {
+        "primary_street_suffix_name": "EXTENSIONS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "EXTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "EXTS"
+    },
+    {
+        "primary_street_suffix_name": "FALL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FALL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FALL"
+    },
+    {
+        "primary_street_suffix_name": "FALLS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FALLS",
+            "FLS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FLS"
+    },
+    {
+        "primary_street_suffix_name": "FERRY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FERRY",
+            "FRRY",
+            "FRY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRY"
+    },
+    {
+        "primary_street_suffix_name": "FIELD",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FIELD",
+            "FLD"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FLD"
+    },
+    {
+        "primary_street_suffix_name": "FIELDS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FIELDS",
+            "FLDS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FLDS"
+    },
+    {
+        "primary_street_suffix_name": "FLAT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FLAT",
+            "FLT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FLT"
+    },
+    {
+        "primary_street_suffix_name": "FLATS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FLATS",
+            "FLTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FLTS"
+    },
+    {
+        "primary_street_suffix_name": "FORD",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FORD",
+            "FRD"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRD"
+    },
+    {
+        "primary_street_suffix_name": "FORDS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FORDS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRDS"
+    },
+    {
+        "primary_street_suffix_name": "FOREST",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FOREST",
+            "FORESTS",
+            "FRST"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRST"
+    },
+    {
+        "primary_street_suffix_name": "FORGE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FORG",
+            "FORGE",
+            "FRG"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRG"
+    },
+    {
+        "primary_street_suffix_name": "FORGES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FORGES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRGS"
+    },
+    {
+        "primary_street_suffix_name": "FORK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FORK",
+            "FRK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRK"
+    },
+    {
+        "primary_street_suffix_name": "FORKS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FORKS",
+            "FRKS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FRKS"
+    },
+    {
+        "primary_street_suffix_name": "FORT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FORT",
+            "FRT",
+            "FT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FT"
+    },
+    {
+        "primary_street_suffix_name": "FREEWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "FREEWAY",
+            "FREEWY",
+            "FRWAY",
+            "FRWY",
+            "FWY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "FWY"
+    },
+    {
+        "primary_street_suffix_name": "GARDEN",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GARDEN",
+            "GARDN",
+            "GRDEN",
+            "GRDN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GDN"
+    },
+    {
+        "primary_street_suffix_name": "GARDENS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GARDENS",
+            "GDNS",
+            "GRDNS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GDNS"
+    },
+    {
+        "primary_street_suffix_name": "GATEWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GATEWAY",
+            "GATEWY",
+            "GATWAY",
+            "GTWAY",
+            "GTWY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GTWY"
+    },
+    {
+        "primary_street_suffix_name": "GLEN",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GLEN",
+            "GLN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GLN"
+    },
+    {
+        "primary_street_suffix_name": "GLENS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GLENS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GLNS"
+    },
+    {
+        "primary_street_suffix_name": "GREEN",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GREEN",
+            "GRN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GRN"
+    },
+    {
+        "primary_street_suffix_name": "GREENS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GREENS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GRNS"
+    },
+    {
+        "primary_street_suffix_name": "GROVE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GROV",
+            "GROVE",
+            "GRV"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GRV"
+    },
+    {
+        "primary_street_suffix_name": "GROVES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "GROVES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "GRVS"
+    },
+    {
+        "primary_street_suffix_name": "HARBOR",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HARB",
+            "HARBOR",
+            "HARBR",
+            "HBR",
+            "HRBOR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HBR"
+    },
+    {
+        "primary_street_suffix_name": "HARBORS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HARBORS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HBRS"
+    },
+    {
+        "primary_street_suffix_name": "HAVEN",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HAVEN",
+            "HVN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HVN"
+    },
+    {
+        "primary_street_suffix_name": "HEIGHTS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HT",
+            "HTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HTS"
+    },
+    {
+        "primary_street_suffix_name": "HIGHWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HIGHWAY",
+            "HIGHWY",
+            "HIWAY",
+            "HIWY",
+            "HWAY",
+            "HWY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HWY"
+    },
+    {
+        "primary_street_suffix_name": "HILL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HILL",
+            "HL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HL"
+    },
+    {
+        "primary_street_suffix_name": "HILLS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HILLS",
+            "HLS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HLS"
+    },
+    {
+        "primary_street_suffix_name": "HOLLOW",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "HLLW",
+            "HOLLOW",
+            "HOLLOWS",
+            "HOLW",
+            "HOLWS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "HOLW"
+    },
+    {
+        "primary_street_suffix_name": "INLET",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "INLT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "INLT"
+    },
+    {
+        "primary_street_suffix_name": "ISLAND",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "IS",
+            "ISLAND",
+            "ISLND"
+        ],
+        "postal_service_standard_suffix_abbreviation": "IS"
+    },
+    {
+        "primary_street_suffix_name": "ISLANDS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ISLANDS",
+            "ISLNDS",
+            "ISS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ISS"
+    },
+    {
+        "primary_street_suffix_name": "ISLE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ISLE",
+            "ISLES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ISLE"
+    },
+    {
+        "primary_street_suffix_name": "JUNCTION",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "JCT",
+            "JCTION",
+            "JCTN",
+            "JUNCTION",
+            "JUNCTN",
+            "JUNCTON"
+        ],
+        "postal_service_standard_suffix_abbreviation": "JCT"
+    },
+    {
+        "primary_street_suffix_name": "JUNCTIONS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "JCTNS",
+            "JCTS",
+            "JUNCTIONS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "JCTS"
+    },
+    {
+        "primary_street_suffix_name": "KEY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "KEY",
+            "KY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "KY"
+    },
+    {
+        "primary_street_suffix_name": "KEYS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "KEYS",
+            "KYS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "KYS"
+    },
+    {
+        "primary_street_suffix_name": "KNOLL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "KNL",
+            "KNOL",
+            "KNOLL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "KNL"
+    },
+    {
+        "primary_street_suffix_name": "KNOLLS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "KNLS",
+            "KNOLLS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "KNLS"
+    },
+    {
+        "primary_street_suffix_name": "LAKE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LK",
+            "LAKE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LK"
+    },
+    {
+        "primary_street_suffix_name": "LAKES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LKS",
+            "LAKES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LKS"
+    },
+    {
+        "primary_street_suffix_name": "LAND",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LAND"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LAND"
+    },
+    {
+        "primary_street_suffix_name": "LANDING",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LANDING",
+            "LNDG",
+            "LNDNG"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LNDG"
+    },
+    {
+        "primary_street_suffix_name": "LANE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LANE",
+            "LN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LN"
+    },
+    {
+        "primary_street_suffix_name": "LIGHT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LGT",
+            "LIGHT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LGT"
+    },
+    {
+        "primary_street_suffix_name": "LIGHTS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LIGHTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LGTS"
+    },
+    {
+        "primary_street_suffix_name": "LOAF",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LF",
+            "LOAF"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LF"
+    },
+    {
+        "primary_street_suffix_name": "LOCK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LCK",
+            "LOCK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LCK"
+    },
+    {
+        "primary_street_suffix_name": "LOCKS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LCKS",
+            "LOCKS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LCKS"
+    },
+    {
+        "primary_street_suffix_name": "LODGE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LDG",
+            "LDGE",
+            "LODG",
+            "LODGE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LDG"
+    },
+    {
+        "primary_street_suffix_name": "LOOP",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "LOOP",
+            "LOOPS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "LOOP"
+    },
+    {
+        "primary_street_suffix_name": "MALL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MALL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MALL"
+    },
+    {
+        "primary_street_suffix_name": "MANOR",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MNR",
+            "MANOR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MNR"
+    },
+    {
+        "primary_street_suffix_name": "MANORS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MANORS",
+            "MNRS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MNRS"
+    },
+    {
+        "primary_street_suffix_name": "MEADOW",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MEADOW"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MDW"
+    },
+    {
+        "primary_street_suffix_name": "MEADOWS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MDW",
+            "MDWS",
+            "MEADOWS",
+            "MEDOWS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MDWS"
+    },
+    {
+        "primary_street_suffix_name": "MEWS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MEWS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MEWS"
+    },
+    {
+        "primary_street_suffix_name": "MILL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MILL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ML"
+    },
+    {
+        "primary_street_suffix_name": "MILLS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MILLS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MLS"
+    },
+    {
+        "primary_street_suffix_name": "MISSION",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MISSN",
+            "MSSN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MSN"
+    },
+    {
+        "primary_street_suffix_name": "MOTORWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MOTORWAY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MTWY"
+    },
+    {
+        "primary_street_suffix_name": "MOUNT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MNT",
+            "MT",
+            "MOUNT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MT"
+    },
+    {
+        "primary_street_suffix_name": "MOUNTAIN",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MNTAIN",
+            "MNTN",
+            "MOUNTAIN",
+            "MOUNTIN",
+            "MTIN",
+            "MTN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MTN"
+    },
+    {
+        "primary_street_suffix_name": "MOUNTAINS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "MNTNS",
+            "MOUNTAINS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "MTNS"
+    },
+    {
+        "primary_street_suffix_name": "NECK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "NCK",
+            "NECK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "NCK"
+    },
+    {
+        "primary_street_suffix_name": "ORCHARD",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ORCH",
+            "ORCHARD",
+            "ORCHRD"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ORCH"
+    },
+    {
+        "primary_street_suffix_name": "OVAL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "OVAL",
+            "OVL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "OVAL"
+    },
+    {
+        "primary_street_suffix_name": "OVERPASS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "OVERPASS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "OPAS"
+    },
+    {
+        "primary_street_suffix_name": "PARK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PARK",
+            "PRK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PARK"
+    },
+    {
+        "primary_street_suffix_name": "PARKS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PARKS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PARK"
+    },
+    {
+        "primary_street_suffix_name": "PARKWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PARKWAY",
+            "PARKWY",
+            "PKWAY",
+            "PKWY",
+            "PKY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PKWY"
+    },
+    {
+        "primary_street_suffix_name": "PARKWAYS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PARKWAYS",
+            "PKWYS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PKWY"
+    },
+    {
+        "primary_street_suffix_name": "PASS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PASS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PASS"
+    },
+    {
+        "primary_street_suffix_name": "PASSAGE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PASSAGE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PSGE"
+    },
+    {
+        "primary_street_suffix_name": "PATH",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PATH",
+            "PATHS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PATH"
+    },
+    {
+        "primary_street_suffix_name": "PIKE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PIKE",
+            "PIKES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PIKE"
+    },
+    {
+        "primary_street_suffix_name": "PINE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PINE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PNE"
+    },
+    {
+        "primary_street_suffix_name": "PINES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PINES",
+            "PNES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PNES"
+    },
+    {
+        "primary_street_suffix_name": "PLACE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PL"
+    },
+    {
+        "primary_street_suffix_name": "PLAIN",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PLAIN",
+            "PLN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PLN"
+    },
+    {
+        "primary_street_suffix_name": "PLAINS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PLAINS",
+            "PLNS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PLNS"
+    },
+    {
+        "primary_street_suffix_name": "PLAZA",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PLAZA",
+            "PLZ",
+            "PLZA"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PLZ"
+    },
+    {
+        "primary_street_suffix_name": "POINT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "POINT",
+            "PT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PT"
+    },
+    {
+        "primary_street_suffix_name": "POINTS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "POINTS",
+            "PTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PTS"
+    },
+    {
+        "primary_street_suffix_name": "PORT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PORT",
+            "PRT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PRT"
+    },
+    {
+        "primary_street_suffix_name": "PORTS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PORTS",
+            "PRTS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PRTS"
+    },
+    {
+        "primary_street_suffix_name": "PRAIRIE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "PR",
+            "PRAIRIE",
+            "PRR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "PR"
+    },
+    {
+        "primary_street_suffix_name": "RADIAL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RAD",
+            "RADIAL",
+            "RADIEL",
+            "RADL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RADL"
+    },
+    {
+        "primary_street_suffix_name": "RAMP",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RAMP"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RAMP"
+    },
+    {
+        "primary_street_suffix_name": "RANCH",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RANCH",
+            "RANCHES",
+            "RNCH",
+            "RNCHS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RNCH"
+    },
+    {
+        "primary_street_suffix_name": "RAPID",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RAPID",
+            "RPD"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RPD"
+    },
+    {
+        "primary_street_suffix_name": "RAPIDS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RAPIDS",
+            "RPDS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RPDS"
+    },
+    {
+        "primary_street_suffix_name": "REST",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "REST",
+            "RST"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RST"
+    },
+    {
+        "primary_street_suffix_name": "RIDGE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RDG",
+            "RDGE",
+            "RIDGE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RDG"
+    },
+    {
+        "primary_street_suffix_name": "RIDGES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RDGS",
+            "RIDGES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RDGS"
+    },
+    {
+        "primary_street_suffix_name": "RIVER",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RIV",
+            "RIVER",
+            "RVR",
+            "RIVR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RIV"
+    },
+    {
+        "primary_street_suffix_name": "ROAD",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RD",
+            "ROAD"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RD"
+    },
+    {
+        "primary_street_suffix_name": "ROADS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ROADS",
+            "RDS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RDS"
+    },
+    {
+        "primary_street_suffix_name": "ROUTE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ROUTE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RTE"
+    },
+    {
+        "primary_street_suffix_name": "ROW",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "ROW"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ROW"
+    },
+    {
+        "primary_street_suffix_name": "RUE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RUE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RUE"
+    },
+    {
+        "primary_street_suffix_name": "RUN",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "RUN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "RUN"
+    },
+    {
+        "primary_street_suffix_name": "SHOAL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SHL",
+            "SHOAL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SHL"
+    },
+    {
+        "primary_street_suffix_name": "SHOALS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SHLS",
+            "SHOALS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SHLS"
+    },
+    {
+        "primary_street_suffix_name": "SHORE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SHOAR",
+            "SHORE",
+            "SHR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SHR"
+    },
+    {
+        "primary_street_suffix_name": "SHORES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SHOARS",
+            "SHORES",
+            "SHRS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SHRS"
+    },
+    {
+        "primary_street_suffix_name": "SKYWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SKYWAY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SKWY"
+    },
+    {
+        "primary_street_suffix_name": "SPRING",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SPG",
+            "SPNG",
+            "SPRING",
+            "SPRNG"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SPG"
+    },
+    {
+        "primary_street_suffix_name": "SPRINGS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SPGS",
+            "SPNGS",
+            "SPRINGS",
+            "SPRNGS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SPGS"
+    },
+    {
+        "primary_street_suffix_name": "SPUR",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SPUR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SPUR"
+    },
+    {
+        "primary_street_suffix_name": "SPURS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SPURS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SPUR"
+    },
+    {
+        "primary_street_suffix_name": "SQUARE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SQ",
+            "SQR",
+            "SQRE",
+            "SQU",
+            "SQUARE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SQ"
+    },
+    {
+        "primary_street_suffix_name": "SQUARES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SQRS",
+            "SQUARES"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SQS"
+    },
+    {
+        "primary_street_suffix_name": "STATION",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "STA",
+            "STATION",
+            "STATN",
+            "STN"
+        ],
+        "postal_service_standard_suffix_abbreviation": "STA"
+    },
+    {
+        "primary_street_suffix_name": "STRAVENUE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "STRA",
+            "STRAV",
+            "STRAVEN",
+            "STRAVENUE",
+            "STRAVN",
+            "STRVN",
+            "STRVNUE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "STRA"
+    },
+    {
+        "primary_street_suffix_name": "STREAM",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "STREAM",
+            "STREME",
+            "STRM"
+        ],
+        "postal_service_standard_suffix_abbreviation": "STRM"
+    },
+    {
+        "primary_street_suffix_name": "STREET",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "STREET",
+            "STRT",
+            "ST",
+            "STR"
+        ],
+        "postal_service_standard_suffix_abbreviation": "ST"
+    },
+    {
+        "primary_street_suffix_name": "STREETS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "STREETS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "STS"
+    },
+    {
+        "primary_street_suffix_name": "SUMMIT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "SMT",
+            "SUMIT",
+            "SUMITT",
+            "SUMMIT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "SMT"
+    },
+    {
+        "primary_street_suffix_name": "TERRACE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TER",
+            "TERR",
+            "TERRACE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TER"
+    },
+    {
+        "primary_street_suffix_name": "THROUGHWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "THROUGHWAY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TRWY"
+    },
+    {
+        "primary_street_suffix_name": "TRACE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TRACE",
+            "TRACES",
+            "TRCE"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TRCE"
+    },
+    {
+        "primary_street_suffix_name": "TRACK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TRACK",
+            "TRACKS",
+            "TRAK",
+            "TRK",
+            "TRKS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TRAK"
+    },
+    {
+        "primary_street_suffix_name": "TRAFFICWAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TRAFFICWAY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TRFY"
+    },
+    {
+        "primary_street_suffix_name": "TRAIL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TRAIL",
+            "TRAILS",
+            "TRL",
+            "TRLS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TRL"
+    },
+    {
+        "primary_street_suffix_name": "TRAILER",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TRAILER",
+            "TRLR",
+            "TRLRS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TRLR"
+    },
+    {
+        "primary_street_suffix_name": "TUNNEL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TUNEL",
+            "TUNL",
+            "TUNLS",
+            "TUNNEL",
+            "TUNNELS",
+            "TUNNL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TUNL"
+    },
+    {
+        "primary_street_suffix_name": "TURNPIKE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "TRNPK",
+            "TURNPIKE",
+            "TURNPK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "TPKE"
+    },
+    {
+        "primary_street_suffix_name": "UNDERPASS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "UNDERPASS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "UPAS"
+    },
+    {
+        "primary_street_suffix_name": "UNION",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "UN",
+            "UNION"
+        ],
+        "postal_service_standard_suffix_abbreviation": "UN"
+    },
+    {
+        "primary_street_suffix_name": "UNIONS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "UNIONS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "UNS"
+    },
+    {
+        "primary_street_suffix_name": "VALLEY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VALLEY",
+            "VALLY",
+            "VLLY",
+            "VLY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VLY"
+    },
+    {
+        "primary_street_suffix_name": "VALLEYS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VALLEYS",
+            "VLYS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VLYS"
+    },
+    {
+        "primary_street_suffix_name": "VIADUCT",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VDCT",
+            "VIA",
+            "VIADCT",
+            "VIADUCT"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VIA"
+    },
+    {
+        "primary_street_suffix_name": "VIEW",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VIEW",
+            "VW"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VW"
+    },
+    {
+        "primary_street_suffix_name": "VIEWS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VIEWS",
+            "VWS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VWS"
+    },
+    {
+        "primary_street_suffix_name": "VILLAGE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VILL",
+            "VILLAG",
+            "VILLAGE",
+            "VILLG",
+            "VILLIAGE",
+            "VLG"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VLG"
+    },
+    {
+        "primary_street_suffix_name": "VILLAGES",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VILLAGES",
+            "VLGS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VLGS"
+    },
+    {
+        "primary_street_suffix_name": "VILLE",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VILLE",
+            "VL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VL"
+    },
+    {
+        "primary_street_suffix_name": "VISTA",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "VIS",
+            "VIST",
+            "VISTA",
+            "VST",
+            "VSTA"
+        ],
+        "postal_service_standard_suffix_abbreviation": "VIS"
+    },
+    {
+        "primary_street_suffix_name": "WALK",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "WALK"
+        ],
+        "postal_service_standard_suffix_abbreviation": "WALK"
+    },
+    {
+        "primary_street_suffix_name": "WALKS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "WALKS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "WALK"
+    },
+    {
+        "primary_street_suffix_name": "WALL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "WALL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "WALL"
+    },
+    {
+        "primary_street_suffix_name": "WAY",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "WY",
+            "WAY"
+        ],
+        "postal_service_standard_suffix_abbreviation": "WAY"
+    },
+    {
+        "primary_street_suffix_name": "WAYS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "WAYS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "WAYS"
+    },
+    {
+        "primary_street_suffix_name": "WELL",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "WELL"
+        ],
+        "postal_service_standard_suffix_abbreviation": "WL"
+    },
+    {
+        "primary_street_suffix_name": "WELLS",
+        "commonly_used_street_suffix_or_abbreviation": [
+            "WELLS",
+            "WLS"
+        ],
+        "postal_service_standard_suffix_abbreviation": "WLS"
+    }
+]
+
+type_mapping = {}
+for suffix in usps_street_suffix_abbreviations:
+    for perm in suffix['commonly_used_street_suffix_or_abbreviation']:
+        type_mapping[perm.lower()] = suffix['postal_service_standard_suffix_abbreviation'].lower()
+
+directional_mapping = {
+    "north": "n",
+    "n": "n",
+    "east": "e",
+    "e": "e",
+    "south": "s",
+    "s": "s",
+    "west": "w",
+    "w": "w",
+    "northeast": "ne",
+    "ne": "ne",
+    "southeast": "se",
+    "se": "se",
+    "southwest": "sw",
+    "sw": "sw",
+    "northwest": "nw",
+    "nw": "nw",
+}
+
+# Bump whenever the standardization rules change, so addresses cached under older rules are standardized again
+STANDARDIZER_VERSION = 1
+
+# Intentionally omits secondary addresses, occupancy information, etc.
+relevant_tags = set(
+    ['AddressNumber', 'AddressNumberPrefix', 'AddressNumberSuffix', 'StreetName', 'StreetNamePreDirectional',
+     'StreetNamePreModifier', 'StreetNamePreType', 'StreetNamePostDirectional', 'StreetNamePostModifier',
+     'StreetNamePostType'])
+
+directional_tags = set(['StreetNamePreDirectional', 'StreetNamePostDirectional'])
+type_tags = set(['StreetNamePreType', 'StreetNamePostType'])
+
+
+def _standardize_address(address: str):
+    parsed = usaddress.parse(address)
+    standardized_address = []
+
+    for address_part in parsed:
+        part_string = address_part[0]
+        part_tag = address_part[1]
+        standardized_part = part_string.lower()
+        if not part_tag in relevant_tags:
+            continue
+
+        if part_tag in directional_tags:
+            # Strips non-alphabet characters and makes lowercase
+            stripped_directional_part_tag = "".join(filter(str.isalpha, part_string)).lower()
+            if stripped_directional_part_tag in directional_mapping:
+                standardized_part = directional_mapping[stripped_directional_part_tag]
+            else:
+                standardized_part = stripped_directional_part_tag
+        elif part_tag in type_tags:
+            stripped_type_part_tag = "".join(filter(str.isalpha, part_string)).lower()
+            if stripped_type_part_tag in type_mapping:
+                standardized_part = type_mapping[stripped_type_part_tag]
+            else:
+                standardized_part = stripped_type_part_tag
+
+        standardized_address.append(standardized_part)
+
+    if standardized_address == "":
+        return address
+    else:
+        return ' '.join(standardized_address)
+
+
+def _evictions_address_concat_standardize(address, city):
+    if pd.isna(address):
+        address = ''
+    if pd.isna(city):
+        city = ''
+    full_address = ' '.join([address, city])
+    try:
+        return _standardize_address(full_address)
+    except:
+        return address.lower()
+
+
+def _standardize_address_pairs(address_pairs: list):
+    return [_evictions_address_concat_standardize(address, city) for address, city in address_pairs]
+
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # Spawned (rather than forked) workers avoid inheriting locks held by the server's threads
+        _executor = ProcessPoolExecutor(max_workers=ADDRESS_STANDARDIZATION_WORKERS,
+                                        mp_context=multiprocessing.get_context('spawn'))
+    return _executor
+
+
+def _standardize_unique_address_pairs(address_pairs: list):
+    if len(address_pairs) < ADDRESS_STANDARDIZATION_PARALLEL_THRESHOLD:
+        return _standardize_address_pairs(address_pairs)
+
+    chunks = [address_pairs[i:i + ADDRESS_STANDARDIZATION_CHUNK_SIZE]
+              for i in range(0, len(address_pairs), ADDRESS_STANDARDIZATION_CHUNK_SIZE)]
+    standardized_chunks = _get_executor().map(_standardize_address_pairs, chunks)
+    return [standardized for chunk in standardized_chunks for standardized in chunk]
+
+
+def _get_cached_address_pairs(db: Session, unique_pairs: pd.DataFrame):
+    query = """
+        SELECT cache.address, cache.city, cache."standardizedAddress"
+        FROM address_cache AS cache
+        INNER JOIN unnest(CAST(:addresses AS TEXT[]), CAST(:cities AS TEXT[])) AS k(address, city)
+        ON cache.address = k.address AND cache.city = k.city
+        WHERE cache."standardizerVersion" = :version
+    """
+    return pd.read_sql(text(query), db.connection(), params={
+        'addresses': unique_pairs['address'].tolist(),
+        'cities': unique_pairs['city'].tolist(),
+        'version': STANDARDIZER_VERSION,
+    })
+
+
+def _cache_address_pairs(db: Session, standardized_pairs: pd.DataFrame):
+    if standardized_pairs.shape[0] == 0:
+        return
+
+    query = """
+        INSERT INTO address_cache (address, city, "standardizerVersion", "standardizedAddress")
+        SELECT unnest(:addresses), unnest(:cities), :version, unnest(:standardized_addresses)
+        ON CONFLICT DO NOTHING
+    """
+    # Committed on a session of its own, so the work is kept even if the upload's transaction is rolled back
+    with Session(db.get_bind()) as cache_db:
+        cache_db.execute(text(query), {
+            'addresses': standardized_pairs['address'].tolist(),
+            'cities': standardized_pairs['city'].tolist(),
+            'version': STANDARDIZER_VERSION,
+            'standardized_addresses': standardized_pairs['standardizedAddress'].tolist(),
+        })
+        cache_db.commit()
+
+
+def _standardize_unique_address_frame(unique_pairs: pd.DataFrame, db: Session | None):
+    # Chunks can be left without pairs, e.g. when every row was rejected, so the lookup is skipped for them
+    if db is None or unique_pairs.shape[0] == 0:
+        cached_pairs = unique_pairs.iloc[:0].assign(standardizedAddress=None)
+    else:
+        cached_pairs = _get_cached_address_pairs(db, unique_pairs)
+
+    missed_pairs = unique_pairs.merge(cached_pairs[['address', 'city']], how='left', indicator=True)
+    missed_pairs = missed_pairs[missed_pairs['_merge'] == 'left_only'].drop(columns='_merge')
+
+    logger.info(f"Number of distinct addresses to standardize: {missed_pairs.shape[0]} "
+                f"({cached_pairs.shape[0]} cached)")
+
+    standardized_missed_pairs = missed_pairs.assign(standardizedAddress=_standardize_unique_address_pairs(
+        list(missed_pairs.itertuples(index=False, name=None))))
+
+    if db is not None:
+        _cache_address_pairs(db, standardized_missed_pairs)
+
+    return pd.concat([cached_pairs, standardized_missed_pairs], ignore_index=True)
+
+
+def standardize_eviction_addresses(df: pd.DataFrame, db: Session | None = None):
+    # Evictions repeat the same addresses many times, so each distinct (address, city) pair is only standardized once
+    #   (or looked up from address_cache when a session is given) and the results are mapped back onto every row.
+    #   Missing values are keyed as empty strings, which standardize identically
+    address_pairs = pd.DataFrame({
+        'address': df['defendantAddress1'].fillna(''),
+        'city': df['defendantCity1'].fillna(''),
+    }, index=df.index)
+    unique_pairs = address_pairs.drop_duplicates()
+
+    standardized_unique_pairs = _standardize_unique_address_frame(unique_pairs, db)
+
+    standardized_pairs = address_pairs.merge(standardized_unique_pairs, how='left', on=['address', 'city'])
+    return pd.Series(standardized_pairs['standardizedAddress'].to_numpy(), index=df.index, dtype=object)
@@ -1,11 +1,12 @@
 import datetime
-from typing import List
+from typing import List, Iterable
 
+import numpy as np
 import pandas as pd
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from ..utils.consts import PROXIMITY_RADIUS
+from .count_index import get_indexed_cares_counts
 
 
 def _extract_lon_lat(location):
@@ -21,19 +22,20 @@ def populate_default_dates(date_from: datetime.date | None, date_to: datetime.da
 
 
 def _construct_county_filter_subquery(counties: List[str]):
-    return ' OR '.join([f"""counties."name10" = '{county}'""" for county in counties])
+    county_names = ', '.join([f"'{county}'" for county in counties])
+    return f'c."countyName" IN ({county_names})'
 
 
 def construct_date_filter_subquery(date_from: datetime.date | None = None, date_to: datetime.date | None = None,
-                                   first_filter: bool = False):
+                                   first_filter: bool = False, column: str = 'e."fileDate"'):
     if date_from is None and date_to is None:
         return ''
     conjunction = 'WHERE' if first_filter else 'AND'
     statements = []
     if date_from is not None:
-        statements.append(f""" e."fileDate" >= '{date_from}' """)
+        statements.append(f""" {column} >= '{date_from}' """)
     if date_to is not None:
-        statements.append(f""" e."fileDate" <= '{date_to}' """)
+        statements.append(f""" {column} <= '{date_to}' """)
     date_filter_subquery = conjunction + ' AND '.join(statements)
 
     return date_filter_subquery
@@ -42,22 +44,43 @@ def construct_date_filter_subquery(date_from: datetime.date | None = None, date_
 def get_all_cares_records(db: Session, counties: List[str], dateFrom: datetime.date | None = None,
                           dateTo: datetime.date | None = None,
                           minCount: int = 0, activity: bool = False):
+    indexed_counts = get_indexed_cares_counts(counties, dateFrom, dateTo, minCount)
+    if indexed_counts is None:
+        return get_all_cares_records_from_db(db, counties, dateFrom, dateTo, minCount, activity)
+
+    cares_ids, locations, counts = indexed_counts
+    if cares_ids.shape[0] == 0:
+        return [], 0
+
+    records = [{'id': cares_id, 'location': location, 'count': count} for cares_id, location, count in
+               zip(cares_ids.tolist(), locations.tolist(), counts.tolist())]
+    return records, counts.max().item()
+
+
+def get_all_cares_records_from_db(db: Session, counties: List[str], dateFrom: datetime.date | None = None,
+                                  dateTo: datetime.date | None = None,
+                                  minCount: int = 0, activity: bool = False):
     county_filter_subquery = _construct_county_filter_subquery(counties)
 
-    date_filter_subquery = construct_date_filter_subquery(dateFrom, dateTo)
+    day_filter_subquery = construct_date_filter_subquery(dateFrom, dateTo, first_filter=True, column='d.day')
+    # With a date range, only properties with matched records in it are returned
+    count_join = 'INNER' if day_filter_subquery else 'LEFT'
 
     query = f"""
         SELECT
             c.id,
             ST_AsText(c.location) AS location,
-            COUNT(CASE WHEN r.type IN ('ADDRESS_MATCH', 'MANUAL_MATCH') THEN e."caseID" END) AS count
+            COALESCE(counts.count, 0) AS count
         FROM cares AS c
-        LEFT JOIN "eviction-cares" AS r ON c.id = r."caresId"
-        LEFT JOIN evictions AS e ON r."evictionId" = e."caseID"
-        LEFT JOIN counties ON ST_Within(c.location::geometry, counties.geom::geometry)
-        WHERE ({county_filter_subquery}) {date_filter_subquery}
-        GROUP BY c.id
-        HAVING COUNT(CASE WHEN r.type IN ('ADDRESS_MATCH', 'MANUAL_MATCH') THEN e."caseID" END) >= {minCount};
+        {count_join} JOIN (
+            SELECT d."caresId", SUM(d.matched) AS count
+            FROM cares_daily_counts AS d
+            {day_filter_subquery}
+            GROUP BY d."caresId"
+            HAVING SUM(d.matched) > 0
+        ) AS counts ON c.id = counts."caresId"
+        WHERE ({county_filter_subquery})
+          AND COALESCE(counts.count, 0) >= {minCount};
     """
 
     cares_eviction_count = pd.read_sql(query, db.connection())
@@ -71,114 +94,75 @@ def get_all_cares_records(db: Session, counties: List[str], dateFrom: datetime.d
     return cares_eviction_count_copy.to_dict(orient='records'), cares_eviction_count_copy['count'].max().item()
 
 
-def get_property_eviction_count_by_month(db: Session, id: int, dateFrom: datetime.date | None = None,
-                                         dateTo: datetime.date | None = None):
-    date_filter_subquery = construct_date_filter_subquery(dateFrom, dateTo)
-    date_from, date_to = populate_default_dates(dateFrom, dateTo)
+# Label format of each history granularity
+HISTORY_LABEL_FORMATS = {
+    'year': '%Y',
+    'month': '%m/%y',
+    'week': '%m/%d/%y',
+}
+
 
+def get_property_daily_counts(db: Session, id: int, dateFrom: datetime.date | None = None,
+                              dateTo: datetime.date | None = None):
+    day_filter_subquery = construct_date_filter_subquery(dateFrom, dateTo, column='d.day')
     query = f"""
-    WITH property AS (SELECT id, location
-                    FROM cares
-                    WHERE cares.id = {id}),
-        inexacts AS (SELECT "caseID",
-                            "fileDate"
-                    FROM evictions AS e
-                            LEFT JOIN "eviction-cares" AS r
-                                        ON e."caseID" = r."evictionId"
-                    WHERE ST_DWithin(
-                                (SELECT location FROM property)::geography,
-                                e.location::geography,
-                                {PROXIMITY_RADIUS},
-                                true
-                            )
-                        AND (
-                        r.type IS NULL OR
-                        (r."caresId" != {id} AND r.type = 'MANUAL_REJECT')
-                        ) {date_filter_subquery})
-    SELECT to_char(months.month, 'MM/YY')                    AS label,
-        COALESCE(record_counts.record_count, 0)           AS value,
-        COALESCE(record_counts_potential.record_count, 0) AS potential
-    FROM (SELECT generate_series(
-                        date_trunc('month', '{date_from}'::date),
-                        date_trunc('month', '{date_to}'::date),
-                        '1 month'::interval
-                ) AS month) AS months
-            LEFT JOIN (SELECT date_trunc('month', "fileDate") AS month,
-                            COUNT(*)                        AS record_count
-                        FROM evictions AS e
-                                LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
-                                LEFT JOIN cares AS c ON r."caresId" = c.id
-                        WHERE c.id = {id}
-                        AND r.type IN ('ADDRESS_MATCH', 'MANUAL_MATCH')
-                        {date_filter_subquery}
-                        GROUP BY 1) AS record_counts
-                    ON months.month = record_counts.month
-            LEFT JOIN (SELECT date_trunc('month', "fileDate") AS month,
-                            COUNT(*)                        AS record_count
-                        FROM inexacts
-                        GROUP BY 1) AS record_counts_potential ON months.month = record_counts_potential.month
-    ORDER BY months.month;
+        SELECT d.day, d.matched, d.potential
+        FROM cares_daily_counts AS d
+        WHERE d."caresId" = {id} {day_filter_subquery}
+        ORDER BY d.day;
     """
-    property_eviction_count_by_month = pd.read_sql(query, db.connection())
-    if property_eviction_count_by_month.shape[0] > 0:
-        return property_eviction_count_by_month.to_dict(orient='records')
-    else:
+    daily_counts = pd.read_sql(query, db.connection())
+    daily_counts['day'] = pd.to_datetime(daily_counts['day'])
+    return daily_counts
+
+
+def _get_history_periods(days: np.ndarray, granularity: str):
+    # Consecutive integers numbering the bucket of each day. Weeks run Monday to Sunday, and 1970-01-01 is a Thursday
+    if granularity == 'week':
+        return (days.astype('datetime64[D]').astype(np.int64) + 3) // 7
+    unit = 'datetime64[M]' if granularity == 'month' else 'datetime64[Y]'
+    return days.astype(unit).astype(np.int64)
+
+
+def _get_history_period_starts(periods: np.ndarray, granularity: str):
+    # Weeks are labelled by the Sunday before them
+    if granularity == 'week':
+        return (periods * 7 - 4).astype('datetime64[D]')
+    unit = 'datetime64[M]' if granularity == 'month' else 'datetime64[Y]'
+    return periods.astype(unit).astype('datetime64[D]')
+
+
+def resample_property_history(daily_counts: pd.DataFrame, granularity: str, dateFrom: datetime.date | None = None,
+                              dateTo: datetime.date | None = None):
+    # Buckets span the whole date range, defaulting as populate_default_dates, including those without records
+    date_range = np.array(populate_default_dates(dateFrom, dateTo), dtype='datetime64[D]')
+    first_period, last_period = _get_history_periods(date_range, granularity)
+    if granularity == 'week':
+        # The last week is the one after date_to's
+        last_period += 1
+    num_periods = last_period - first_period + 1
+    # A range that ends before it starts (e.g. dateFrom after dateTo, or a future dateFrom without dateTo) is empty
+    if num_periods <= 0:
         return []
 
+    offsets = _get_history_periods(daily_counts['day'].to_numpy(dtype='datetime64[D]'), granularity) - first_period
+    in_range = (offsets >= 0) & (offsets < num_periods)
+    counts = [np.bincount(offsets[in_range], weights=daily_counts[column].to_numpy()[in_range],
+                          minlength=num_periods).astype(np.int64).tolist() for column in ['matched', 'potential']]
 
-def get_property_eviction_count_by_week(db: Session, id: int, dateFrom: datetime.date | None = None,
-                                        dateTo: datetime.date | None = None):
-    date_filter_subquery = construct_date_filter_subquery(dateFrom, dateTo)
-    date_from, date_to = populate_default_dates(dateFrom, dateTo)
+    period_starts = _get_history_period_starts(np.arange(first_period, last_period + 1), granularity)
+    labels = [period_start.strftime(HISTORY_LABEL_FORMATS[granularity]) for period_start in period_starts.tolist()]
+    return [{'label': label, 'value': value, 'potential': potential} for label, value, potential in
+            zip(labels, *counts)]
 
-    query = f"""
-    WITH property AS (SELECT id, location
-                    FROM cares
-                    WHERE cares.id = {id}),
-        inexacts AS (SELECT "caseID",
-                            "fileDate"
-                    FROM evictions AS e
-                            LEFT JOIN "eviction-cares" AS r
-                                        ON e."caseID" = r."evictionId"
-                    WHERE ST_DWithin(
-                                (SELECT location FROM property)::geography,
-                                e.location::geography,
-                                {PROXIMITY_RADIUS},
-                                true
-                            )
-                        AND (
-                        r.type IS NULL OR
-                        (r."caresId" != {id} AND r.type = 'MANUAL_REJECT')
-                        ) {date_filter_subquery})
-    SELECT to_char(weeks.week, 'MM/DD/YY')                   AS label,
-        COALESCE(record_counts.record_count, 0)           AS value,
-        COALESCE(record_counts_potential.record_count, 0) AS potential
-    FROM (SELECT generate_series(
-                        date_trunc('week', '{date_from}'::date) - interval '1 day', -- Start on Sunday
-                        date_trunc('week', '{date_to}'::date) - interval '1 day' + interval '1 week',
-                        '1 week'::interval
-                ) AS week) AS weeks
-            LEFT JOIN (SELECT date_trunc('week', "fileDate") - interval '1 day' AS week,
-                            COUNT(*)                                          AS record_count
-                        FROM evictions AS e
-                                LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
-                                LEFT JOIN cares AS c ON r."caresId" = c.id
-                        WHERE c.id = {id}
-                        AND r.type IN ('ADDRESS_MATCH', 'MANUAL_MATCH')
-                        {date_filter_subquery}
-                        GROUP BY 1) AS record_counts
-                    ON weeks.week = record_counts.week
-            LEFT JOIN (SELECT date_trunc('week', "fileDate") - interval '1 day' AS week,
-                            COUNT(*)                                          AS record_count
-                        FROM inexacts
-                        GROUP BY 1) AS record_counts_potential ON weeks.week = record_counts_potential.week
-    ORDER BY weeks.week;
-    """
-    property_eviction_count_by_week = pd.read_sql(query, db.connection())
-    if property_eviction_count_by_week.shape[0] > 0:
-        return property_eviction_count_by_week.to_dict(orient='records')
-    else:
-        return []
+
+def get_property_eviction_history(db: Session, id: int, dateFrom: datetime.date | None = None,
+                                  dateTo: datetime.date | None = None,
+                                  granularities: Iterable[str] = ('month', 'week')):
+    # Every granularity is resampled from a single fetch of the property's daily counts
+    daily_counts = get_property_daily_counts(db, id, dateFrom, dateTo)
+    return {granularity: resample_property_history(daily_counts, granularity, dateFrom, dateTo)
+            for granularity in granularities}
 
 
 # Number of days in filtered date range to trigger a year-long temporal aggregation
@@ -195,60 +179,31 @@ def get_property_eviction_count_by_dynamic_time_range(db: Session, id: int, date
     delta_days = (date_to - date_from).days
 
     if delta_days > YEAR_RANGE_THRESHOLD:
-        agg_query = f"""
-           SELECT
-                to_char(months.month, 'MM/YY') AS label,
-                COALESCE(record_count, 0) AS value 
-            FROM (
-                SELECT generate_series(
-                    '{date_from}'::date, 
-                    '{date_to}'::date, 
-                    '1 year'::interval
-                ) AS month
-            ) AS months
-            LEFT JOIN (
-                SELECT
-                    date_trunc('year', "fileDate") AS month,
-                    COUNT(*) AS record_count
-                FROM evictions AS e
-                LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
-                LEFT JOIN cares AS c ON r."caresId" = c.id
-                WHERE c.id = {id} AND
-                    r.type IN ('ADDRESS_MATCH', 'MANUAL_MATCH')
-                GROUP BY 1 
-            ) AS record_counts
-            ON months.month = record_counts.month
-            ORDER BY months.month ASC; 
-        """
+        granularity = 'year'
     elif delta_days > MONTH_RANGE_THRESHOLD:
-        # agg_query =
-        pass
+        granularity = 'month'
     else:
-        # agg_query =
-        pass
-    print(delta_days)
-    pass
+        granularity = 'week'
+
+    history = get_property_eviction_history(db, id, dateFrom, dateTo, [granularity])
+    return {
+        'granularity': granularity,
+        'history': history[granularity],
+    }
 
 
 def get_inexact_records_by_property(db: Session, id: int):
-    # inexact records (suggestions) should be within 160m
+    # inexact records (suggestions) are within PROXIMITY_RADIUS of the property, see cares_eviction_proximity
     query = f"""
-        WITH property AS (
-            SELECT id, location FROM cares WHERE cares.id = {id} 
-        )
-        SELECT "caseID", 
-            (SELECT id FROM property),
-            "defendantAddress1" AS address,
+        SELECT e."caseID", 
+            p."caresId" AS id,
+            e."defendantAddress1" AS address,
             2 AS verification
-        FROM evictions AS e
+        FROM cares_eviction_proximity AS p
+        INNER JOIN evictions AS e ON p."caseID" = e."caseID"
         LEFT JOIN "eviction-cares" AS r
         ON e."caseID" = r."evictionId"
-        WHERE ST_DWithin(
-            (SELECT location FROM property)::geography, 
-            e.location::geography, 
-            {PROXIMITY_RADIUS}, 
-            true
-        ) AND (
+        WHERE p."caresId" = {id} AND (
             r.type IS NULL OR 
             (r."caresId" != {id} AND r.type = 'MANUAL_REJECT')
         );
@@ -309,9 +264,7 @@ def get_address_permutations(db: Session, id: int):
 
 def get_cares_property_records(db: Session, id: int, dateFrom: datetime.date | None = None,
                                dateTo: datetime.date | None = None):
-    date_filter_subquery = ''
-    date_filter_subquery += f"""AND e."fileDate" >= '{dateFrom}'""" if dateFrom is not None else ''
-    date_filter_subquery += f"""AND e."fileDate" <= '{dateTo}'""" if dateTo is not None else ''
+    day_filter_subquery = construct_date_filter_subquery(dateFrom, dateTo, column='d.day')
     query = f"""
         SELECT c.id, 
             c.source, 
@@ -319,15 +272,13 @@ def get_cares_property_records(db: Session, id: int, dateFrom: datetime.date | N
             c.address, 
             c.city, 
             c."zipCode", 
-            COUNT(CASE WHEN 
-                r.type IN ('ADDRESS_MATCH', 'MANUAL_MATCH') 
-                {date_filter_subquery} 
-                THEN e."caseID" END) AS count
+            (
+                SELECT COALESCE(SUM(d.matched), 0)
+                FROM cares_daily_counts AS d
+                WHERE d."caresId" = c.id {day_filter_subquery}
+            ) AS count
         FROM cares AS c 
-        LEFT JOIN "eviction-cares" AS r ON c.id = r."caresId"
-        LEFT JOIN evictions AS e ON r."evictionId" = e."caseID"
-        WHERE c.id = {id} 
-        GROUP BY c.id;
+        WHERE c.id = {id};
     """
 
     cares_property = pd.read_sql(query, db.connection())
@@ -0,0 +1,162 @@
+import asyncio
+import datetime
+import json
+import logging
+import threading
+from typing import List, Iterable
+
+import numpy as np
+import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from .suggestion_events import subscribe_to_suggestion_changes, unsubscribe_from_suggestion_changes
+from ..db.db import SessionLocal
+
+logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CaresCountIndex:
+    # Matched eviction counts of every CARES property, stored as per-property prefix sums over days, so that the count
+    #   of any date range is the difference of two columns. Only properties with matched records get a row
+    def __init__(self, cares: pd.DataFrame, daily_counts: pd.DataFrame):
+        self.cares_ids = cares['id'].to_numpy(dtype=np.int64)
+        self.locations = cares[['lon', 'lat']].to_numpy(dtype=np.float64)
+        self.county_names = cares['countyName'].to_numpy(dtype=object)
+
+        days = pd.to_datetime(daily_counts['day']).dt.date
+        self.first_day = min(days.min(), datetime.date.today()) if len(days) > 0 else datetime.date.today()
+        self.last_day = max(days.max(), datetime.date.today()) if len(days) > 0 else datetime.date.today()
+        num_days = (self.last_day - self.first_day).days + 1
+
+        counted_cares_ids = np.unique(daily_counts['caresId'].to_numpy(dtype=np.int64))
+        counted_cares_ids = counted_cares_ids[np.isin(counted_cares_ids, self.cares_ids)]
+        # Row of each property's prefix sums, or -1 if it has no matched records
+        self.rows = np.full(self.cares_ids.shape[0], -1, dtype=np.int64)
+        self.rows[np.searchsorted(self.cares_ids, counted_cares_ids)] = np.arange(counted_cares_ids.shape[0])
+
+        self.prefix_sums = np.zeros((counted_cares_ids.shape[0], num_days + 1), dtype=np.int32)
+        self._fill(np.arange(counted_cares_ids.shape[0]), daily_counts)
+
+    def _day_offsets(self, days: pd.Series):
+        return (pd.to_datetime(days) - pd.Timestamp(self.first_day)).dt.days.to_numpy()
+
+    def _fill(self, rows: np.ndarray, daily_counts: pd.DataFrame):
+        # Rewrites the given rows from the daily counts of their properties
+        rows = np.sort(rows)
+        daily = np.zeros((rows.shape[0], self.prefix_sums.shape[1] - 1), dtype=np.int32)
+        if daily_counts.shape[0] > 0:
+            cares_ids = daily_counts['caresId'].to_numpy(dtype=np.int64)
+            known = np.isin(cares_ids, self.cares_ids)
+            local_rows = np.searchsorted(rows, self.rows[np.searchsorted(self.cares_ids, cares_ids[known])])
+            np.add.at(daily, (local_rows, self._day_offsets(daily_counts['day'][known])),
+                      daily_counts['matched'].to_numpy(dtype=np.int32)[known])
+        self.prefix_sums[rows, 1:] = np.cumsum(daily, axis=1)
+
+    def patch(self, cares_ids: Iterable[int], daily_counts: pd.DataFrame):
+        # Replaces the rows of the given properties. Returns False if the index has to be rebuilt instead, i.e. when a
+        #   property without a row gained matched records or records fall outside the indexed days
+        cares_ids = np.asarray(sorted(cares_ids), dtype=np.int64)
+        cares_ids = cares_ids[np.isin(cares_ids, self.cares_ids)]
+        rows = self.rows[np.searchsorted(self.cares_ids, cares_ids)]
+
+        if daily_counts.shape[0] > 0:
+            counted = np.isin(self.cares_ids, daily_counts['caresId'].to_numpy(dtype=np.int64))
+            days = pd.to_datetime(daily_counts['day']).dt.date
+            if np.any(counted & (self.rows == -1)) or days.min() < self.first_day or days.max() > self.last_day:
+                return False
+
+        self._fill(rows[rows != -1], daily_counts)
+        return True
+
+    def get_counts(self, counties: List[str], date_from: datetime.date | None = None,
+                   date_to: datetime.date | None = None, min_count: int = 0):
+        start = 0 if date_from is None else min(max((date_from - self.first_day).days, 0), self.prefix_sums.shape[1] - 1)
+        end = self.prefix_sums.shape[1] - 1 if date_to is None else \
+            min(max((date_to - self.first_day).days + 1, 0), self.prefix_sums.shape[1] - 1)
+        end = max(start, end)
+
+        counts = np.zeros(self.cares_ids.shape[0], dtype=np.int64)
+        counted = self.rows != -1
+        counts[counted] = self.prefix_sums[self.rows[counted], end] - self.prefix_sums[self.rows[counted], start]
+
+        mask = np.isin(self.county_names, counties) & (counts >= min_count)
+        # With a date range, only properties with matched records in it are returned
+        if date_from is not None or date_to is not None:
+            mask &= counts > 0
+
+        return self.cares_ids[mask], self.locations[mask], counts[mask]
+
+
+_cares_count_index: CaresCountIndex | None = None
+_cares_count_index_lock = threading.Lock()
+
+
+def _load_cares(db: Session):
+    query = """
+        SELECT id, ST_X(location::geometry) AS lon, ST_Y(location::geometry) AS lat, "countyName"
+        FROM cares
+        ORDER BY id
+    """
+    return pd.read_sql(query, db.connection())
+
+
+def _load_daily_counts(db: Session, cares_ids: List[int] | None = None):
+    cares_filter = 'AND "caresId" = ANY(%(cares_ids)s)' if cares_ids is not None else ''
+    query = f"""
+        SELECT "caresId", day, matched
+        FROM cares_daily_counts
+        WHERE matched > 0 {cares_filter}
+    """
+    return pd.read_sql(query, db.connection(), params={'cares_ids': cares_ids})
+
+
+def build_cares_count_index():
+    global _cares_count_index
+    with SessionLocal() as db:
+        cares_count_index = CaresCountIndex(_load_cares(db), _load_daily_counts(db))
+    with _cares_count_index_lock:
+        _cares_count_index = cares_count_index
+    logger.info(f"Built CARES count index of {cares_count_index.prefix_sums.shape} prefix sums")
+
+
+def _patch_cares_count_index(cares_ids: List[int]):
+    with SessionLocal() as db:
+        daily_counts = _load_daily_counts(db, cares_ids)
+    with _cares_count_index_lock:
+        patched = _cares_count_index is not None and _cares_count_index.patch(cares_ids, daily_counts)
+    if not patched:
+        build_cares_count_index()
+
+
+async def _maintain_cares_count_index(queue: asyncio.Queue):
+    try:
+        while True:
+            change = json.loads(await queue.get())
+            try:
+                # Changes without property ids may involve any property
+                if change['caresIds'] is None:
+                    await run_in_threadpool(build_cares_count_index)
+                elif len(change['caresIds']) > 0:
+                    await run_in_threadpool(_patch_cares_count_index, change['caresIds'])
+            except Exception as e:
+                logger.exception(f"Failed to update CARES count index: {e}")
+    finally:
+        unsubscribe_from_suggestion_changes(queue)
+
+
+def start_cares_count_index():
+    # Subscribed before building, so that changes landing during the build are applied afterwards
+    queue = subscribe_to_suggestion_changes()
+    build_cares_count_index()
+    return asyncio.create_task(_maintain_cares_count_index(queue))
+
+
+def get_indexed_cares_counts(counties: List[str], date_from: datetime.date | None = None,
+                             date_to: datetime.date | None = None, min_count: int = 0):
+    # None if the index is not available, in which case counts are queried from the database
+    with _cares_count_index_lock:
+        if _cares_count_index is None:
+            return None
+        return _cares_count_index.get_counts(counties, date_from, date_to, min_count)
@@ -0,0 +1,48 @@
+from typing import Iterable
+
+from sqlalchemy import text, Connection
+from sqlalchemy.orm import Session
+
+
+def _daily_counts_query(cares_filter: str = ''):
+    # matched counts address-matched and confirmed records per file date. potential counts records within the radius
+    #   that are undecided or rejected for another property, the same records the property popup suggests
+    return f"""
+        INSERT INTO cares_daily_counts ("caresId", day, matched, potential)
+        SELECT "caresId", day, SUM(matched), SUM(potential)
+        FROM (
+            SELECT r."caresId", e."fileDate" AS day, COUNT(*) AS matched, 0 AS potential
+            FROM "eviction-cares" AS r
+                     INNER JOIN evictions AS e ON r."evictionId" = e."caseID"
+            WHERE r.type IN ('ADDRESS_MATCH', 'MANUAL_MATCH')
+              AND e."fileDate" IS NOT NULL
+              {cares_filter.format(cares_id='r."caresId"')}
+            GROUP BY 1, 2
+            UNION ALL
+            SELECT p."caresId", e."fileDate" AS day, 0 AS matched, COUNT(*) AS potential
+            FROM cares_eviction_proximity AS p
+                     INNER JOIN evictions AS e ON p."caseID" = e."caseID"
+                     LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
+            WHERE (r.type IS NULL OR (r."caresId" != p."caresId" AND r.type = 'MANUAL_REJECT'))
+              AND e."fileDate" IS NOT NULL
+              {cares_filter.format(cares_id='p."caresId"')}
+            GROUP BY 1, 2
+        ) AS counts
+        GROUP BY 1, 2
+    """
+
+
+def rebuild_cares_daily_counts(connection: Connection):
+    connection.execute(text('TRUNCATE cares_daily_counts'))
+    connection.execute(text(_daily_counts_query()))
+
+
+def refresh_cares_daily_counts(db: Session, cares_ids: Iterable[int]):
+    # Recomputes the rollup of the given properties, which costs only as much as their own records
+    cares_ids = list(cares_ids)
+    if len(cares_ids) == 0:
+        return
+
+    params = {'cares_ids': cares_ids}
+    db.execute(text('DELETE FROM cares_daily_counts WHERE "caresId" = ANY(:cares_ids)'), params)
+    db.execute(text(_daily_counts_query('AND {cares_id} = ANY(:cares_ids)')), params)
@@ -1,1876 +1,263 @@
 import datetime
-from typing import List
+from typing import List, BinaryIO, Callable
 
-import asyncio
+import codecs
+import csv
 import logging
+import os
 from io import StringIO
 
-import aiohttp
 import numpy as np
 import pandas as pd
-import usaddress
-from sqlalchemy import insert, update, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import not_, exists
 
+from .address import standardize_eviction_addresses
 from .cares import construct_date_filter_subquery, populate_default_dates
-from ..db.models.Cares import Cares
+from .geocode import geocode_eviction_addresses
+from .proximity import write_proximity_pairs
+from .suggestion import track_suggestion_changes
 from ..db.models.Eviction import TempEviction
 from ..db.models.Relationship import TempRelationship
-from ..utils.consts import REQUIRED_COLS, MAX_BATCH_SIZE, GEOCODING_API_URL
+from ..utils.consts import REQUIRED_COLS, CSV_CHUNK_SIZE, \
+    CSV_SNIFF_SAMPLE_BYTES, CSV_CANDIDATE_DELIMITERS, CSV_CANDIDATE_ENCODINGS, PREVIEW_NUM_ROWS, \
+    FILEDATE_FORMATS, FILEDATE_SAMPLE_SIZE, EXCEL_SERIAL_DATE_FORMAT, EXCEL_SERIAL_DATE_MAX, MAX_REPORTED_INVALID_RECORDS
+from ..utils.db import copy_dataframe
 
 logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-usps_street_suffix_abbreviations = [
-    {
-        "primary_street_suffix_name": "ALLEY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ALLEE",
-            "ALLEY",
-            "ALLY",
-            "ALY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ALY"
-    },
-    {
-        "primary_street_suffix_name": "ANEX",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ANEX",
-            "ANNEX",
-            "ANNX",
-            "ANX"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ANX"
-    },
-    {
-        "primary_street_suffix_name": "ARCADE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ARC",
-            "ARCADE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ARC"
-    },
-    {
-        "primary_street_suffix_name": "AVENUE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "AV",
-            "AVE",
-            "AVEN",
-            "AVENU",
-            "AVENUE",
-            "AVN",
-            "AVNUE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "AVE"
-    },
-    {
-        "primary_street_suffix_name": "BAYOU",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BAYOO",
-            "BAYOU"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BYU"
-    },
-    {
-        "primary_street_suffix_name": "BEACH",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BCH",
-            "BEACH"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BCH"
-    },
-    {
-        "primary_street_suffix_name": "BEND",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BEND",
-            "BND"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BND"
-    },
-    {
-        "primary_street_suffix_name": "BLUFF",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BLF",
-            "BLUF",
-            "BLUFF"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BLF"
-    },
-    {
-        "primary_street_suffix_name": "BLUFFS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BLUFFS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BLFS"
-    },
-    {
-        "primary_street_suffix_name": "BOTTOM",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BOT",
-            "BTM",
-            "BOTTM",
-            "BOTTOM"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BTM"
-    },
-    {
-        "primary_street_suffix_name": "BOULEVARD",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BLVD",
-            "BOUL",
-            "BOULEVARD",
-            "BOULV"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BLVD"
-    },
-    {
-        "primary_street_suffix_name": "BRANCH",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BR",
-            "BRNCH",
-            "BRANCH"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BR"
-    },
-    {
-        "primary_street_suffix_name": "BRIDGE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BRDGE",
-            "BRG",
-            "BRIDGE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BRG"
-    },
-    {
-        "primary_street_suffix_name": "BROOK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BRK",
-            "BROOK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BRK"
-    },
-    {
-        "primary_street_suffix_name": "BROOKS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BROOKS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BRKS"
-    },
-    {
-        "primary_street_suffix_name": "BURG",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BURG"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BG"
-    },
-    {
-        "primary_street_suffix_name": "BURGS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BURGS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BGS"
-    },
-    {
-        "primary_street_suffix_name": "BYPASS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "BYP",
-            "BYPA",
-            "BYPAS",
-            "BYPASS",
-            "BYPS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "BYP"
-    },
-    {
-        "primary_street_suffix_name": "CAMP",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CAMP",
-            "CP",
-            "CMP"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CP"
-    },
-    {
-        "primary_street_suffix_name": "CANYON",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CANYN",
-            "CANYON",
-            "CNYN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CYN"
-    },
-    {
-        "primary_street_suffix_name": "CAPE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CAPE",
-            "CPE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CPE"
-    },
-    {
-        "primary_street_suffix_name": "CAUSEWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CAUSEWAY",
-            "CAUSWA",
-            "CSWY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CSWY"
-    },
-    {
-        "primary_street_suffix_name": "CENTER",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CEN",
-            "CENT",
-            "CENTER",
-            "CENTR",
-            "CENTRE",
-            "CNTER",
-            "CNTR",
-            "CTR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CTR"
-    },
-    {
-        "primary_street_suffix_name": "CENTERS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CENTERS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CTRS"
-    },
-    {
-        "primary_street_suffix_name": "CIRCLE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CIR",
-            "CIRC",
-            "CIRCL",
-            "CIRCLE",
-            "CRCL",
-            "CRCLE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CIR"
-    },
-    {
-        "primary_street_suffix_name": "CIRCLES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CIRCLES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CIRS"
-    },
-    {
-        "primary_street_suffix_name": "CLIFF",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CLF",
-            "CLIFF"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CLF"
-    },
-    {
-        "primary_street_suffix_name": "CLIFFS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CLFS",
-            "CLIFFS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CLFS"
-    },
-    {
-        "primary_street_suffix_name": "CLUB",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CLB",
-            "CLUB"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CLB"
-    },
-    {
-        "primary_street_suffix_name": "COMMON",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COMMON"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CMN"
-    },
-    {
-        "primary_street_suffix_name": "COMMONS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COMMONS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CMNS"
-    },
-    {
-        "primary_street_suffix_name": "CORNER",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COR",
-            "CORNER"
-        ],
-        "postal_service_standard_suffix_abbreviation": "COR"
-    },
-    {
-        "primary_street_suffix_name": "CORNERS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CORNERS",
-            "CORS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CORS"
-    },
-    {
-        "primary_street_suffix_name": "COURSE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COURSE",
-            "CRSE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CRSE"
-    },
-    {
-        "primary_street_suffix_name": "COURT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COURT",
-            "CT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CT"
-    },
-    {
-        "primary_street_suffix_name": "COURTS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COURTS",
-            "CTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CTS"
-    },
-    {
-        "primary_street_suffix_name": "COVE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COVE",
-            "CV"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CV"
-    },
-    {
-        "primary_street_suffix_name": "COVES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "COVES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CVS"
-    },
-    {
-        "primary_street_suffix_name": "CREEK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CREEK",
-            "CRK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CRK"
-    },
-    {
-        "primary_street_suffix_name": "CRESCENT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CRESCENT",
-            "CRES",
-            "CRSENT",
-            "CRSNT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CRES"
-    },
-    {
-        "primary_street_suffix_name": "CREST",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CREST"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CRST"
-    },
-    {
-        "primary_street_suffix_name": "CROSSING",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CROSSING",
-            "CRSSNG",
-            "XING"
-        ],
-        "postal_service_standard_suffix_abbreviation": "XING"
-    },
-    {
-        "primary_street_suffix_name": "CROSSROAD",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CROSSROAD"
-        ],
-        "postal_service_standard_suffix_abbreviation": "XRD"
-    },
-    {
-        "primary_street_suffix_name": "CROSSROADS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CROSSROADS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "XRDS"
-    },
-    {
-        "primary_street_suffix_name": "CURVE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "CURVE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "CURV"
-    },
-    {
-        "primary_street_suffix_name": "DALE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "DALE",
-            "DL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "DL"
-    },
-    {
-        "primary_street_suffix_name": "DAM",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "DAM",
-            "DM"
-        ],
-        "postal_service_standard_suffix_abbreviation": "DM"
-    },
-    {
-        "primary_street_suffix_name": "DIVIDE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "DIV",
-            "DIVIDE",
-            "DV",
-            "DVD"
-        ],
-        "postal_service_standard_suffix_abbreviation": "DV"
-    },
-    {
-        "primary_street_suffix_name": "DRIVE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "DR",
-            "DRIV",
-            "DRIVE",
-            "DRV"
-        ],
-        "postal_service_standard_suffix_abbreviation": "DR"
-    },
-    {
-        "primary_street_suffix_name": "DRIVES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "DRIVES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "DRS"
-    },
-    {
-        "primary_street_suffix_name": "ESTATE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "EST",
-            "ESTATE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "EST"
-    },
-    {
-        "primary_street_suffix_name": "ESTATES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ESTATES",
-            "ESTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ESTS"
-    },
-    {
-        "primary_street_suffix_name": "EXPRESSWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "EXP",
-            "EXPR",
-            "EXPRESS",
-            "EXPRESSWAY",
-            "EXPW",
-            "EXPY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "EXPY"
-    },
-    {
-        "primary_street_suffix_name": "EXTENSION",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "EXT",
-            "EXTENSION",
-            "EXTN",
-            "EXTNSN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "EXT"
-    },
-    {
-        "primary_street_suffix_name": "EXTENSIONS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "EXTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "EXTS"
-    },
-    {
-        "primary_street_suffix_name": "FALL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FALL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FALL"
-    },
-    {
-        "primary_street_suffix_name": "FALLS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FALLS",
-            "FLS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FLS"
-    },
-    {
-        "primary_street_suffix_name": "FERRY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FERRY",
-            "FRRY",
-            "FRY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRY"
-    },
-    {
-        "primary_street_suffix_name": "FIELD",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FIELD",
-            "FLD"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FLD"
-    },
-    {
-        "primary_street_suffix_name": "FIELDS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FIELDS",
-            "FLDS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FLDS"
-    },
-    {
-        "primary_street_suffix_name": "FLAT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FLAT",
-            "FLT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FLT"
-    },
-    {
-        "primary_street_suffix_name": "FLATS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FLATS",
-            "FLTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FLTS"
-    },
-    {
-        "primary_street_suffix_name": "FORD",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FORD",
-            "FRD"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRD"
-    },
-    {
-        "primary_street_suffix_name": "FORDS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FORDS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRDS"
-    },
-    {
-        "primary_street_suffix_name": "FOREST",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FOREST",
-            "FORESTS",
-            "FRST"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRST"
-    },
-    {
-        "primary_street_suffix_name": "FORGE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FORG",
-            "FORGE",
-            "FRG"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRG"
-    },
-    {
-        "primary_street_suffix_name": "FORGES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FORGES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRGS"
-    },
-    {
-        "primary_street_suffix_name": "FORK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FORK",
-            "FRK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRK"
-    },
-    {
-        "primary_street_suffix_name": "FORKS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FORKS",
-            "FRKS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FRKS"
-    },
-    {
-        "primary_street_suffix_name": "FORT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FORT",
-            "FRT",
-            "FT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FT"
-    },
-    {
-        "primary_street_suffix_name": "FREEWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "FREEWAY",
-            "FREEWY",
-            "FRWAY",
-            "FRWY",
-            "FWY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "FWY"
-    },
-    {
-        "primary_street_suffix_name": "GARDEN",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GARDEN",
-            "GARDN",
-            "GRDEN",
-            "GRDN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GDN"
-    },
-    {
-        "primary_street_suffix_name": "GARDENS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GARDENS",
-            "GDNS",
-            "GRDNS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GDNS"
-    },
-    {
-        "primary_street_suffix_name": "GATEWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GATEWAY",
-            "GATEWY",
-            "GATWAY",
-            "GTWAY",
-            "GTWY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GTWY"
-    },
-    {
-        "primary_street_suffix_name": "GLEN",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GLEN",
-            "GLN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GLN"
-    },
-    {
-        "primary_street_suffix_name": "GLENS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GLENS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GLNS"
-    },
-    {
-        "primary_street_suffix_name": "GREEN",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GREEN",
-            "GRN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GRN"
-    },
-    {
-        "primary_street_suffix_name": "GREENS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GREENS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GRNS"
-    },
-    {
-        "primary_street_suffix_name": "GROVE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GROV",
-            "GROVE",
-            "GRV"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GRV"
-    },
-    {
-        "primary_street_suffix_name": "GROVES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "GROVES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "GRVS"
-    },
-    {
-        "primary_street_suffix_name": "HARBOR",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HARB",
-            "HARBOR",
-            "HARBR",
-            "HBR",
-            "HRBOR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HBR"
-    },
-    {
-        "primary_street_suffix_name": "HARBORS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HARBORS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HBRS"
-    },
-    {
-        "primary_street_suffix_name": "HAVEN",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HAVEN",
-            "HVN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HVN"
-    },
-    {
-        "primary_street_suffix_name": "HEIGHTS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HT",
-            "HTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HTS"
-    },
-    {
-        "primary_street_suffix_name": "HIGHWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HIGHWAY",
-            "HIGHWY",
-            "HIWAY",
-            "HIWY",
-            "HWAY",
-            "HWY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HWY"
-    },
-    {
-        "primary_street_suffix_name": "HILL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HILL",
-            "HL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HL"
-    },
-    {
-        "primary_street_suffix_name": "HILLS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HILLS",
-            "HLS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HLS"
-    },
-    {
-        "primary_street_suffix_name": "HOLLOW",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "HLLW",
-            "HOLLOW",
-            "HOLLOWS",
-            "HOLW",
-            "HOLWS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "HOLW"
-    },
-    {
-        "primary_street_suffix_name": "INLET",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "INLT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "INLT"
-    },
-    {
-        "primary_street_suffix_name": "ISLAND",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "IS",
-            "ISLAND",
-            "ISLND"
-        ],
-        "postal_service_standard_suffix_abbreviation": "IS"
-    },
-    {
-        "primary_street_suffix_name": "ISLANDS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ISLANDS",
-            "ISLNDS",
-            "ISS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ISS"
-    },
-    {
-        "primary_street_suffix_name": "ISLE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ISLE",
-            "ISLES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ISLE"
-    },
-    {
-        "primary_street_suffix_name": "JUNCTION",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "JCT",
-            "JCTION",
-            "JCTN",
-            "JUNCTION",
-            "JUNCTN",
-            "JUNCTON"
-        ],
-        "postal_service_standard_suffix_abbreviation": "JCT"
-    },
-    {
-        "primary_street_suffix_name": "JUNCTIONS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "JCTNS",
-            "JCTS",
-            "JUNCTIONS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "JCTS"
-    },
-    {
-        "primary_street_suffix_name": "KEY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "KEY",
-            "KY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "KY"
-    },
-    {
-        "primary_street_suffix_name": "KEYS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "KEYS",
-            "KYS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "KYS"
-    },
-    {
-        "primary_street_suffix_name": "KNOLL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "KNL",
-            "KNOL",
-            "KNOLL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "KNL"
-    },
-    {
-        "primary_street_suffix_name": "KNOLLS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "KNLS",
-            "KNOLLS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "KNLS"
-    },
-    {
-        "primary_street_suffix_name": "LAKE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LK",
-            "LAKE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LK"
-    },
-    {
-        "primary_street_suffix_name": "LAKES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LKS",
-            "LAKES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LKS"
-    },
-    {
-        "primary_street_suffix_name": "LAND",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LAND"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LAND"
-    },
-    {
-        "primary_street_suffix_name": "LANDING",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LANDING",
-            "LNDG",
-            "LNDNG"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LNDG"
-    },
-    {
-        "primary_street_suffix_name": "LANE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LANE",
-            "LN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LN"
-    },
-    {
-        "primary_street_suffix_name": "LIGHT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LGT",
-            "LIGHT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LGT"
-    },
-    {
-        "primary_street_suffix_name": "LIGHTS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LIGHTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LGTS"
-    },
-    {
-        "primary_street_suffix_name": "LOAF",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LF",
-            "LOAF"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LF"
-    },
-    {
-        "primary_street_suffix_name": "LOCK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LCK",
-            "LOCK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LCK"
-    },
-    {
-        "primary_street_suffix_name": "LOCKS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LCKS",
-            "LOCKS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LCKS"
-    },
-    {
-        "primary_street_suffix_name": "LODGE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LDG",
-            "LDGE",
-            "LODG",
-            "LODGE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LDG"
-    },
-    {
-        "primary_street_suffix_name": "LOOP",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "LOOP",
-            "LOOPS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "LOOP"
-    },
-    {
-        "primary_street_suffix_name": "MALL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MALL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MALL"
-    },
-    {
-        "primary_street_suffix_name": "MANOR",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MNR",
-            "MANOR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MNR"
-    },
-    {
-        "primary_street_suffix_name": "MANORS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MANORS",
-            "MNRS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MNRS"
-    },
-    {
-        "primary_street_suffix_name": "MEADOW",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MEADOW"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MDW"
-    },
-    {
-        "primary_street_suffix_name": "MEADOWS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MDW",
-            "MDWS",
-            "MEADOWS",
-            "MEDOWS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MDWS"
-    },
-    {
-        "primary_street_suffix_name": "MEWS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MEWS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MEWS"
-    },
-    {
-        "primary_street_suffix_name": "MILL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MILL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ML"
-    },
-    {
-        "primary_street_suffix_name": "MILLS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MILLS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MLS"
-    },
-    {
-        "primary_street_suffix_name": "MISSION",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MISSN",
-            "MSSN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MSN"
-    },
-    {
-        "primary_street_suffix_name": "MOTORWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MOTORWAY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MTWY"
-    },
-    {
-        "primary_street_suffix_name": "MOUNT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MNT",
-            "MT",
-            "MOUNT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MT"
-    },
-    {
-        "primary_street_suffix_name": "MOUNTAIN",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MNTAIN",
-            "MNTN",
-            "MOUNTAIN",
-            "MOUNTIN",
-            "MTIN",
-            "MTN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MTN"
-    },
-    {
-        "primary_street_suffix_name": "MOUNTAINS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "MNTNS",
-            "MOUNTAINS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "MTNS"
-    },
-    {
-        "primary_street_suffix_name": "NECK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "NCK",
-            "NECK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "NCK"
-    },
-    {
-        "primary_street_suffix_name": "ORCHARD",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ORCH",
-            "ORCHARD",
-            "ORCHRD"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ORCH"
-    },
-    {
-        "primary_street_suffix_name": "OVAL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "OVAL",
-            "OVL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "OVAL"
-    },
-    {
-        "primary_street_suffix_name": "OVERPASS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "OVERPASS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "OPAS"
-    },
-    {
-        "primary_street_suffix_name": "PARK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PARK",
-            "PRK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PARK"
-    },
-    {
-        "primary_street_suffix_name": "PARKS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PARKS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PARK"
-    },
-    {
-        "primary_street_suffix_name": "PARKWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PARKWAY",
-            "PARKWY",
-            "PKWAY",
-            "PKWY",
-            "PKY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PKWY"
-    },
-    {
-        "primary_street_suffix_name": "PARKWAYS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PARKWAYS",
-            "PKWYS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PKWY"
-    },
-    {
-        "primary_street_suffix_name": "PASS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PASS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PASS"
-    },
-    {
-        "primary_street_suffix_name": "PASSAGE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PASSAGE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PSGE"
-    },
-    {
-        "primary_street_suffix_name": "PATH",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PATH",
-            "PATHS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PATH"
-    },
-    {
-        "primary_street_suffix_name": "PIKE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PIKE",
-            "PIKES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PIKE"
-    },
-    {
-        "primary_street_suffix_name": "PINE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PINE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PNE"
-    },
-    {
-        "primary_street_suffix_name": "PINES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PINES",
-            "PNES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PNES"
-    },
-    {
-        "primary_street_suffix_name": "PLACE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PL"
-    },
-    {
-        "primary_street_suffix_name": "PLAIN",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PLAIN",
-            "PLN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PLN"
-    },
-    {
-        "primary_street_suffix_name": "PLAINS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PLAINS",
-            "PLNS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PLNS"
-    },
-    {
-        "primary_street_suffix_name": "PLAZA",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PLAZA",
-            "PLZ",
-            "PLZA"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PLZ"
-    },
-    {
-        "primary_street_suffix_name": "POINT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "POINT",
-            "PT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PT"
-    },
-    {
-        "primary_street_suffix_name": "POINTS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "POINTS",
-            "PTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PTS"
-    },
-    {
-        "primary_street_suffix_name": "PORT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PORT",
-            "PRT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PRT"
-    },
-    {
-        "primary_street_suffix_name": "PORTS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PORTS",
-            "PRTS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PRTS"
-    },
-    {
-        "primary_street_suffix_name": "PRAIRIE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "PR",
-            "PRAIRIE",
-            "PRR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "PR"
-    },
-    {
-        "primary_street_suffix_name": "RADIAL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RAD",
-            "RADIAL",
-            "RADIEL",
-            "RADL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RADL"
-    },
-    {
-        "primary_street_suffix_name": "RAMP",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RAMP"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RAMP"
-    },
-    {
-        "primary_street_suffix_name": "RANCH",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RANCH",
-            "RANCHES",
-            "RNCH",
-            "RNCHS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RNCH"
-    },
-    {
-        "primary_street_suffix_name": "RAPID",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RAPID",
-            "RPD"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RPD"
-    },
-    {
-        "primary_street_suffix_name": "RAPIDS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RAPIDS",
-            "RPDS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RPDS"
-    },
-    {
-        "primary_street_suffix_name": "REST",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "REST",
-            "RST"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RST"
-    },
-    {
-        "primary_street_suffix_name": "RIDGE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RDG",
-            "RDGE",
-            "RIDGE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RDG"
-    },
-    {
-        "primary_street_suffix_name": "RIDGES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RDGS",
-            "RIDGES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RDGS"
-    },
-    {
-        "primary_street_suffix_name": "RIVER",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RIV",
-            "RIVER",
-            "RVR",
-            "RIVR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RIV"
-    },
-    {
-        "primary_street_suffix_name": "ROAD",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RD",
-            "ROAD"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RD"
-    },
-    {
-        "primary_street_suffix_name": "ROADS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ROADS",
-            "RDS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RDS"
-    },
-    {
-        "primary_street_suffix_name": "ROUTE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ROUTE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RTE"
-    },
-    {
-        "primary_street_suffix_name": "ROW",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "ROW"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ROW"
-    },
-    {
-        "primary_street_suffix_name": "RUE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RUE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RUE"
-    },
-    {
-        "primary_street_suffix_name": "RUN",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "RUN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "RUN"
-    },
-    {
-        "primary_street_suffix_name": "SHOAL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SHL",
-            "SHOAL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SHL"
-    },
-    {
-        "primary_street_suffix_name": "SHOALS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SHLS",
-            "SHOALS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SHLS"
-    },
-    {
-        "primary_street_suffix_name": "SHORE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SHOAR",
-            "SHORE",
-            "SHR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SHR"
-    },
-    {
-        "primary_street_suffix_name": "SHORES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SHOARS",
-            "SHORES",
-            "SHRS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SHRS"
-    },
-    {
-        "primary_street_suffix_name": "SKYWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SKYWAY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SKWY"
-    },
-    {
-        "primary_street_suffix_name": "SPRING",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SPG",
-            "SPNG",
-            "SPRING",
-            "SPRNG"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SPG"
-    },
-    {
-        "primary_street_suffix_name": "SPRINGS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SPGS",
-            "SPNGS",
-            "SPRINGS",
-            "SPRNGS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SPGS"
-    },
-    {
-        "primary_street_suffix_name": "SPUR",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SPUR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SPUR"
-    },
-    {
-        "primary_street_suffix_name": "SPURS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SPURS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SPUR"
-    },
-    {
-        "primary_street_suffix_name": "SQUARE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SQ",
-            "SQR",
-            "SQRE",
-            "SQU",
-            "SQUARE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SQ"
-    },
-    {
-        "primary_street_suffix_name": "SQUARES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SQRS",
-            "SQUARES"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SQS"
-    },
-    {
-        "primary_street_suffix_name": "STATION",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "STA",
-            "STATION",
-            "STATN",
-            "STN"
-        ],
-        "postal_service_standard_suffix_abbreviation": "STA"
-    },
-    {
-        "primary_street_suffix_name": "STRAVENUE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "STRA",
-            "STRAV",
-            "STRAVEN",
-            "STRAVENUE",
-            "STRAVN",
-            "STRVN",
-            "STRVNUE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "STRA"
-    },
-    {
-        "primary_street_suffix_name": "STREAM",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "STREAM",
-            "STREME",
-            "STRM"
-        ],
-        "postal_service_standard_suffix_abbreviation": "STRM"
-    },
-    {
-        "primary_street_suffix_name": "STREET",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "STREET",
-            "STRT",
-            "ST",
-            "STR"
-        ],
-        "postal_service_standard_suffix_abbreviation": "ST"
-    },
-    {
-        "primary_street_suffix_name": "STREETS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "STREETS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "STS"
-    },
-    {
-        "primary_street_suffix_name": "SUMMIT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "SMT",
-            "SUMIT",
-            "SUMITT",
-            "SUMMIT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "SMT"
-    },
-    {
-        "primary_street_suffix_name": "TERRACE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TER",
-            "TERR",
-            "TERRACE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TER"
-    },
-    {
-        "primary_street_suffix_name": "THROUGHWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "THROUGHWAY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TRWY"
-    },
-    {
-        "primary_street_suffix_name": "TRACE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TRACE",
-            "TRACES",
-            "TRCE"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TRCE"
-    },
-    {
-        "primary_street_suffix_name": "TRACK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TRACK",
-            "TRACKS",
-            "TRAK",
-            "TRK",
-            "TRKS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TRAK"
-    },
-    {
-        "primary_street_suffix_name": "TRAFFICWAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TRAFFICWAY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TRFY"
-    },
-    {
-        "primary_street_suffix_name": "TRAIL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TRAIL",
-            "TRAILS",
-            "TRL",
-            "TRLS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TRL"
-    },
-    {
-        "primary_street_suffix_name": "TRAILER",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TRAILER",
-            "TRLR",
-            "TRLRS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TRLR"
-    },
-    {
-        "primary_street_suffix_name": "TUNNEL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TUNEL",
-            "TUNL",
-            "TUNLS",
-            "TUNNEL",
-            "TUNNELS",
-            "TUNNL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TUNL"
-    },
-    {
-        "primary_street_suffix_name": "TURNPIKE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "TRNPK",
-            "TURNPIKE",
-            "TURNPK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "TPKE"
-    },
-    {
-        "primary_street_suffix_name": "UNDERPASS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "UNDERPASS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "UPAS"
-    },
-    {
-        "primary_street_suffix_name": "UNION",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "UN",
-            "UNION"
-        ],
-        "postal_service_standard_suffix_abbreviation": "UN"
-    },
-    {
-        "primary_street_suffix_name": "UNIONS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "UNIONS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "UNS"
-    },
-    {
-        "primary_street_suffix_name": "VALLEY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VALLEY",
-            "VALLY",
-            "VLLY",
-            "VLY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VLY"
-    },
-    {
-        "primary_street_suffix_name": "VALLEYS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VALLEYS",
-            "VLYS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VLYS"
-    },
-    {
-        "primary_street_suffix_name": "VIADUCT",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VDCT",
-            "VIA",
-            "VIADCT",
-            "VIADUCT"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VIA"
-    },
-    {
-        "primary_street_suffix_name": "VIEW",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VIEW",
-            "VW"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VW"
-    },
-    {
-        "primary_street_suffix_name": "VIEWS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VIEWS",
-            "VWS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VWS"
-    },
-    {
-        "primary_street_suffix_name": "VILLAGE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VILL",
-            "VILLAG",
-            "VILLAGE",
-            "VILLG",
-            "VILLIAGE",
-            "VLG"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VLG"
-    },
-    {
-        "primary_street_suffix_name": "VILLAGES",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VILLAGES",
-            "VLGS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VLGS"
-    },
-    {
-        "primary_street_suffix_name": "VILLE",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VILLE",
-            "VL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VL"
-    },
-    {
-        "primary_street_suffix_name": "VISTA",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "VIS",
-            "VIST",
-            "VISTA",
-            "VST",
-            "VSTA"
-        ],
-        "postal_service_standard_suffix_abbreviation": "VIS"
-    },
-    {
-        "primary_street_suffix_name": "WALK",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "WALK"
-        ],
-        "postal_service_standard_suffix_abbreviation": "WALK"
-    },
-    {
-        "primary_street_suffix_name": "WALKS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "WALKS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "WALK"
-    },
-    {
-        "primary_street_suffix_name": "WALL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "WALL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "WALL"
-    },
-    {
-        "primary_street_suffix_name": "WAY",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "WY",
-            "WAY"
-        ],
-        "postal_service_standard_suffix_abbreviation": "WAY"
-    },
-    {
-        "primary_street_suffix_name": "WAYS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "WAYS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "WAYS"
-    },
-    {
-        "primary_street_suffix_name": "WELL",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "WELL"
-        ],
-        "postal_service_standard_suffix_abbreviation": "WL"
-    },
-    {
-        "primary_street_suffix_name": "WELLS",
-        "commonly_used_street_suffix_or_abbreviation": [
-            "WELLS",
-            "WLS"
-        ],
-        "postal_service_standard_suffix_abbreviation": "WLS"
-    }
-]
-
-type_mapping = {}
-for suffix in usps_street_suffix_abbreviations:
-    for perm in suffix['commonly_used_street_suffix_or_abbreviation']:
-        type_mapping[perm.lower()] = suffix['postal_service_standard_suffix_abbreviation'].lower()
-
-directional_mapping = {
-    "north": "n",
-    "n": "n",
-    "east": "e",
-    "e": "e",
-    "south": "s",
-    "s": "s",
-    "west": "w",
-    "w": "w",
-    "northeast": "ne",
-    "ne": "ne",
-    "southeast": "se",
-    "se": "se",
-    "southwest": "sw",
-    "sw": "sw",
-    "northwest": "nw",
-    "nw": "nw",
-}
-
-# Intentionally omits secondary addresses, occupancy information, etc.
-relevant_tags = set(
-    ['AddressNumber', 'AddressNumberPrefix', 'AddressNumberSuffix', 'StreetName', 'StreetNamePreDirectional',
-     'StreetNamePreModifier', 'StreetNamePreType', 'StreetNamePostDirectional', 'StreetNamePostModifier',
-     'StreetNamePostType'])
-
-directional_tags = set(['StreetNamePreDirectional', 'StreetNamePostDirectional'])
-type_tags = set(['StreetNamePreType', 'StreetNamePostType'])
-
-
-def _standardize_address(address: str):
-    parsed = usaddress.parse(address)
-    standardized_address = []
-
-    for address_part in parsed:
-        part_string = address_part[0]
-        part_tag = address_part[1]
-        standardized_part = part_string.lower()
-        if not part_tag in relevant_tags:
-            continue
 
-        if part_tag in directional_tags:
-            # Strips non-alphabet characters and makes lowercase
-            stripped_directional_part_tag = "".join(filter(str.isalpha, part_string)).lower()
-            if stripped_directional_part_tag in directional_mapping:
-                standardized_part = directional_mapping[stripped_directional_part_tag]
-            else:
-                standardized_part = stripped_directional_part_tag
-        elif part_tag in type_tags:
-            stripped_type_part_tag = "".join(filter(str.isalpha, part_string)).lower()
-            if stripped_type_part_tag in type_mapping:
-                standardized_part = type_mapping[stripped_type_part_tag]
-            else:
-                standardized_part = stripped_type_part_tag
-
-        standardized_address.append(standardized_part)
-
-    if standardized_address == "":
-        return address
-    else:
-        return ' '.join(standardized_address)
-
-
-def _evictions_address_concat_standardize(address, city):
-    if pd.isna(address):
-        address = ''
-    if pd.isna(city):
-        city = ''
-    full_address = ' '.join([address, city])
-    try:
-        return _standardize_address(full_address)
-    except:
-        return address.lower()
+def _parse_dates(values: pd.Series, date_format: str):
+    if date_format == EXCEL_SERIAL_DATE_FORMAT:
+        serials = pd.to_numeric(values, errors='coerce')
+        in_range = (serials >= 1) & (serials < EXCEL_SERIAL_DATE_MAX)
+        parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+        parsed[in_range] = pd.to_datetime(serials[in_range], unit='D', origin='1899-12-30')
+        return parsed
+    return pd.to_datetime(values, format=date_format, errors='coerce')
+
+
+def _detect_filedate_format(values: pd.Series):
+    sample = values.dropna().head(FILEDATE_SAMPLE_SIZE)
+    if sample.shape[0] == 0:
+        return FILEDATE_FORMATS[0]
+
+    # The format parsing the most sampled values wins, with ties going to the earlier format
+    success_counts = [_parse_dates(sample, date_format).notna().sum() for date_format in FILEDATE_FORMATS]
+    return FILEDATE_FORMATS[int(np.argmax(success_counts))]
+
+
+def _get_fallback_filedate_formats(date_format: str):
+    # Compatible formats list the same fields in the same order, with another separator or year width. Formats without
+    #   separators are never fallbacks, since they would silently accept numeric junk (e.g. '12345' in an M/D/YY column
+    #   as an Excel serial number), so those are only read when detected for the column
+    def field_order(candidate_format: str):
+        return ''.join(char.lower() for char in candidate_format if char.isalpha())
+
+    return [candidate_format for candidate_format in FILEDATE_FORMATS
+            if candidate_format != date_format and any(separator in candidate_format for separator in '/-')
+            and field_order(candidate_format) == field_order(date_format)]
+
 
+def normalize_file_dates(file_dates: pd.Series):
+    # Filings share a small number of distinct dates, so each distinct value is parsed once and mapped back to the rows
+    codes, unique_file_dates = pd.factorize(file_dates)
+    unique_file_dates = pd.Series(unique_file_dates, dtype=object).str.strip()
 
-def _convert_filedate(fileDate):
-    parts = fileDate.split('/')
-    month, day, year = parts
-    padded_year = year if len(year) == 4 else f"20{year}"
-    padded_month = month if len(month) == 2 else f"0{month}"
-    padded_day = day if len(day) == 2 else f"0{day}"
-    return f"{padded_year}-{padded_month}-{padded_day}"
+    date_format = _detect_filedate_format(unique_file_dates)
+    parsed_unique_file_dates = _parse_dates(unique_file_dates, date_format)
 
+    # Values the detected format cannot read (e.g. a 4-digit year among 2-digit ones) fall back to compatible formats
+    for fallback_format in _get_fallback_filedate_formats(date_format):
+        unparsed = parsed_unique_file_dates.isna()
+        if not unparsed.any():
+            break
+        parsed_unique_file_dates[unparsed] = _parse_dates(unique_file_dates[unparsed], fallback_format)
 
-def transform_eviction_data(df: pd.DataFrame, col_mapper: dict):
-    copied = df.copy()
-    renamed_df = copied.rename(mapper=col_mapper)
+    formatted_unique_file_dates = parsed_unique_file_dates.dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+
+    # Missing values are factorized as -1, so they are mapped to NaN along with values that failed to parse
+    normalized = np.append(formatted_unique_file_dates, np.nan)[codes]
+    normalized_file_dates = pd.Series(normalized, index=file_dates.index, dtype=object)
+
+    return normalized_file_dates, normalized_file_dates.isna()
+
+
+def transform_eviction_data(df: pd.DataFrame, col_mapper: dict, db: Session | None = None):
+    renamed_df = df.rename(columns=col_mapper)
     col_reduced_df = renamed_df[REQUIRED_COLS]
 
     col_reduced_dropped_df = col_reduced_df.dropna(subset=['caseID', 'defendantAddress1'], how='any')
 
     deduplicated_df = col_reduced_dropped_df.drop_duplicates(subset=['caseID'], keep='last')
 
-    deduplicated_df_copy = deduplicated_df.copy()
+    # Records without a readable fileDate are set aside and reported instead of failing the whole upload
+    normalized_file_dates, invalid_file_dates = normalize_file_dates(deduplicated_df['fileDate'])
+    invalid_records = deduplicated_df.loc[invalid_file_dates, ['caseID', 'fileDate']]
+    valid_df = deduplicated_df[~invalid_file_dates]
+
+    if invalid_records.shape[0] > 0:
+        logger.warning(f"Number of records with an invalid fileDate: {invalid_records.shape[0]}")
 
-    deduplicated_df_copy['standardizedAddress'] = deduplicated_df.apply(
-        lambda row: _evictions_address_concat_standardize(row['defendantAddress1'], row['defendantCity1']), axis=1)
-    deduplicated_df_copy['fileDate'] = deduplicated_df.apply(lambda row: _convert_filedate(row['fileDate']), axis=1)
+    valid_df_copy = valid_df.copy()
 
-    real_valued_df = deduplicated_df_copy.where(pd.notnull(deduplicated_df_copy), None)
+    valid_df_copy['standardizedAddress'] = standardize_eviction_addresses(valid_df, db)
+    valid_df_copy['fileDate'] = normalized_file_dates[~invalid_file_dates]
+
+    real_valued_df = valid_df_copy.where(pd.notnull(valid_df_copy), None)
 
     logging.info(f"Number of records (deduplicated): {real_valued_df.shape[0]}")
 
-    return real_valued_df
+    return real_valued_df, invalid_records
+
+
+def _detect_encoding(sample: bytes):
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in CSV_CANDIDATE_ENCODINGS:
+        try:
+            sample.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'latin-1'
+
+
+def sniff_csv_format(file: BinaryIO):
+    file.seek(0)
+    sample = file.read(CSV_SNIFF_SAMPLE_BYTES)
+    file.seek(0)
+
+    # Only complete lines are sniffed, so a multibyte character or a row cut off at the end of the sample is ignored
+    reached_eof = len(sample) < CSV_SNIFF_SAMPLE_BYTES
+    complete_sample = sample if reached_eof else sample[:sample.rfind(b'\n') + 1]
+
+    encoding = _detect_encoding(complete_sample)
+    decoded_sample = complete_sample.decode(encoding)
+
+    try:
+        delimiter = csv.Sniffer().sniff(decoded_sample, delimiters=CSV_CANDIDATE_DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = ','
+
+    return delimiter, encoding, complete_sample
+
+
+def _estimate_row_count(file: BinaryIO, sample: bytes):
+    file.seek(0, os.SEEK_END)
+    file_size = file.tell()
+    file.seek(0)
+
+    sample_lines = sample.splitlines()
+    if len(sample_lines) <= 1:
+        return 0
+    if len(sample) >= file_size:
+        return len(sample_lines) - 1
+
+    # Extrapolates from the average size of the data rows (excluding the header) in the sampled bytes
+    header_size = len(sample_lines[0]) + 1
+    avg_row_size = (len(sample) - header_size) / (len(sample_lines) - 1)
+    return int((file_size - header_size) / avg_row_size)
+
+
+def estimate_upload_row_count(file: BinaryIO):
+    _, _, sample = sniff_csv_format(file)
+    return _estimate_row_count(file, sample)
+
+
+def get_upload_preview(file: BinaryIO, num_rows: int = PREVIEW_NUM_ROWS):
+    delimiter, encoding, sample = sniff_csv_format(file)
+
+    # Only the first rows are parsed, so preview latency does not depend on the size of the upload
+    head = pd.read_csv(file, sep=delimiter, encoding=encoding, nrows=num_rows, dtype=str)
+    head.fillna("", inplace=True)
+
+    return {
+        'columns': head.to_dict(orient='list'),
+        'delimiter': delimiter,
+        'encoding': encoding,
+        'estimatedRowCount': _estimate_row_count(file, sample),
+    }
+
+
+def _create_temp_tables(db: Session):
+    TempEviction.__table__.create(db.connection(), checkfirst=True)
+    TempRelationship.__table__.create(db.connection(), checkfirst=True)
+
+    # Unconstrained copy of new-evictions that each upload chunk is COPY'd into before being merged
+    chunk_query = """
+        CREATE TEMPORARY TABLE IF NOT EXISTS "new-evictions-chunk" (LIKE "new-evictions") ON COMMIT DROP
+    """
+    db.execute(text(chunk_query))
+
+    # Geocoder results of each address are COPY'd here and applied to new-evictions in a single UPDATE. Empty values
+    #   are COPY'd as NULL, so addresses are joined on their COALESCE'd values
+    geocodes_query = """
+        CREATE TEMPORARY TABLE IF NOT EXISTS "new-eviction-geocodes" (
+            "standardizedAddress" TEXT,
+            "defendantCity1" TEXT,
+            lon DOUBLE PRECISION NOT NULL,
+            lat DOUBLE PRECISION NOT NULL
+        ) ON COMMIT DROP
+    """
+    db.execute(text(geocodes_query))
+
+
+def _stage_eviction_records(db: Session, df: pd.DataFrame, buffer: StringIO | None = None):
+    if df.shape[0] == 0:
+        return
+
+    db.execute(text('TRUNCATE "new-evictions-chunk"'))
+    copy_dataframe(db, 'new-evictions-chunk', df, buffer)
+
+    # Records are staged chunk by chunk, so a caseID repeated in a later chunk replaces the earlier one (matching the
+    #   keep='last' deduplication done within a single chunk)
+    columns = ', '.join([f'"{col}"' for col in df.columns])
+    updates = ', '.join([f'"{col}" = EXCLUDED."{col}"' for col in df.columns if col != 'caseID'])
+    merge_query = f"""
+        INSERT INTO "new-evictions" ({columns})
+        SELECT {columns} FROM "new-evictions-chunk"
+        ON CONFLICT ("caseID") DO UPDATE SET {updates}
+    """
+    db.execute(text(merge_query))
+
+
+def stage_eviction_file(db: Session, file: BinaryIO, col_mapper: dict, report_progress: Callable | None = None):
+    _create_temp_tables(db)
+
+    delimiter, encoding, _ = sniff_csv_format(file)
+
+    # Only the mapped columns are parsed, and every column is read as a string so that type inference stays consistent
+    #   across chunks
+    reader = pd.read_csv(file, sep=delimiter, encoding=encoding, usecols=list(col_mapper.keys()), dtype=str,
+                         chunksize=CSV_CHUNK_SIZE)
+
+    num_records = 0
+    # Only the reported invalid records are kept, so that memory does not grow with the number of rejected rows
+    num_invalid_records = 0
+    reported_invalid_records = []
+    copy_buffer = StringIO()
+    for chunk in reader:
+        transformed_chunk, invalid_chunk_records = transform_eviction_data(chunk, col_mapper, db)
+        _stage_eviction_records(db, transformed_chunk, copy_buffer)
+        num_records += chunk.shape[0]
+        if num_invalid_records < MAX_REPORTED_INVALID_RECORDS:
+            reported_invalid_records.append(
+                invalid_chunk_records.head(MAX_REPORTED_INVALID_RECORDS - num_invalid_records))
+        num_invalid_records += invalid_chunk_records.shape[0]
+        logger.info(f"Number of records staged so far (pre-deduplication): {num_records}")
+        if report_progress is not None:
+            report_progress('staging', num_records)
+
+    invalid_records_df = pd.concat(reported_invalid_records) if len(reported_invalid_records) > 0 else pd.DataFrame()
+    invalid_records_df = invalid_records_df.where(pd.notnull(invalid_records_df), None)
+
+    return {
+        'numRecords': num_records,
+        'numInvalidRecords': num_invalid_records,
+        'invalidRecords': invalid_records_df.to_dict(orient='records'),
+    }
 
 
 def _get_exact_address_matches(db: Session):
@@ -1894,128 +281,125 @@ def _get_exact_address_matches(db: Session):
     """
     db.execute(text(relationship_query))
 
-    select_query = """
-        SELECT * 
-        FROM "new-evictions" AS e 
-        INNER JOIN "new-eviction-cares" AS r 
-        ON e."caseID" = r."evictionId"
-        WHERE r.type = 'ADDRESS_MATCH';
+    # Only the number of matches is reported, so the matched records are counted rather than loaded
+    count_query = """
+        SELECT COUNT(*)
+        FROM "new-eviction-cares"
+        WHERE type = 'ADDRESS_MATCH';
     """
-    exact_matches = pd.read_sql(select_query, db.connection())
-
-    logging.info(f"Number of exact address match records: {exact_matches.shape[0]}")
-
-    return exact_matches
-
-
-def _parse_city_zip(row):
-    original_city = row['defendantCity1']
-    tagged = usaddress.tag(original_city)[0]
-
-    # city = tagged.get('PlaceName', np.nan)
-    zip_code = tagged.get('ZipCode', np.nan)
-
-    row['city'] = np.nan
-    row['state'] = 'GA'
-    row['zip'] = zip_code
-
-    return row
-
-
-def _transform_loc_str_to_geography(row):
-    location_str = row['location']
-    lon, lat = location_str.split(',')
-    return f"POINT({lon} {lat})"
-
+    num_exact_matches = db.execute(text(count_query)).scalar_one()
 
-async def _perform_geocode_request(segment: pd.DataFrame, session):
-    raw_file_content = bytes(segment.to_csv(lineterminator='\r\n', index=False, header=False), encoding='utf-8')
+    logging.info(f"Number of exact address match records: {num_exact_matches}")
 
-    data = aiohttp.FormData()
-    data.add_field('addressFile',
-                   raw_file_content,
-                   filename='input.csv',
-                   content_type='text/csv')
-    data.add_field('benchmark', '4')  # https://geocoding.geo.census.gov/geocoder/benchmarks, current
+    return num_exact_matches
 
-    async with session.post(url=GEOCODING_API_URL, data=data) as response:
-        raw_resp = await response.text()
-        output_df = pd.read_csv(StringIO(raw_resp),
-                                names=['caseID', 'address', 'match', '_', 'inputAddress', 'location', 'tigerId',
-                                       'tigerIdSide'],
-                                usecols=['caseID', 'match', 'location'])
-        return output_df
 
+def _apply_geocoded_locations(db: Session, geocoded_addresses: pd.DataFrame):
+    if geocoded_addresses.shape[0] == 0:
+        return 0
 
-async def _geocode_unmatched_eviction_data(unmatched_df: pd.DataFrame):
-    unmatched_df.reset_index(drop=True, inplace=True)
-    batch_geocode_input_df = unmatched_df[['caseID', 'standardizedAddress', 'defendantCity1']]
-    batch_geocode_input_df = batch_geocode_input_df.apply(_parse_city_zip, axis=1)[
-        ['caseID', 'standardizedAddress', 'city', 'state', 'zip']]
+    db.execute(text('TRUNCATE "new-eviction-geocodes"'))
+    copy_dataframe(db, 'new-eviction-geocodes',
+                   geocoded_addresses[['standardizedAddress', 'defendantCity1', 'lon', 'lat']])
 
-    segments = batch_geocode_input_df.groupby(batch_geocode_input_df.index // MAX_BATCH_SIZE)
-
-    async with aiohttp.ClientSession() as session:
-        batch_geocode_outputs = await asyncio.gather(
-            *(_perform_geocode_request(segment, session) for _, segment in segments))
-        batch_geocode_output_df = pd.concat(batch_geocode_outputs)
-
-    successful_records = batch_geocode_output_df[batch_geocode_output_df['match'] == 'Match']  # Match, No_Match, Tie
-
-    logger.info(f"Number of successfully geocoded records: {successful_records.shape[0]}")
-
-    successful_records_copy = successful_records.copy()
-    successful_records_copy['location'] = successful_records.apply(_transform_loc_str_to_geography, axis=1)
-
-    return successful_records_copy[['caseID', 'location']]
+    update_query = """
+        UPDATE "new-evictions" AS e
+        SET location = ST_SetSRID(ST_MakePoint(g.lon, g.lat), 4326)::geography
+        FROM "new-eviction-geocodes" AS g
+        WHERE COALESCE(e."standardizedAddress", '') = COALESCE(g."standardizedAddress", '')
+          AND COALESCE(e."defendantCity1", '') = COALESCE(g."defendantCity1", '')
+    """
+    return db.execute(text(update_query)).rowcount
+
+
+def closest_cares_query(table_name: str):
+    # Nearest CARES property of every located record that has not been assigned one yet, found with the KNN operator so
+    #   that the GiST index on cares.location is used
+    return f"""
+        UPDATE "{table_name}" AS e
+        SET ("closestCaresId", "closestCaresDistance") = (
+            SELECT c.id, e.location <-> c.location
+            FROM cares AS c
+            WHERE c.location IS NOT NULL
+            ORDER BY e.location <-> c.location
+            LIMIT 1
+        )
+        WHERE e.location IS NOT NULL AND e."closestCaresId" IS NULL
+    """
 
 
 async def _get_proximity_matches(db: Session):
-    query = db.query(TempEviction).filter(
-        not_(exists().where(TempEviction.__table__.c.standardizedAddress == Cares.standardizedAddress)))
-    unmatched_df = pd.read_sql(query.statement, db.connection())
-
-    logger.info(f"Number of total inexact address records: {unmatched_df.shape[0]}")
-
-    successfully_geocoded_evictions = await _geocode_unmatched_eviction_data(unmatched_df)
-
-    db.execute(update(TempEviction), successfully_geocoded_evictions.to_dict('records'))
-
-    # update_query = f"""
-    #   UPDATE "new-evictions"
-    #   SET "closestCaresDistance" = (
-    #       SELECT "new-evictions".location <-> cares.location AS dist
-    #       FROM cares
-    #       LEFT JOIN "new-eviction-cares" AS r
-    #       ON "new-evictions"."caseID" = r."evictionId"
-    #       WHERE location IS NOT NULL AND
-    #            r."caresId" IS NULL
-    #       ORDER BY "new-evictions".location <-> cares.location
-    #       LIMIT 1
-    #   )
-    #   FROM "new-evictions" AS e LEFT JOIN "new-eviction-cares" AS r ON e."caseID" = r."evictionId"
-    #   WHERE e.location IS NOT NULL AND r."caresId" IS NOT 'ADDRESS_MATCH'
-    #   """
-    #
-    # db.execute(text(update_query))
-    #
-    # closest_cares_query = f"""
-    #   SELECT * FROM "new-evictions" AS e
-    #   WHERE e."caresId" IS NULL AND
-    #         e."closestCaresDistance" < {PROXIMITY_RADIUS}
-    #   """
+    # Only the distinct addresses of the records without an exact match are loaded, so memory use follows the number of
+    #   addresses rather than the size of the upload
+    address_query = """
+        SELECT DISTINCT COALESCE(e."standardizedAddress", '') AS "standardizedAddress",
+            COALESCE(e."defendantCity1", '') AS "defendantCity1"
+        FROM "new-evictions" AS e
+        WHERE NOT EXISTS (SELECT 1 FROM cares AS c WHERE c."standardizedAddress" = e."standardizedAddress")
+    """
+    unmatched_addresses = pd.read_sql(address_query, db.connection())
+
+    logger.info(f"Number of distinct inexact address/city pairs: {unmatched_addresses.shape[0]}")
+
+    geocoded_addresses, geocoder_stats = await geocode_eviction_addresses(db, unmatched_addresses)
+    num_geocoded_records = _apply_geocoded_locations(db, geocoded_addresses)
+
+    logger.info(f"Number of successfully geocoded records: {num_geocoded_records}")
+
+    db.execute(text(closest_cares_query('new-evictions')))
+
+    return geocoder_stats
+
+
+def _content_hash(alias: str):
+    columns = ', '.join([f'{alias}."{col}"' for col in REQUIRED_COLS if col != 'caseID'])
+    return f"md5(ROW({columns})::text)"
+
+
+def _drop_unchanged_eviction_records(db: Session):
+    # Feeds are cumulative, so most staged records are already stored unchanged; those already located or address
+    #   matched are dropped before matching and geocoding. Unchanged records that are not stay staged, so that they are
+    #   geocoded again (e.g. after a failed geocoder batch or once a No_Match expires). Records whose mapped columns
+    #   changed stay staged and are upserted
+    delta_query = f"""
+        WITH existing AS (
+            SELECT n."caseID",
+                {_content_hash('n')} = {_content_hash('e')} AS unchanged,
+                e.location IS NOT NULL OR EXISTS (
+                    SELECT 1 FROM "eviction-cares" AS r
+                    WHERE r."evictionId" = e."caseID" AND r.type = 'ADDRESS_MATCH'
+                ) AS resolved
+            FROM "new-evictions" AS n
+            INNER JOIN evictions AS e ON n."caseID" = e."caseID"
+        ), deleted AS (
+            DELETE FROM "new-evictions" AS n
+            USING existing
+            WHERE n."caseID" = existing."caseID" AND existing.unchanged AND existing.resolved
+        )
+        SELECT COUNT(*) FILTER (WHERE unchanged AND resolved) AS unchanged,
+            COUNT(*) FILTER (WHERE unchanged AND NOT resolved) AS unresolved,
+            COUNT(*) FILTER (WHERE NOT unchanged) AS changed,
+            (SELECT COUNT(*) FROM "new-evictions") - COUNT(*) AS new
+        FROM existing
+    """
+    delta = db.execute(text(delta_query)).mappings().one()
 
-    # proximity_matches = pd.read_sql(closest_cares_query, db.connection())
+    logger.info(f"Number of unchanged/unchanged unresolved/changed/new records: {delta['unchanged']}/"
+                f"{delta['unresolved']}/{delta['changed']}/{delta['new']}")
 
-    # return proximity_matches
+    return {
+        'numUnchangedRecords': delta['unchanged'],
+        'numUnresolvedRecords': delta['unresolved'],
+        'numChangedRecords': delta['changed'],
+        'numNewRecords': delta['new'],
+    }
 
 
 def _write_temp_eviction_records(db: Session):
-    # TODO: Handle duplicate records
     eviction_query = """
       INSERT INTO evictions 
         ("caseID", "fileDate", "plaintiff", "plaintiffAddress", "plaintiffCity", "defendantAddress1", 
-        "defendantCity1", "standardizedAddress", location)
+        "defendantCity1", "standardizedAddress", location, "closestCaresId", "closestCaresDistance")
       SELECT 
           "caseID", 
           "fileDate", 
@@ -2025,34 +409,63 @@ def _write_temp_eviction_records(db: Session):
           "defendantAddress1", 
           "defendantCity1",
           "standardizedAddress", 
-          location 
-      FROM "new-evictions";
+          location,
+          "closestCaresId",
+          "closestCaresDistance"
+      FROM "new-evictions"
+      ON CONFLICT ("caseID") DO UPDATE SET
+          "fileDate" = EXCLUDED."fileDate",
+          "plaintiff" = EXCLUDED."plaintiff",
+          "plaintiffAddress" = EXCLUDED."plaintiffAddress",
+          "plaintiffCity" = EXCLUDED."plaintiffCity",
+          "defendantAddress1" = EXCLUDED."defendantAddress1",
+          "defendantCity1" = EXCLUDED."defendantCity1",
+          "standardizedAddress" = EXCLUDED."standardizedAddress",
+          location = EXCLUDED.location,
+          "closestCaresId" = EXCLUDED."closestCaresId",
+          "closestCaresDistance" = EXCLUDED."closestCaresDistance";
       """
 
+    # Address matches of changed records are recomputed, while manual confirmations/rejections are kept
+    stale_relationship_query = """
+        DELETE FROM "eviction-cares" AS r
+        USING "new-evictions" AS e
+        WHERE r."evictionId" = e."caseID" AND r.type = 'ADDRESS_MATCH';
+    """
+
     relationship_query = """
         INSERT INTO "eviction-cares" (type, "evictionId", "caresId")
-        SELECT type, "evictionId", "caresId" FROM "new-eviction-cares";
+        SELECT type, "evictionId", "caresId" FROM "new-eviction-cares"
+        ON CONFLICT ("evictionId", "caresId") DO NOTHING;
     """
 
-    db.execute(text(eviction_query))
-    db.execute(text(relationship_query))
+    with track_suggestion_changes(db, 'SELECT "caseID" FROM "new-evictions"'):
+        db.execute(text(eviction_query))
+        db.execute(text(stale_relationship_query))
+        db.execute(text(relationship_query))
+        write_proximity_pairs(db, 'new-evictions')
 
     db.commit()
 
 
-async def get_matches(db: Session, df: pd.DataFrame):
-    TempEviction.__table__.create(db.connection(), checkfirst=True)
-    TempRelationship.__table__.create(db.connection(), checkfirst=True)
+async def get_matches(db: Session, report_progress: Callable | None = None):
+    report_progress = report_progress if report_progress is not None else lambda stage: None
 
-    db.execute(insert(TempEviction), df.to_dict(orient='records'))
+    report_progress('matching')
+    delta_summary = _drop_unchanged_eviction_records(db)
+    num_exact_matches = _get_exact_address_matches(db)
 
-    exact_matches = _get_exact_address_matches(db)
-    await _get_proximity_matches(db)
+    report_progress('geocoding')
+    geocoder_stats = await _get_proximity_matches(db)
 
+    report_progress('writing')
     _write_temp_eviction_records(db)
 
-    return exact_matches
-    # return exact_matches, proximity_matches
+    return {
+        **delta_summary,
+        'numExactMatches': num_exact_matches,
+        'geocoderStats': geocoder_stats,
+    }
 
 
 # This method is computationally expensive
@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import random
+import time
+from io import StringIO
+
+import aiohttp
+import numpy as np
+import pandas as pd
+import usaddress
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..utils.consts import MAX_BATCH_SIZE, GEOCODING_API_URL, GEOCODE_NO_MATCH_TTL_DAYS, GEOCODER_MAX_IN_FLIGHT, \
+    GEOCODER_REQUEST_TIMEOUT, GEOCODER_MAX_RETRIES, GEOCODER_BACKOFF_BASE, GEOCODER_BACKOFF_MAX, GEOCODER_MIN_BATCH_SIZE
+
+logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _parse_zip(city: str):
+    if pd.isna(city):
+        return ''
+    try:
+        tagged = usaddress.tag(city)[0]
+    except Exception:
+        return ''
+    # city = tagged.get('PlaceName', np.nan)
+    return tagged.get('ZipCode', '')
+
+
+async def _perform_geocode_request(segment: pd.DataFrame, session):
+    raw_file_content = bytes(segment.to_csv(lineterminator='\r\n', index=False, header=False), encoding='utf-8')
+
+    data = aiohttp.FormData()
+    data.add_field('addressFile',
+                   raw_file_content,
+                   filename='input.csv',
+                   content_type='text/csv')
+    data.add_field('benchmark', '4')  # https://geocoding.geo.census.gov/geocoder/benchmarks, current
+
+    async with session.post(url=GEOCODING_API_URL, data=data) as response:
+        response.raise_for_status()
+        raw_resp = await response.text()
+        output_df = pd.read_csv(StringIO(raw_resp),
+                                names=['id', 'address', 'match', '_', 'inputAddress', 'location', 'tigerId',
+                                       'tigerIdSide'],
+                                usecols=['id', 'match', 'location'])
+        return output_df
+
+
+def _backoff_delay(attempt: int):
+    # Full-jitter exponential backoff, so retries of concurrently failing batches do not arrive in lockstep
+    return random.uniform(0, min(GEOCODER_BACKOFF_MAX, GEOCODER_BACKOFF_BASE * 2 ** attempt))
+
+
+async def _geocode_segment(segment: pd.DataFrame, session, semaphore: asyncio.Semaphore, batch_stats: list,
+                           attempt: int = 0):
+    async with semaphore:
+        start = time.monotonic()
+        try:
+            output_df = await asyncio.wait_for(_perform_geocode_request(segment, session), GEOCODER_REQUEST_TIMEOUT)
+            batch_stats.append({'size': segment.shape[0], 'seconds': time.monotonic() - start, 'outcome': 'ok'})
+            return output_df
+        except asyncio.TimeoutError:
+            outcome = 'timeout'
+        except (aiohttp.ClientError, pd.errors.ParserError) as e:
+            outcome = 'error'
+            logger.warning(f"Geocoder batch of {segment.shape[0]} addresses failed: {e!r}")
+        batch_stats.append({'size': segment.shape[0], 'seconds': time.monotonic() - start, 'outcome': outcome})
+
+    # A batch that times out is likely too large for the service, so it is split in half rather than resent whole
+    if outcome == 'timeout' and segment.shape[0] >= 2 * GEOCODER_MIN_BATCH_SIZE:
+        half = segment.shape[0] // 2
+        halves = await asyncio.gather(
+            _geocode_segment(segment.iloc[:half], session, semaphore, batch_stats, attempt),
+            _geocode_segment(segment.iloc[half:], session, semaphore, batch_stats, attempt))
+        return pd.concat(halves)
+
+    if attempt >= GEOCODER_MAX_RETRIES:
+        logger.warning(f"Giving up on geocoder batch of {segment.shape[0]} addresses after {attempt + 1} attempts")
+        return segment[['id']].assign(match=np.nan, location=np.nan)
+
+    await asyncio.sleep(_backoff_delay(attempt))
+    return await _geocode_segment(segment, session, semaphore, batch_stats, attempt + 1)
+
+
+def _summarize_batch_stats(batch_stats: list):
+    if len(batch_stats) == 0:
+        return {'batches': 0}
+
+    stats_df = pd.DataFrame(batch_stats)
+    successful_stats_df = stats_df[stats_df['outcome'] == 'ok']
+    latencies = successful_stats_df['seconds']
+    return {
+        'batches': stats_df.shape[0],
+        'timeouts': int((stats_df['outcome'] == 'timeout').sum()),
+        'errors': int((stats_df['outcome'] == 'error').sum()),
+        'meanBatchSize': successful_stats_df['size'].mean() if successful_stats_df.shape[0] > 0 else None,
+        'p50Seconds': latencies.quantile(0.5) if latencies.shape[0] > 0 else None,
+        'p95Seconds': latencies.quantile(0.95) if latencies.shape[0] > 0 else None,
+        'maxSeconds': latencies.max() if latencies.shape[0] > 0 else None,
+        'addressesPerSecond': (successful_stats_df['size'] / latencies).mean() if latencies.shape[0] > 0 else None,
+    }
+
+
+async def _geocode_addresses(addresses: pd.DataFrame):
+    # The Census batch input is (id, street, city, state, zip); the id is the address' position in the frame
+    batch_geocode_input_df = pd.DataFrame({
+        'id': np.arange(addresses.shape[0]),
+        'street': addresses['standardizedAddress'].to_numpy(),
+        'city': np.nan,
+        'state': 'GA',
+        'zip': addresses['zip'].to_numpy(),
+    })
+
+    segments = batch_geocode_input_df.groupby(batch_geocode_input_df.index // MAX_BATCH_SIZE)
+
+    semaphore = asyncio.Semaphore(GEOCODER_MAX_IN_FLIGHT)
+    batch_stats = []
+    async with aiohttp.ClientSession() as session:
+        batch_geocode_outputs = await asyncio.gather(
+            *(_geocode_segment(segment, session, semaphore, batch_stats) for _, segment in segments))
+        batch_geocode_output_df = pd.concat(batch_geocode_outputs)
+
+    stats = _summarize_batch_stats(batch_stats)
+    logger.info(f"Geocoder batch statistics: {stats}")
+
+    # Addresses missing from a response are treated as unmatched, while those in batches that failed outright keep a
+    #   null match so they are neither located nor cached
+    geocoded = batch_geocode_output_df.drop_duplicates(subset=['id']).set_index('id')
+    geocoded = geocoded.reindex(batch_geocode_input_df['id'])
+    returned = batch_geocode_input_df['id'].isin(batch_geocode_output_df['id']).to_numpy()
+    match = geocoded['match'].mask(~returned, 'No_Match').to_numpy()
+    lon_lat = geocoded['location'].astype('string').str.split(',', expand=True).reindex(columns=[0, 1])
+    is_match = match == 'Match'  # Match, No_Match, Tie
+
+    return addresses.assign(
+        match=match,
+        lon=np.where(is_match, pd.to_numeric(lon_lat[0], errors='coerce'), np.nan),
+        lat=np.where(is_match, pd.to_numeric(lon_lat[1], errors='coerce'), np.nan),
+    ), stats
+
+
+def _get_cached_geocodes(db: Session, addresses: pd.DataFrame):
+    # Failed lookups are only trusted for a while, since the geocoder's reference data is updated over time
+    query = f"""
+        SELECT g."standardizedAddress", g.zip, g.match,
+            ST_X(g.location::geometry) AS lon,
+            ST_Y(g.location::geometry) AS lat
+        FROM geocode_cache AS g
+        INNER JOIN unnest(CAST(:addresses AS TEXT[]), CAST(:zips AS TEXT[])) AS k("standardizedAddress", zip)
+        ON g."standardizedAddress" = k."standardizedAddress" AND g.zip = k.zip
+        WHERE g.match = 'Match' OR g."geocodedAt" > now() - interval '{GEOCODE_NO_MATCH_TTL_DAYS} days'
+    """
+    return pd.read_sql(text(query), db.connection(), params={
+        'addresses': addresses['standardizedAddress'].tolist(),
+        'zips': addresses['zip'].tolist(),
+    })
+
+
+def _cache_geocodes(db: Session, geocodes: pd.DataFrame):
+    if geocodes.shape[0] == 0:
+        return
+
+    query = """
+        INSERT INTO geocode_cache ("standardizedAddress", zip, match, location, "geocodedAt")
+        SELECT "standardizedAddress", zip, match,
+            CASE WHEN lon IS NOT NULL THEN ST_SetSRID(ST_MakePoint(lon, lat), 4326)::geography END,
+            now()
+        FROM unnest(:addresses, :zips, :matches, CAST(:lons AS double precision[]), CAST(:lats AS double precision[]))
+            AS g("standardizedAddress", zip, match, lon, lat)
+        ON CONFLICT ("standardizedAddress", zip) DO UPDATE SET
+            match = EXCLUDED.match,
+            location = EXCLUDED.location,
+            "geocodedAt" = EXCLUDED."geocodedAt"
+    """
+    # Committed on a session of its own, so that paid-for geocoder work is kept even if the upload's transaction is
+    #   rolled back
+    with Session(db.get_bind()) as cache_db:
+        cache_db.execute(text(query), {
+            'addresses': geocodes['standardizedAddress'].tolist(),
+            'zips': geocodes['zip'].tolist(),
+            'matches': geocodes['match'].tolist(),
+            'lons': [None if pd.isna(lon) else lon for lon in geocodes['lon']],
+            'lats': [None if pd.isna(lat) else lat for lat in geocodes['lat']],
+        })
+        cache_db.commit()
+
+
+async def geocode_eviction_addresses(db: Session, eviction_addresses: pd.DataFrame):
+    # Takes the distinct (standardizedAddress, defendantCity1) pairs of the records to locate. Cities sharing a zip are
+    #   collapsed again, so only distinct (address, zip) pairs are resolved, first from geocode_cache and then from the
+    #   geocoder, before the results are fanned back out to every pair
+    if eviction_addresses.shape[0] == 0:
+        return eviction_addresses.assign(lon=[], lat=[]), _summarize_batch_stats([])
+
+    unique_cities = eviction_addresses['defendantCity1'].drop_duplicates()
+    zips = dict(zip(unique_cities, [_parse_zip(city) for city in unique_cities]))
+    eviction_addresses = eviction_addresses.assign(zip=eviction_addresses['defendantCity1'].map(zips).fillna(''))
+    addresses = eviction_addresses[['standardizedAddress', 'zip']].drop_duplicates().reset_index(drop=True)
+
+    cached = _get_cached_geocodes(db, addresses)
+    missed = addresses.merge(cached[['standardizedAddress', 'zip']], how='left', indicator=True)
+    missed = missed[missed['_merge'] == 'left_only'].drop(columns='_merge').reset_index(drop=True)
+
+    logger.info(f"Number of distinct addresses to geocode: {missed.shape[0]} ({cached.shape[0]} cached, "
+                f"{eviction_addresses.shape[0]} address/city pairs)")
+
+    if missed.shape[0] > 0:
+        geocoded, batch_stats = await _geocode_addresses(missed)
+    else:
+        geocoded, batch_stats = cached.iloc[:0], _summarize_batch_stats([])
+    _cache_geocodes(db, geocoded[geocoded['match'].notna()])
+
+    geocodes = pd.concat([cached, geocoded], ignore_index=True)
+    successful_geocodes = geocodes[geocodes['match'] == 'Match']
+    successful_addresses = eviction_addresses.merge(successful_geocodes, on=['standardizedAddress', 'zip'])
+
+    return successful_addresses[['standardizedAddress', 'defendantCity1', 'lon', 'lat']], batch_stats
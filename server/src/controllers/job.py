@@ -0,0 +1,222 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import shutil
+import time
+import uuid
+from typing import BinaryIO
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, update, select, func, text
+from sqlalchemy.orm import Session
+
+from .eviction import stage_eviction_file, get_matches, estimate_upload_row_count
+from ..db.db import engine, SessionLocal
+from ..db.models.IngestJob import IngestJob
+from ..utils.consts import MAX_CONCURRENT_INGEST_JOBS, INGEST_JOB_PROGRESS_INTERVAL, INGEST_JOB_EVENTS_INTERVAL, \
+    INGEST_JOB_OWNER_LOCK_CLASS, INGEST_UPLOAD_DIR
+
+logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FINISHED_INGEST_JOB_STATUSES = ('COMPLETED', 'FAILED')
+
+UNFINISHED_INGEST_JOB_STATUSES = ('QUEUED', 'RUNNING')
+
+_ingest_job_queue: asyncio.Queue | None = None
+
+# Jobs are queued in the memory of the process that accepted them, which marks them with its owner key
+_owner_key = random.randrange(2 ** 31)
+_owner_lock_connection = None
+
+
+def _get_upload_copy_path(job_id: str):
+    return os.path.join(INGEST_UPLOAD_DIR, f'{job_id}.csv')
+
+
+def _fetch_ingest_job(db: Session, job_id: str):
+    job = db.execute(select(IngestJob).where(IngestJob.id == job_id)).scalar_one_or_none()
+    if job is None:
+        return None
+    return {col.name: getattr(job, col.name) for col in IngestJob.__table__.columns}
+
+
+def _update_ingest_job(job_id: str, **values):
+    # Progress is written on its own session, so it is visible while the ingest transaction is still open
+    with SessionLocal() as db:
+        db.execute(update(IngestJob).where(IngestJob.id == job_id).values(updatedAt=func.now(), **values))
+        db.commit()
+
+
+def _make_progress_reporter(job_id: str, estimated_rows: int):
+    state = {'stage': None, 'stageStartedAt': 0.0, 'reportedAt': 0.0, 'rowsProcessed': 0}
+
+    def report_progress(stage: str, rows_processed: int | None = None):
+        now = time.monotonic()
+        stage_changed = stage != state['stage']
+        if stage_changed:
+            state['stage'] = stage
+            state['stageStartedAt'] = now
+        if rows_processed is not None:
+            state['rowsProcessed'] = rows_processed
+
+        # Stage changes are always written, row counts at most once per interval
+        if not stage_changed and now - state['reportedAt'] < INGEST_JOB_PROGRESS_INTERVAL:
+            return
+        state['reportedAt'] = now
+
+        values = {'stage': stage, 'rowsProcessed': state['rowsProcessed'], 'etaSeconds': None}
+        elapsed = now - state['stageStartedAt']
+        if rows_processed is not None and elapsed > 0 and rows_processed > 0:
+            rows_per_second = rows_processed / elapsed
+            values['rowsPerSecond'] = rows_per_second
+            values['etaSeconds'] = max(estimated_rows - rows_processed, 0) / rows_per_second
+        _update_ingest_job(job_id, **values)
+
+    return report_progress
+
+
+def _start_ingest_job(job_id: str):
+    # Fails if the job was given up on in the meantime (see _fail_orphaned_ingest_jobs)
+    with SessionLocal() as db:
+        started = db.execute(update(IngestJob).where(IngestJob.id == job_id, IngestJob.status == 'QUEUED')
+                             .values(status='RUNNING', updatedAt=func.now()))
+        db.commit()
+    return started.rowcount == 1
+
+
+def _run_ingest_pipeline(job_id: str, filepath: str, col_map: dict, estimated_rows: int):
+    report_progress = _make_progress_reporter(job_id, estimated_rows)
+
+    try:
+        if not _start_ingest_job(job_id):
+            logger.warning(f"Ingest job {job_id} is no longer queued, skipping it")
+            return
+
+        with SessionLocal() as db, open(filepath, 'rb') as file:
+            upload_summary = stage_eviction_file(db, file, col_map, report_progress)
+            # The pipeline gets its own event loop on this worker thread, so its blocking database calls never stall
+            #   the server's loop
+            match_summary = asyncio.run(get_matches(db, report_progress))
+
+        _update_ingest_job(job_id, status='COMPLETED', stage=None, etaSeconds=0,
+                           summary={**upload_summary, **match_summary}, finishedAt=func.now())
+        logger.info(f"Ingest job {job_id} completed")
+    except Exception as e:
+        logger.exception(f"Ingest job {job_id} failed")
+        _update_ingest_job(job_id, status='FAILED', etaSeconds=None, error=str(e), finishedAt=func.now())
+    finally:
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+
+async def _ingest_worker(queue: asyncio.Queue):
+    while True:
+        job_id, filepath, col_map, estimated_rows = await queue.get()
+        try:
+            await run_in_threadpool(_run_ingest_pipeline, job_id, filepath, col_map, estimated_rows)
+        finally:
+            queue.task_done()
+
+
+def _hold_owner_lock():
+    # A dedicated connection outside the pool, since the lock is held for the lifetime of the process
+    connection = engine.raw_connection()
+    driver_connection = connection.driver_connection
+    connection.detach()
+    driver_connection.autocommit = True
+    with driver_connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_lock(%s, %s)', (INGEST_JOB_OWNER_LOCK_CLASS, _owner_key))
+    return driver_connection
+
+
+def _fail_orphaned_ingest_jobs():
+    # Unfinished jobs are orphaned once the process that queued them is gone, which is when its owner lock can be
+    #   taken. Jobs queued before owners were recorded have no owner
+    with SessionLocal() as db:
+        owner_keys = db.execute(select(IngestJob.ownerKey).distinct()
+                                .where(IngestJob.status.in_(UNFINISHED_INGEST_JOB_STATUSES))).scalars().all()
+        for owner_key in owner_keys:
+            lock_params = {'lock_class': INGEST_JOB_OWNER_LOCK_CLASS, 'owner_key': owner_key}
+            if owner_key is not None and \
+                    not db.execute(text('SELECT pg_try_advisory_lock(:lock_class, :owner_key)'), lock_params).scalar():
+                continue
+
+            orphaned_job_ids = db.execute(
+                update(IngestJob)
+                .where(IngestJob.ownerKey.is_not_distinct_from(owner_key),
+                       IngestJob.status.in_(UNFINISHED_INGEST_JOB_STATUSES))
+                .values(status='FAILED', etaSeconds=None, error='Interrupted by a server restart',
+                        updatedAt=func.now(), finishedAt=func.now())
+                .returning(IngestJob.id)).scalars().all()
+            db.commit()
+            if owner_key is not None:
+                db.execute(text('SELECT pg_advisory_unlock(:lock_class, :owner_key)'), lock_params)
+                db.commit()
+
+            for job_id in orphaned_job_ids:
+                logger.warning(f"Ingest job {job_id} was orphaned by a server restart")
+                if os.path.exists(_get_upload_copy_path(job_id)):
+                    os.remove(_get_upload_copy_path(job_id))
+
+
+def start_ingest_workers():
+    global _ingest_job_queue, _owner_lock_connection
+    # The owner lock is taken first, so that this process' own jobs are never taken for orphans
+    _owner_lock_connection = _hold_owner_lock()
+    _fail_orphaned_ingest_jobs()
+
+    _ingest_job_queue = asyncio.Queue()
+    # Jobs beyond the worker count wait in the queue, so large uploads cannot crowd out interactive requests
+    return [asyncio.create_task(_ingest_worker(_ingest_job_queue)) for _ in range(MAX_CONCURRENT_INGEST_JOBS)]
+
+
+def create_ingest_job(db: Session, file: BinaryIO):
+    job_id = str(uuid.uuid4())
+
+    # The request's spooled upload is closed once the response is sent, so the job works from its own copy
+    file.seek(0)
+    os.makedirs(INGEST_UPLOAD_DIR, exist_ok=True)
+    upload_copy_path = _get_upload_copy_path(job_id)
+    with open(upload_copy_path, 'wb') as upload_copy:
+        shutil.copyfileobj(file, upload_copy)
+    estimated_rows = estimate_upload_row_count(file)
+
+    db.execute(insert(IngestJob).values(id=job_id, status='QUEUED', rowsProcessed=0, estimatedRows=estimated_rows,
+                                        ownerKey=_owner_key))
+    db.commit()
+
+    return job_id, upload_copy_path, estimated_rows
+
+
+def enqueue_ingest_job(job_id: str, filepath: str, col_map: dict, estimated_rows: int):
+    _ingest_job_queue.put_nowait((job_id, filepath, col_map, estimated_rows))
+
+
+def get_ingest_job(db: Session, job_id: str):
+    job = _fetch_ingest_job(db, job_id)
+    if job is None:
+        raise HTTPException(404, 'Invalid job id')
+    return job
+
+
+def _fetch_ingest_job_with_session(job_id: str):
+    with SessionLocal() as db:
+        return _fetch_ingest_job(db, job_id)
+
+
+async def stream_ingest_job_events(job_id: str):
+    last_job = None
+    while True:
+        job = await run_in_threadpool(_fetch_ingest_job_with_session, job_id)
+        if job is None:
+            return
+        if job != last_job:
+            yield f"data: {json.dumps(job, default=str)}\n\n"
+            last_job = job
+        if job['status'] in FINISHED_INGEST_JOB_STATUSES:
+            return
+        await asyncio.sleep(INGEST_JOB_EVENTS_INTERVAL)
@@ -0,0 +1,64 @@
+import logging
+
+from sqlalchemy import text, Connection
+from sqlalchemy.orm import Session
+
+from ..utils.consts import PROXIMITY_RADIUS
+
+logger = logging.getLogger(__name__)
+
+# Changes to any CARES property location change this fingerprint, which invalidates the stored pairs
+CARES_FINGERPRINT_QUERY = """
+    SELECT md5(COALESCE(string_agg(id::text || ':' || COALESCE(ST_AsEWKT(location), ''), ',' ORDER BY id), ''))
+    FROM cares
+"""
+
+
+def _insert_proximity_pairs_query(evictions_table: str):
+    return f"""
+        INSERT INTO cares_eviction_proximity ("caresId", "caseID", distance)
+        SELECT c.id, e."caseID", ST_Distance(c.location, e.location)
+        FROM "{evictions_table}" AS e
+        INNER JOIN cares AS c ON ST_DWithin(c.location, e.location, {PROXIMITY_RADIUS}, true)
+        WHERE e.location IS NOT NULL
+    """
+
+
+def rebuild_cares_eviction_proximity(connection: Connection):
+    # Pairs are only valid for the radius and CARES locations they were computed with, so they are rebuilt whenever
+    #   either differs from the stored state. Returns whether the pairs were rebuilt, and whether the CARES locations
+    #   differ (or were never recorded), in which case anything else derived from them is stale as well
+    cares_fingerprint = connection.execute(text(CARES_FINGERPRINT_QUERY)).scalar_one()
+    state = connection.execute(text("""
+        SELECT radius, "caresFingerprint" FROM cares_eviction_proximity_state WHERE id = 1
+    """)).mappings().one_or_none()
+
+    cares_changed = state is None or state['caresFingerprint'] != cares_fingerprint
+    if not cares_changed and state['radius'] == PROXIMITY_RADIUS:
+        return False, False
+
+    logger.info(f"Rebuilding CARES/eviction proximity pairs within {PROXIMITY_RADIUS}m")
+
+    connection.execute(text('TRUNCATE cares_eviction_proximity'))
+    connection.execute(text(_insert_proximity_pairs_query('evictions')))
+    connection.execute(text("""
+        INSERT INTO cares_eviction_proximity_state (id, radius, "caresFingerprint")
+        VALUES (1, :radius, :cares_fingerprint)
+        ON CONFLICT (id) DO UPDATE SET
+            radius = EXCLUDED.radius,
+            "caresFingerprint" = EXCLUDED."caresFingerprint",
+            "builtAt" = now()
+    """), {'radius': PROXIMITY_RADIUS, 'cares_fingerprint': cares_fingerprint})
+
+    return True, cares_changed
+
+
+def write_proximity_pairs(db: Session, evictions_table: str):
+    # Pairs of upserted records are replaced, since a changed record may have been geocoded to a different location
+    stale_pairs_query = f"""
+        DELETE FROM cares_eviction_proximity AS p
+        USING "{evictions_table}" AS e
+        WHERE p."caseID" = e."caseID"
+    """
+    db.execute(text(stale_pairs_query))
+    db.execute(text(_insert_proximity_pairs_query(evictions_table)))
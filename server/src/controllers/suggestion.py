@@ -1,66 +1,150 @@
+import json
+from contextlib import contextmanager
+from typing import List
+
 import pandas as pd
 from fastapi import HTTPException
-from sqlalchemy import text
+from sqlalchemy import text, Connection
 from sqlalchemy.orm import Session
 
 from src.controllers.cares import _extract_lon_lat
+from src.controllers.daily_counts import refresh_cares_daily_counts
+from src.utils.consts import PROXIMITY_RADIUS, SUGGESTION_PAGE_SIZE, ARCHIVED_SUGGESTION_PAGE_SIZE, \
+    SUGGESTION_EVENTS_CHANNEL, SUGGESTION_EVENTS_MAX_CARES_IDS
 
 
 def get_count_suggestions(db: Session):
+    count = db.execute(text('SELECT count FROM suggestion_count WHERE id = 1')).scalar_one_or_none()
+
+    return 0 if count is None else count
+
+
+# The suggestion count is kept in suggestion_count and adjusted by every write that can change it, in the same
+#   transaction. Writers lock the counter row first, so that concurrent adjustments are serialized
+def _lock_suggestion_count(db: Session):
+    db.execute(text('SELECT count FROM suggestion_count WHERE id = 1 FOR UPDATE'))
+
+
+def _suggestion_state_of(db: Session, case_ids_query: str, params: dict | None = None):
+    # Number of suggestions among the given eviction records, and the CARES properties whose suggestions, matches or
+    #   nearby records involve them
     query = f"""
-        SELECT COUNT(e."caseID") AS count 
-        FROM evictions AS e
-                 LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
-                 CROSS JOIN LATERAL (
-            SELECT c.id, c."propertyName", e.location <-> c.location AS dist FROM cares AS c ORDER BY dist LIMIT 1
-            ) AS p
-        WHERE e.location IS NOT NULL
-          AND (r.id IS NULL
-            OR r.type = 'MANUAL_REJECT')
-          AND dist <= 160;
+        SELECT (
+            SELECT COUNT(e."caseID")
+            FROM evictions AS e
+                     LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
+            WHERE e."closestCaresDistance" <= {PROXIMITY_RADIUS}
+              AND (r.id IS NULL
+                OR r.type = 'MANUAL_REJECT')
+              AND e."caseID" IN ({case_ids_query})
+        ) AS count,
+            ARRAY(
+                SELECT "closestCaresId" FROM evictions
+                WHERE "caseID" IN ({case_ids_query}) AND "closestCaresId" IS NOT NULL
+                UNION
+                SELECT "caresId" FROM "eviction-cares" WHERE "evictionId" IN ({case_ids_query})
+                UNION
+                SELECT "caresId" FROM cares_eviction_proximity WHERE "caseID" IN ({case_ids_query})
+            ) AS "caresIds"
     """
+    state = db.execute(text(query), params or {}).mappings().one()
+    return state['count'], set(state['caresIds'])
 
-    count_suggestions = pd.read_sql(query, db.connection())
 
-    return count_suggestions['count'].iloc[0].item()
+def _notify_suggestion_changes(db: Session, count_delta: int, count: int, cares_ids: set):
+    # Delivered to listeners when the transaction commits. Large change sets are sent without ids, which tells clients
+    #   to refetch everything, since NOTIFY payloads are limited in size
+    payload = {
+        'countDelta': count_delta,
+        'count': count,
+        'caresIds': sorted(cares_ids) if len(cares_ids) <= SUGGESTION_EVENTS_MAX_CARES_IDS else None,
+    }
+    db.execute(text('SELECT pg_notify(:channel, :payload)'),
+               {'channel': SUGGESTION_EVENTS_CHANNEL, 'payload': json.dumps(payload)})
 
 
-# To avoid duplicate eviction records appearing in the suggestions popup, each suggestion candidate (eviction record) is
-#   suggested to its closest cares property
-def retrieve_all_suggestions(db: Session):
+@contextmanager
+def track_suggestion_changes(db: Session, case_ids_query: str, params: dict | None = None):
+    # Wraps writes to the eviction records selected by case_ids_query, adjusting the suggestion count, refreshing the
+    #   daily counts of the affected properties and notifying listeners of the change within the same transaction
+    _lock_suggestion_count(db)
+    count_before, cares_ids_before = _suggestion_state_of(db, case_ids_query, params)
+
+    yield
+
+    count_after, cares_ids_after = _suggestion_state_of(db, case_ids_query, params)
+    count_delta = count_after - count_before
+    count = db.execute(text('UPDATE suggestion_count SET count = count + :delta WHERE id = 1 RETURNING count'),
+                       {'delta': count_delta}).scalar_one_or_none()
+    cares_ids = cares_ids_before | cares_ids_after
+    refresh_cares_daily_counts(db, cares_ids)
+    if count_delta != 0 or len(cares_ids) > 0:
+        _notify_suggestion_changes(db, count_delta, count, cares_ids)
+
+
+def refresh_suggestion_count(connection: Connection):
     query = f"""
-        SELECT e."caseID", 
-            e."defendantAddress1" AS address, 
-            p.id AS id, 
-            p."propertyName" AS "propertyName", 
-            2 AS verification
+        INSERT INTO suggestion_count (id, count)
+        SELECT 1, COUNT(e."caseID")
         FROM evictions AS e
                  LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
-                 CROSS JOIN LATERAL (
-            SELECT c.id, c."propertyName", e.location <-> c.location AS dist FROM cares AS c ORDER BY dist LIMIT 1
-            ) AS p
-        WHERE e.location IS NOT NULL
+        WHERE e."closestCaresDistance" <= {PROXIMITY_RADIUS}
           AND (r.id IS NULL
             OR r.type = 'MANUAL_REJECT')
-          AND dist <= 160;
+        ON CONFLICT (id) DO UPDATE SET count = EXCLUDED.count
     """
+    connection.execute(text(query))
 
-    suggestions = pd.read_sql(query, db.connection())
 
-    if suggestions.shape[0] == 0:
-        return [], 0
+def _group_by_property_json(rows: str, order_by: str):
+    # Builds the [{id, propertyName, suggestions: [{caseID, address, verification}]}] payload in the database, so rows
+    #   are never materialized in Python
+    return f"""
+        COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', g.id, 'propertyName', g."propertyName", 'suggestions', g.suggestions
+            ) ORDER BY g.id, g."propertyName")
+            FROM (
+                SELECT id, "propertyName", json_agg(json_build_object(
+                    'caseID', "caseID", 'address', address, 'verification', verification
+                ) ORDER BY {order_by}) AS suggestions
+                FROM {rows}
+                GROUP BY id, "propertyName"
+            ) AS g
+        ), '[]'::json)
+    """
+
 
-    # TODO: Speedup using json_build_object
-    cares_grouped_suggestions = suggestions.groupby(['id', 'propertyName'])[
-        ['caseID', 'address', 'verification']].apply(
-        lambda g: g.to_dict(orient='records')).reset_index(name='suggestions')
+# To avoid duplicate eviction records appearing in the suggestions popup, each suggestion candidate (eviction record) is
+#   suggested to its closest cares property
+PENDING_SUGGESTIONS_QUERY = f"""
+    SELECT e."caseID", 
+        e."defendantAddress1" AS address, 
+        c.id AS id, 
+        c."propertyName" AS "propertyName", 
+        2 AS verification
+    FROM evictions AS e
+             INNER JOIN cares AS c ON e."closestCaresId" = c.id
+             LEFT JOIN "eviction-cares" AS r ON e."caseID" = r."evictionId"
+    WHERE e."closestCaresDistance" <= {PROXIMITY_RADIUS}
+      AND (r.id IS NULL
+        OR r.type = 'MANUAL_REJECT')
+"""
 
-    return cares_grouped_suggestions.to_dict(orient='records'), suggestions.shape[0]
+# Pending suggestions of the property given by :cares_id. Suggestions already decided for this property are left out,
+#   even if they are pending for another one
+PROPERTY_PENDING_SUGGESTIONS_QUERY = f"""
+    SELECT DISTINCT e."caseID" FROM ({PENDING_SUGGESTIONS_QUERY} AND c.id = :cares_id) AS e
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "eviction-cares" AS r WHERE r."evictionId" = e."caseID" AND r."caresId" = :cares_id
+    )
+"""
 
 
-def retrieve_all_archived_suggestions(db: Session):
-    query = f"""
-        SELECT r."caresId"           AS id,
+def _archived_suggestions_query(joins: str = '', filters: str = ''):
+    return f"""
+        SELECT r.id                  AS "relationshipId",
+               r."caresId"           AS id,
                CASE
                    WHEN r.type = 'MANUAL_MATCH' THEN 0
                    WHEN r.type = 'MANUAL_REJECT' THEN 1
@@ -71,21 +155,91 @@ def retrieve_all_archived_suggestions(db: Session):
         FROM "eviction-cares" AS r
                  LEFT JOIN evictions AS e ON r."evictionId" = e."caseID"
                  LEFT JOIN cares AS c ON r."caresId" = c.id
-        WHERE r.type IN ('MANUAL_MATCH', 'MANUAL_REJECT')
-        ORDER BY r.id DESC
+                 {joins}
+        WHERE r.type IN ('MANUAL_MATCH', 'MANUAL_REJECT') {filters}
     """
 
-    archived_suggestions = pd.read_sql(query, db.connection())
 
-    if archived_suggestions.shape[0] == 0:
-        return []
+def retrieve_all_suggestions(db: Session):
+    # Returns the serialized response body, which the router sends as is
+    query = f"""
+        WITH pending AS ({PENDING_SUGGESTIONS_QUERY}),
+            archived AS ({_archived_suggestions_query()})
+        SELECT json_build_object(
+            'suggestions', {_group_by_property_json('pending', '"caseID"')},
+            'archivedSuggestions', {_group_by_property_json('archived', '"relationshipId" DESC')},
+            'numSuggestions', (SELECT COUNT(*) FROM pending)
+        )::text
+    """
+
+    return db.execute(text(query)).scalar_one()
+
+
+def _suggestion_filters(counties: List[str] | None, min_distance: float | None, max_distance: float | None,
+                        distance_column: str):
+    filters = ''
+    if counties:
+        filters += ' AND c."countyName" = ANY(:counties)'
+    if min_distance is not None:
+        filters += f' AND {distance_column} >= :min_distance'
+    if max_distance is not None:
+        filters += f' AND {distance_column} <= :max_distance'
+    return filters
+
+
+# Pending suggestions are paged by CARES property, so that a property's suggestions are never split across pages. The
+#   cursor is the last CARES id of the previous page, which keeps a page's cost independent of its position
+def retrieve_pending_suggestions_page(db: Session, after: int | None = None, limit: int = SUGGESTION_PAGE_SIZE,
+                                      counties: List[str] | None = None, min_distance: float | None = None,
+                                      max_distance: float | None = None):
+    filters = _suggestion_filters(counties, min_distance, max_distance, 'e."closestCaresDistance"')
+    query = f"""
+        WITH page_cares AS (
+                SELECT DISTINCT id
+                FROM ({PENDING_SUGGESTIONS_QUERY} AND c.id > :after {filters}) AS pending
+                ORDER BY id
+                LIMIT :limit
+            ),
+            page AS (
+                {PENDING_SUGGESTIONS_QUERY} AND c.id IN (SELECT id FROM page_cares) {filters}
+            )
+        SELECT json_build_object(
+            'suggestions', {_group_by_property_json('page', '"caseID"')},
+            'nextCursor', CASE WHEN (SELECT COUNT(*) FROM page_cares) = :limit THEN (SELECT MAX(id) FROM page_cares) END
+        )::text
+    """
+    params = {'after': -1 if after is None else after, 'limit': limit, 'counties': counties,
+              'min_distance': min_distance, 'max_distance': max_distance}
+
+    return db.execute(text(query), params).scalar_one()
 
-    # TODO: Speedup possible here
-    cares_grouped_archived_suggestions = archived_suggestions.groupby(['id', 'propertyName'])[
-        ['caseID', 'address', 'verification']].apply(lambda g: g.to_dict(orient='records')).reset_index(
-        name='suggestions')
 
-    return cares_grouped_archived_suggestions.to_dict(orient='records')
+# Archived suggestions are paged by decision, most recent first. The cursor is the last relationship id of the previous
+#   page
+def retrieve_archived_suggestions_page(db: Session, before: int | None = None,
+                                       limit: int = ARCHIVED_SUGGESTION_PAGE_SIZE, counties: List[str] | None = None,
+                                       min_distance: float | None = None, max_distance: float | None = None):
+    filters = _suggestion_filters(counties, min_distance, max_distance, 'p.distance')
+    distance_join = """
+        LEFT JOIN cares_eviction_proximity AS p ON r."caresId" = p."caresId" AND r."evictionId" = p."caseID"
+    """ if min_distance is not None or max_distance is not None else ''
+    query = f"""
+        WITH page AS (
+            {_archived_suggestions_query(distance_join, 'AND r.id < :before ' + filters)}
+            ORDER BY r.id DESC
+            LIMIT :limit
+        )
+        SELECT json_build_object(
+            'archivedSuggestions', COALESCE(
+                (SELECT json_agg(row_to_json(page) ORDER BY "relationshipId" DESC) FROM page), '[]'::json
+            ),
+            'nextCursor', CASE WHEN (SELECT COUNT(*) FROM page) = :limit THEN (SELECT MIN("relationshipId") FROM page) END
+        )::text
+    """
+    params = {'before': 2 ** 31 - 1 if before is None else before, 'limit': limit, 'counties': counties,
+              'min_distance': min_distance, 'max_distance': max_distance}
+
+    return db.execute(text(query), params).scalar_one()
 
 
 def get_suggestion_locations(db: Session, caresId: int, caseID: str):
@@ -114,31 +268,152 @@ def get_suggestion_locations(db: Session, caresId: int, caseID: str):
     return suggestion.to_dict()
 
 
-def confirm_suggestion(db: Session, caresId: int, caseID: str):
+# Coordinates of many suggestions at once, returned as parallel arrays in the order requested (or in caseID order for
+#   all pending suggestions of a property). Records that are not located have null coordinates
+def get_suggestion_locations_batch(db: Session, caresId: int | None = None, pairs: List[dict] | None = None):
+    if pairs is not None:
+        pairs_query = """
+            SELECT *
+            FROM unnest(CAST(:cares_ids AS INTEGER[]), CAST(:case_ids AS TEXT[]))
+                WITH ORDINALITY AS p("caresId", "caseID", position)
+        """
+        params = {'cares_ids': [pair['caresId'] for pair in pairs], 'case_ids': [pair['caseID'] for pair in pairs]}
+    else:
+        pairs_query = f"""
+            SELECT :cares_id AS "caresId", "caseID", row_number() OVER (ORDER BY "caseID") AS position
+            FROM ({PROPERTY_PENDING_SUGGESTIONS_QUERY}) AS pending
+        """
+        params = {'cares_id': caresId}
+
     query = f"""
-        INSERT INTO "eviction-cares" (type, "evictionId", "caresId") 
-        VALUES ('MANUAL_MATCH', '{caseID}', '{caresId}');
+        WITH pairs AS ({pairs_query}),
+            located AS (
+                SELECT p.position,
+                    p."caresId",
+                    p."caseID",
+                    ST_X(c.location::geometry) AS "caresLon",
+                    ST_Y(c.location::geometry) AS "caresLat",
+                    ST_X(e.location::geometry) AS "evictionLon",
+                    ST_Y(e.location::geometry) AS "evictionLat"
+                FROM pairs AS p
+                         INNER JOIN cares AS c ON p."caresId" = c.id
+                         INNER JOIN evictions AS e ON p."caseID" = e."caseID"
+            )
+        SELECT json_build_object(
+            'caresId', COALESCE(array_agg("caresId" ORDER BY position), '{{}}'),
+            'caseID', COALESCE(array_agg("caseID" ORDER BY position), '{{}}'),
+            'caresLon', COALESCE(array_agg("caresLon" ORDER BY position), '{{}}'),
+            'caresLat', COALESCE(array_agg("caresLat" ORDER BY position), '{{}}'),
+            'evictionLon', COALESCE(array_agg("evictionLon" ORDER BY position), '{{}}'),
+            'evictionLat', COALESCE(array_agg("evictionLat" ORDER BY position), '{{}}')
+        )::text
+        FROM located
+    """
+
+    return db.execute(text(query), params).scalar_one()
+
+
+def _get_pending_suggestion_case_ids(db: Session, caresId: int):
+    query = f'{PROPERTY_PENDING_SUGGESTIONS_QUERY} ORDER BY "caseID"'
+    return db.execute(text(query), {'cares_id': caresId}).scalars().all()
+
+
+# Applies a batch of {caresId, caseID, action} decisions in a single statement and transaction. Each decision is
+#   reported back, in order, with a status of:
+#     applied: the relationship was created, changed or deleted
+#     unchanged: nothing to do, e.g. undoing an undecided suggestion or deciding on an address match
+#     duplicate: superseded by a later decision on the same pair in the batch
+#     notFound: the CARES property or eviction record does not exist
+def apply_suggestion_decisions(db: Session, decisions: List[dict]):
+    if len(decisions) == 0:
+        return []
+
+    query = """
+        WITH input AS (
+            SELECT *
+            FROM unnest(CAST(:cares_ids AS INTEGER[]), CAST(:case_ids AS TEXT[]), CAST(:actions AS TEXT[]))
+                WITH ORDINALITY AS i("caresId", "caseID", action, position)
+        ),
+            decisions AS (
+                SELECT DISTINCT ON ("caresId", "caseID") *
+                FROM input
+                ORDER BY "caresId", "caseID", position DESC
+            ),
+            valid AS (
+                SELECT d.*
+                FROM decisions AS d
+                WHERE EXISTS (SELECT 1 FROM cares AS c WHERE c.id = d."caresId")
+                  AND EXISTS (SELECT 1 FROM evictions AS e WHERE e."caseID" = d."caseID")
+            ),
+            upserted AS (
+                INSERT INTO "eviction-cares" (type, "evictionId", "caresId")
+                SELECT CASE WHEN action = 'confirm' THEN 'MANUAL_MATCH' ELSE 'MANUAL_REJECT' END::relationship_type,
+                    "caseID",
+                    "caresId"
+                FROM valid
+                WHERE action IN ('confirm', 'reject')
+                ON CONFLICT ("evictionId", "caresId") DO UPDATE SET type = EXCLUDED.type
+                    WHERE "eviction-cares".type IN ('MANUAL_MATCH', 'MANUAL_REJECT')
+                      AND "eviction-cares".type != EXCLUDED.type
+                RETURNING "caresId", "evictionId"
+            ),
+            deleted AS (
+                DELETE FROM "eviction-cares" AS r
+                USING valid AS v
+                WHERE v.action = 'undo'
+                  AND r."caresId" = v."caresId"
+                  AND r."evictionId" = v."caseID"
+                  AND r.type IN ('MANUAL_MATCH', 'MANUAL_REJECT')
+                RETURNING r."caresId", r."evictionId"
+            ),
+            changed AS (
+                SELECT * FROM upserted UNION ALL SELECT * FROM deleted
+            )
+        SELECT i."caresId",
+            i."caseID",
+            i.action,
+            CASE
+                WHEN d.position IS NULL THEN 'duplicate'
+                WHEN v.position IS NULL THEN 'notFound'
+                WHEN EXISTS (
+                    SELECT 1 FROM changed WHERE changed."caresId" = i."caresId" AND changed."evictionId" = i."caseID"
+                ) THEN 'applied'
+                ELSE 'unchanged'
+                END AS status
+        FROM input AS i
+                 LEFT JOIN decisions AS d ON i.position = d.position
+                 LEFT JOIN valid AS v ON i.position = v.position
+        ORDER BY i.position
     """
-    db.execute(text(query))
+    params = {
+        'cares_ids': [decision['caresId'] for decision in decisions],
+        'case_ids': [decision['caseID'] for decision in decisions],
+        'actions': [decision['action'] for decision in decisions],
+    }
+
+    with track_suggestion_changes(db, 'SELECT unnest(CAST(:case_ids AS TEXT[]))', {'case_ids': params['case_ids']}):
+        results = db.execute(text(query), params).mappings().all()
     db.commit()
+
+    return [dict(result) for result in results]
+
+
+def apply_property_suggestion_decision(db: Session, caresId: int, action: str):
+    case_ids = _get_pending_suggestion_case_ids(db, caresId)
+    return apply_suggestion_decisions(db, [{'caresId': caresId, 'caseID': case_id, 'action': action}
+                                           for case_id in case_ids])
+
+
+def confirm_suggestion(db: Session, caresId: int, caseID: str):
+    apply_suggestion_decisions(db, [{'caresId': caresId, 'caseID': caseID, 'action': 'confirm'}])
     return
 
 
 def reject_suggestion(db: Session, caresId: int, caseID: str):
-    query = f"""
-        INSERT INTO "eviction-cares" (type, "evictionId", "caresId")
-        VALUES ('MANUAL_REJECT', '{caseID}', '{caresId}');
-    """
-    db.execute(text(query))
-    db.commit()
+    apply_suggestion_decisions(db, [{'caresId': caresId, 'caseID': caseID, 'action': 'reject'}])
     return
 
 
 def undo_suggestion(db: Session, caresId: int, caseID: str):
-    query = f"""
-        DELETE FROM "eviction-cares"
-        WHERE "caresId" = '{caresId}' AND "evictionId" = '{caseID}'
-    """
-    db.execute(text(query))
-    db.commit()
+    apply_suggestion_decisions(db, [{'caresId': caresId, 'caseID': caseID, 'action': 'undo'}])
     return
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import logging
+
+import psycopg2
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..db.db import engine
+from ..utils.consts import SUGGESTION_EVENTS_CHANNEL, SUGGESTION_EVENTS_QUEUE_SIZE, \
+    SUGGESTION_EVENTS_KEEPALIVE_INTERVAL, SUGGESTION_EVENTS_RECONNECT_INTERVAL
+
+logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Sent in place of events a subscriber fell too far behind on; clients should refetch everything
+RESYNC_EVENT = json.dumps({'countDelta': None, 'count': None, 'caresIds': None})
+
+# Queues of the event streams open in this worker process
+_subscribers: set[asyncio.Queue] = set()
+
+
+def _publish(payload: str):
+    for queue in _subscribers:
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC_EVENT)
+
+
+def _connect_listener():
+    # A dedicated connection outside the pool, since it stays in LISTEN for the lifetime of the worker
+    connection = engine.raw_connection()
+    driver_connection = connection.driver_connection
+    connection.detach()
+    driver_connection.autocommit = True
+    with driver_connection.cursor() as cursor:
+        cursor.execute(f'LISTEN {SUGGESTION_EVENTS_CHANNEL}')
+    return driver_connection
+
+
+async def _listen_for_suggestion_changes():
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            connection = await loop.run_in_executor(None, _connect_listener)
+        except (psycopg2.Error, SQLAlchemyError) as e:
+            logger.warning(f"Could not listen for suggestion changes: {e}")
+            await asyncio.sleep(SUGGESTION_EVENTS_RECONNECT_INTERVAL)
+            continue
+
+        disconnected = loop.create_future()
+
+        def on_readable():
+            try:
+                connection.poll()
+            except psycopg2.Error as e:
+                if not disconnected.done():
+                    disconnected.set_result(e)
+                return
+            while connection.notifies:
+                _publish(connection.notifies.pop(0).payload)
+
+        # Kept, as the descriptor can no longer be looked up once the connection is lost
+        fileno = connection.fileno()
+        loop.add_reader(fileno, on_readable)
+        try:
+            error = await disconnected
+            logger.warning(f"Lost suggestion change listener connection: {error}")
+        finally:
+            loop.remove_reader(fileno)
+            connection.close()
+
+        # Changes made while disconnected were missed
+        _publish(RESYNC_EVENT)
+        await asyncio.sleep(SUGGESTION_EVENTS_RECONNECT_INTERVAL)
+
+
+def start_suggestion_listener():
+    return asyncio.create_task(_listen_for_suggestion_changes())
+
+
+def subscribe_to_suggestion_changes():
+    queue = asyncio.Queue(maxsize=SUGGESTION_EVENTS_QUEUE_SIZE)
+    _subscribers.add(queue)
+    return queue
+
+
+def unsubscribe_from_suggestion_changes(queue: asyncio.Queue):
+    _subscribers.discard(queue)
+
+
+async def stream_suggestion_events():
+    queue = subscribe_to_suggestion_changes()
+    try:
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), SUGGESTION_EVENTS_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"data: {payload}\n\n"
+    finally:
+        unsubscribe_from_suggestion_changes(queue)
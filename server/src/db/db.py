@@ -3,7 +3,9 @@ from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import os
 
+from src.utils.consts import DB_POOL_SIZE, DB_MAX_OVERFLOW
+
 load_dotenv()
 
-engine = create_engine(os.getenv('DB_URL'))
+engine = create_engine(os.getenv('DB_URL'), pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
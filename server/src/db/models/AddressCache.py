@@ -0,0 +1,12 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String, Text
+
+Base = declarative_base()
+
+
+class AddressCache(Base):
+    __tablename__ = 'address_cache'
+    address = Column(Text, primary_key=True)
+    city = Column(Text, primary_key=True)
+    standardizerVersion = Column(Integer, primary_key=True)
+    standardizedAddress = Column(String(255))
@@ -15,3 +15,4 @@ class Cares(Base):
     city = Column(String)
     zipCode = Column(Integer)
     location = Column(Geography(geometry_type='POINT', srid=4326))
+    countyName = Column(String)
@@ -0,0 +1,12 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, Date
+
+Base = declarative_base()
+
+
+class CaresDailyCount(Base):
+    __tablename__ = 'cares_daily_counts'
+    caresId = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    matched = Column(Integer, nullable=False)
+    potential = Column(Integer, nullable=False)
@@ -0,0 +1,23 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, Integer, Double, Text, DateTime, Index, func
+
+Base = declarative_base()
+
+
+class CaresEvictionProximity(Base):
+    __tablename__ = 'cares_eviction_proximity'
+    caresId = Column(Integer, primary_key=True)
+    caseID = Column(String(50), primary_key=True)
+    distance = Column(Double, nullable=False)
+
+    __table_args__ = (
+        Index('idx_cares_eviction_proximity_case_id', 'caseID'),
+    )
+
+
+class CaresEvictionProximityState(Base):
+    __tablename__ = 'cares_eviction_proximity_state'
+    id = Column(Integer, primary_key=True)
+    radius = Column(Double, nullable=False)
+    caresFingerprint = Column(Text, nullable=False)
+    builtAt = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
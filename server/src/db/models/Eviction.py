@@ -16,6 +16,8 @@ class Eviction(Base):
     defendantCity1 = Column(Text)
     standardizedAddress = Column(String(255))
     location = Column(Geography(geometry_type='POINT', srid=4326))
+    closestCaresId = Column(Integer)
+    closestCaresDistance = Column(Double)
 
 
 class TempEviction(Base):
@@ -31,6 +33,7 @@ class TempEviction(Base):
         Column('defendantCity1', Text),
         Column('standardizedAddress', String(255)),
         Column('location', Geography(geometry_type='POINT', srid=4326)),
+        Column('closestCaresId', Integer),
         Column('closestCaresDistance', Double),
         prefixes=['TEMPORARY'],
         postgresql_on_commit='DROP'
@@ -0,0 +1,14 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, func
+from geoalchemy2 import Geography
+
+Base = declarative_base()
+
+
+class GeocodeCache(Base):
+    __tablename__ = 'geocode_cache'
+    standardizedAddress = Column(String(255), primary_key=True)
+    zip = Column(String(10), primary_key=True)
+    match = Column(String(16), nullable=False)
+    location = Column(Geography(geometry_type='POINT', srid=4326))
+    geocodedAt = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,22 @@
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String, Text, Double, DateTime, func
+
+Base = declarative_base()
+
+
+class IngestJob(Base):
+    __tablename__ = 'ingest_jobs'
+    id = Column(String(36), primary_key=True)
+    status = Column(String(16), nullable=False)
+    stage = Column(String(32))
+    rowsProcessed = Column(Integer, nullable=False, default=0)
+    estimatedRows = Column(Integer)
+    rowsPerSecond = Column(Double)
+    etaSeconds = Column(Double)
+    summary = Column(JSONB)
+    error = Column(Text)
+    createdAt = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updatedAt = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    finishedAt = Column(DateTime(timezone=True))
+    ownerKey = Column(Integer)
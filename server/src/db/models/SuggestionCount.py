@@ -0,0 +1,10 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, BigInteger
+
+Base = declarative_base()
+
+
+class SuggestionCount(Base):
+    __tablename__ = 'suggestion_count'
+    id = Column(Integer, primary_key=True)
+    count = Column(BigInteger, nullable=False)
@@ -0,0 +1,126 @@
+from sqlalchemy import text
+
+from src.controllers.daily_counts import rebuild_cares_daily_counts
+from src.controllers.eviction import closest_cares_query
+from src.controllers.proximity import rebuild_cares_eviction_proximity
+from src.controllers.suggestion import refresh_suggestion_count
+from src.db.db import engine
+from src.db.models.AddressCache import AddressCache
+from src.db.models.CaresDailyCount import CaresDailyCount
+from src.db.models.CaresEvictionProximity import CaresEvictionProximity, CaresEvictionProximityState
+from src.db.models.GeocodeCache import GeocodeCache
+from src.db.models.IngestJob import IngestJob
+from src.db.models.SuggestionCount import SuggestionCount
+from src.utils.consts import SCHEMA_LOCK_KEY
+
+
+# ALTER TABLE takes an exclusive lock on the table even when the column already exists, so columns are only added when
+#   missing to keep startup from blocking reads
+def _has_column(connection, table_name: str, column_name: str):
+    return connection.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = :table_name AND column_name = :column_name
+        )
+    """), {'table_name': table_name, 'column_name': column_name}).scalar()
+
+
+def create_schema():
+    # Tables derived from uploads that are not part of the seed dump are created on startup if missing. Every worker
+    #   runs this as it starts, so they take turns on a lock to not collide on the DDL below
+    with engine.begin() as connection:
+        connection.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': SCHEMA_LOCK_KEY})
+
+        AddressCache.__table__.create(connection, checkfirst=True)
+        IngestJob.__table__.create(connection, checkfirst=True)
+        # Process that queued each job, see _fail_orphaned_ingest_jobs
+        if not _has_column(connection, 'ingest_jobs', 'ownerKey'):
+            connection.execute(text("""
+                ALTER TABLE ingest_jobs ADD COLUMN "ownerKey" INTEGER
+            """))
+        GeocodeCache.__table__.create(connection, checkfirst=True)
+        CaresEvictionProximity.__table__.create(connection, checkfirst=True)
+        CaresEvictionProximityState.__table__.create(connection, checkfirst=True)
+        SuggestionCount.__table__.create(connection, checkfirst=True)
+        CaresDailyCount.__table__.create(connection, checkfirst=True)
+
+        # Nearest CARES property of each eviction record, assigned at ingest so that suggestions can be read with an
+        #   index scan instead of a nearest-neighbour search per record. Records are backfilled below
+        if not _has_column(connection, 'evictions', 'closestCaresId'):
+            connection.execute(text("""
+                ALTER TABLE evictions
+                    ADD COLUMN IF NOT EXISTS "closestCaresId" INTEGER,
+                    ADD COLUMN IF NOT EXISTS "closestCaresDistance" DOUBLE PRECISION
+            """))
+        connection.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_evictions_closest_cares_distance ON evictions ("closestCaresDistance")
+        """))
+        # Pending suggestions are paged in CARES id order
+        connection.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_evictions_closest_cares_id ON evictions ("closestCaresId", "closestCaresDistance")
+        """))
+
+        # County of each CARES property, assigned when its location is written so that county filters do not test points
+        #   against county polygons at read time
+        if not _has_column(connection, 'cares', 'countyName'):
+            connection.execute(text("""
+                ALTER TABLE cares ADD COLUMN "countyName" VARCHAR
+            """))
+        connection.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_cares_county_name ON cares ("countyName")
+        """))
+        connection.execute(text("""
+            CREATE OR REPLACE FUNCTION assign_cares_county() RETURNS trigger AS $$
+            BEGIN
+                NEW."countyName" := (
+                    SELECT name10 FROM counties WHERE ST_Within(NEW.location::geometry, counties.geom) LIMIT 1
+                );
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+        """))
+        trigger_exists = connection.execute(text("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_trigger WHERE tgrelid = 'cares'::regclass AND tgname = 'cares_assign_county'
+            )
+        """)).scalar()
+        if not trigger_exists:
+            connection.execute(text("""
+                CREATE TRIGGER cares_assign_county BEFORE INSERT OR UPDATE OF location ON cares
+                    FOR EACH ROW EXECUTE FUNCTION assign_cares_county()
+            """))
+        connection.execute(text("""
+            UPDATE cares AS c
+            SET "countyName" = counties.name10
+            FROM counties
+            WHERE c."countyName" IS NULL AND ST_Within(c.location::geometry, counties.geom)
+        """))
+
+        # Records stored before the nearest CARES property columns existed are backfilled. Every assignment is
+        #   recomputed when the CARES locations have changed, as a record's nearest property may have moved or be gone
+        proximity_rebuilt, cares_changed = rebuild_cares_eviction_proximity(connection)
+        if cares_changed:
+            connection.execute(text("""
+                UPDATE evictions SET "closestCaresId" = NULL, "closestCaresDistance" = NULL
+                WHERE "closestCaresId" IS NOT NULL
+            """))
+        num_backfilled = connection.execute(text(closest_cares_query('evictions'))).rowcount
+
+        # Matches are looked up by property when the daily counts of a property are refreshed
+        connection.execute(text("""
+            CREATE INDEX IF NOT EXISTS "idx_eviction-cares_cares_id" ON "eviction-cares" ("caresId")
+        """))
+
+        # Both are kept up to date by the API, so they are only rebuilt when the steps above changed the records they are
+        #   derived from, or when missing. Deleting the suggestion_count row has the next startup rebuild both, e.g.
+        #   after the records were changed outside the API
+        counts_stale = proximity_rebuilt or num_backfilled > 0 or not connection.execute(text("""
+            SELECT EXISTS (SELECT 1 FROM suggestion_count)
+        """)).scalar()
+        if counts_stale:
+            refresh_suggestion_count(connection)
+        daily_counts_missing = not connection.execute(text("""
+            SELECT EXISTS (SELECT 1 FROM cares_daily_counts)
+        """)).scalar()
+        if counts_stale or daily_counts_missing:
+            rebuild_cares_daily_counts(connection)
@@ -2,11 +2,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
 
-from src.db.db import engine
-from src.db.models.Eviction import Eviction
-from src.db.models.Relationship import Relationship
+from src.controllers.count_index import start_cares_count_index
+from src.controllers.job import start_ingest_workers
+from src.controllers.suggestion_events import start_suggestion_listener
+from src.db.schema import create_schema
 from src.routers import upload, cares, suggestion, export, eviction
 
 import ssl
@@ -16,17 +16,23 @@ origins = [
     "*"
 ]
 
-#
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     with Session(bind=engine) as session:  # Synchronous session context
-#         Eviction.__table__.create(session.bind, checkfirst=True)
-#         Relationship.__table__.create(session.bind, checkfirst=True)
-#
-#     yield
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    create_schema()
+    ingest_workers = start_ingest_workers()
+    suggestion_listener = start_suggestion_listener()
+    cares_count_index_maintainer = start_cares_count_index()
 
-app = FastAPI()
+    yield
+
+    for ingest_worker in ingest_workers:
+        ingest_worker.cancel()
+    suggestion_listener.cancel()
+    cares_count_index_maintainer.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
 
 ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
 ssl_context.load_cert_chain(certfile='./cert.pem', keyfile='./key.pem')
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 from typing import List
@@ -6,10 +7,9 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
-from ..controllers.cares import get_all_cares_records, get_cares_property_records, get_property_eviction_count_by_month, \
-    get_property_eviction_count_by_week, get_name_permutations, get_address_permutations, \
-    get_inexact_records_by_property, get_archived_suggestions
-from ..utils.db import get_db
+from ..controllers.cares import get_all_cares_records, get_cares_property_records, get_property_eviction_history, \
+    get_name_permutations, get_address_permutations, get_inexact_records_by_property, get_archived_suggestions
+from ..utils.db import get_db, run_with_session
 
 logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,26 +36,22 @@ async def get_all_cares_properties(counties: Annotated[List[str], Query()], date
 @router.get("/property")
 # History and property fields intended for property popup - not to be used for property page (history and property
 #   fetch must be done independently)
-async def get_property_details(id: int, dateFrom: datetime.date | None = None, dateTo: datetime.date | None = None,
-                               db: Session = Depends(get_db)):
-    cares_property_records = get_cares_property_records(db, id, dateFrom, dateTo)
-    # property_eviction_count_dynamic = get_property_eviction_count_by_dynamic_time_range(db, id, dateFrom, dateTo)
-
-    property_eviction_count_by_month = get_property_eviction_count_by_month(db, id, dateFrom, dateTo)
-    property_eviction_count_by_week = get_property_eviction_count_by_week(db, id, dateFrom, dateTo)
-
-    # dateFrom and dateTo not needed, only used for popup
-    suggestions = get_inexact_records_by_property(db, id)
-    archived_suggestions = get_archived_suggestions(db, id)
-    name_permutations = get_name_permutations(db, id)
-    address_permutations = get_address_permutations(db, id)
+async def get_property_details(id: int, dateFrom: datetime.date | None = None, dateTo: datetime.date | None = None):
+    # The sub-queries are independent, so they run concurrently on separate connections
+    cares_property_records, property_eviction_history, suggestions, archived_suggestions, name_permutations, \
+        address_permutations = await asyncio.gather(
+            run_with_session(get_cares_property_records, id, dateFrom, dateTo),
+            run_with_session(get_property_eviction_history, id, dateFrom, dateTo),
+            # dateFrom and dateTo not needed, only used for popup
+            run_with_session(get_inexact_records_by_property, id),
+            run_with_session(get_archived_suggestions, id),
+            run_with_session(get_name_permutations, id),
+            run_with_session(get_address_permutations, id),
+        )
 
     return {
         'property': cares_property_records,
-        'history': {
-            'month': property_eviction_count_by_month,
-            'week': property_eviction_count_by_week,
-        },
+        'history': property_eviction_history,
         'suggestions': suggestions,
         'archivedSuggestions': archived_suggestions,
         'namePermutations': name_permutations,
@@ -64,16 +60,13 @@ async def get_property_details(id: int, dateFrom: datetime.date | None = None, d
 
 
 @router.get("/property/trend")
-async def get_property_trend(id: int, dateFrom: datetime.date, dateTo: datetime.date, db: Session = Depends(get_db)):
-    cares_property_records = get_cares_property_records(db, id, dateFrom, dateTo)
-
-    property_eviction_count_by_month = get_property_eviction_count_by_month(db, id, dateFrom, dateTo)
-    property_eviction_count_by_week = get_property_eviction_count_by_week(db, id, dateFrom, dateTo)
+async def get_property_trend(id: int, dateFrom: datetime.date, dateTo: datetime.date):
+    cares_property_records, property_eviction_history = await asyncio.gather(
+        run_with_session(get_cares_property_records, id, dateFrom, dateTo),
+        run_with_session(get_property_eviction_history, id, dateFrom, dateTo),
+    )
 
     return {
         'property': cares_property_records,
-        'history': {
-            'month': property_eviction_count_by_month,
-            'week': property_eviction_count_by_week,
-        },
+        'history': property_eviction_history,
     }
@@ -1,11 +1,18 @@
 import logging
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from typing_extensions import Annotated
 
 from ..controllers.suggestion import get_suggestion_locations, confirm_suggestion, reject_suggestion, undo_suggestion, \
-    retrieve_all_suggestions, retrieve_all_archived_suggestions, get_count_suggestions
+    retrieve_all_suggestions, get_count_suggestions, retrieve_pending_suggestions_page, \
+    retrieve_archived_suggestions_page, apply_suggestion_decisions, apply_property_suggestion_decision, \
+    get_suggestion_locations_batch
+from ..controllers.suggestion_events import stream_suggestion_events
+from ..utils.consts import SUGGESTION_PAGE_SIZE, ARCHIVED_SUGGESTION_PAGE_SIZE, MAX_SUGGESTION_PAGE_SIZE
 from ..utils.db import get_db
 
 logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
@@ -20,13 +27,29 @@ router = APIRouter(
 
 @router.get("/")
 async def get_all_suggestions(db: Session = Depends(get_db)):
-    all_suggestions, num_suggestions = retrieve_all_suggestions(db)
-    all_archived_suggestions = retrieve_all_archived_suggestions(db)
-    return {
-        'suggestions': all_suggestions,
-        'archivedSuggestions': all_archived_suggestions,
-        'numSuggestions': num_suggestions
-    }
+    return Response(content=retrieve_all_suggestions(db), media_type='application/json')
+
+
+@router.get("/pending")
+async def get_pending_suggestions_page(after: int | None = None,
+                                       limit: Annotated[int, Query(ge=1, le=MAX_SUGGESTION_PAGE_SIZE)] =
+                                       SUGGESTION_PAGE_SIZE,
+                                       counties: Annotated[List[str] | None, Query()] = None,
+                                       minDistance: float | None = None, maxDistance: float | None = None,
+                                       db: Session = Depends(get_db)):
+    page = retrieve_pending_suggestions_page(db, after, limit, counties, minDistance, maxDistance)
+    return Response(content=page, media_type='application/json')
+
+
+@router.get("/archived")
+async def get_archived_suggestions_page(before: int | None = None,
+                                        limit: Annotated[int, Query(ge=1, le=MAX_SUGGESTION_PAGE_SIZE)] =
+                                        ARCHIVED_SUGGESTION_PAGE_SIZE,
+                                        counties: Annotated[List[str] | None, Query()] = None,
+                                        minDistance: float | None = None, maxDistance: float | None = None,
+                                        db: Session = Depends(get_db)):
+    page = retrieve_archived_suggestions_page(db, before, limit, counties, minDistance, maxDistance)
+    return Response(content=page, media_type='application/json')
 
 
 @router.get("/count")
@@ -37,6 +60,12 @@ async def get_num_all_suggestions(db: Session = Depends(get_db)):
     }
 
 
+@router.get("/events")
+async def get_suggestion_events():
+    # Pushes {countDelta, count, caresIds} whenever suggestions change; a null caresIds means everything may have changed
+    return StreamingResponse(stream_suggestion_events(), media_type='text/event-stream')
+
+
 @router.get("/map")
 async def get_suggestion_verification_metadata(caresId: int, caseID: str, db: Session = Depends(get_db)):
     suggestion_locations = get_suggestion_locations(db, caresId, caseID)
@@ -48,6 +77,23 @@ class Suggestion(BaseModel):
     caseID: str
 
 
+class SuggestionLocationBatch(BaseModel):
+    # Either explicit pairs, or every pending suggestion of a CARES property
+    pairs: List[Suggestion] | None = None
+    caresId: int | None = None
+
+
+@router.post("/map/batch")
+async def post_suggestion_locations_batch(batch: SuggestionLocationBatch, db: Session = Depends(get_db)):
+    if batch.pairs is not None:
+        locations = get_suggestion_locations_batch(db, pairs=[pair.model_dump() for pair in batch.pairs])
+    elif batch.caresId is not None:
+        locations = get_suggestion_locations_batch(db, caresId=batch.caresId)
+    else:
+        raise HTTPException(400, 'Either pairs or caresId must be provided')
+    return Response(content=locations, media_type='application/json')
+
+
 @router.post("/confirm")
 async def post_confirm_suggestion(suggestion: Suggestion, db: Session = Depends(get_db)):
     return confirm_suggestion(db, suggestion.caresId, suggestion.caseID)
@@ -61,3 +107,27 @@ async def post_reject_suggestion(suggestion: Suggestion, db: Session = Depends(g
 @router.post("/undo")
 async def post_undo_suggestion(suggestion: Suggestion, db: Session = Depends(get_db)):
     return undo_suggestion(db, suggestion.caresId, suggestion.caseID)
+
+
+class SuggestionDecision(Suggestion):
+    action: Literal['confirm', 'reject', 'undo']
+
+
+class SuggestionDecisionBatch(BaseModel):
+    # Either explicit decisions, or an action applied to every pending suggestion of a CARES property
+    decisions: List[SuggestionDecision] | None = None
+    caresId: int | None = None
+    action: Literal['confirm', 'reject'] | None = None
+
+
+@router.post("/batch")
+async def post_suggestion_decisions(batch: SuggestionDecisionBatch, db: Session = Depends(get_db)):
+    if batch.decisions is not None:
+        results = apply_suggestion_decisions(db, [decision.model_dump() for decision in batch.decisions])
+    elif batch.caresId is not None and batch.action is not None:
+        results = apply_property_suggestion_decision(db, batch.caresId, batch.action)
+    else:
+        raise HTTPException(400, 'Either decisions or caresId and action must be provided')
+    return {
+        'results': results
+    }
@@ -1,13 +1,15 @@
 import json
 import logging
-from io import BytesIO
 
-import pandas as pd
-from fastapi import APIRouter, Depends, UploadFile, Form
+from fastapi import APIRouter, Depends, UploadFile, Form, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
-from ..controllers.eviction import transform_eviction_data, get_matches
+from ..controllers.eviction import get_upload_preview
+from ..controllers.job import create_ingest_job, enqueue_ingest_job, get_ingest_job, stream_ingest_job_events
+from ..utils.consts import PREVIEW_NUM_ROWS, MAX_PREVIEW_NUM_ROWS
 from ..utils.db import get_db
 
 logging.basicConfig(format='%(asctime)s - %(message)s', level=logging.INFO)
@@ -21,26 +23,38 @@ router = APIRouter(
 
 
 @router.post("/request")
-async def post_upload_request(file: UploadFile):
-    input_df = pd.read_csv(BytesIO(file.file.read()))
+async def post_upload_request(file: UploadFile,
+                              rows: Annotated[int, Query(ge=1, le=MAX_PREVIEW_NUM_ROWS)] = PREVIEW_NUM_ROWS):
+    preview = await run_in_threadpool(get_upload_preview, file.file, rows)
+    return preview['columns']
 
-    input_df.fillna("", inplace=True)
-    head = input_df.head()
 
-    return head.to_dict(orient='list')
+@router.post("/preview")
+async def post_upload_preview(file: UploadFile,
+                              rows: Annotated[int, Query(ge=1, le=MAX_PREVIEW_NUM_ROWS)] = PREVIEW_NUM_ROWS):
+    return await run_in_threadpool(get_upload_preview, file.file, rows)
 
 
-@router.post("/confirm")
+@router.post("/confirm", status_code=status.HTTP_202_ACCEPTED)
 async def post_upload_confirm(file: UploadFile, cols: Annotated[str, Form()], db: Session = Depends(get_db)):
-    input_df = pd.read_csv(BytesIO(file.file.read()))
-
-    logger.info(f"Number of records (pre-deduplication): {input_df.shape[0]}")
-
     col_map = json.loads(cols)
     # TODO: Check if all required cols are keys in col_map
 
-    transformed_input_df = transform_eviction_data(input_df, col_map)
+    # Ingestion runs in a background worker; progress is reported through /upload/jobs/{job_id}
+    job_id, filepath, estimated_rows = await run_in_threadpool(create_ingest_job, db, file.file)
+    enqueue_ingest_job(job_id, filepath, col_map, estimated_rows)
+
+    return {
+        'jobId': job_id,
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_upload_job(job_id: str, db: Session = Depends(get_db)):
+    return get_ingest_job(db, job_id)
 
-    await get_matches(db, transformed_input_df)
 
-    pass
+@router.get("/jobs/{job_id}/events")
+async def get_upload_job_events(job_id: str, db: Session = Depends(get_db)):
+    get_ingest_job(db, job_id)
+    return StreamingResponse(stream_ingest_job_events(job_id), media_type='text/event-stream')
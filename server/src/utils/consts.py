@@ -1,3 +1,10 @@
+import os
+import tempfile
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
 REQUIRED_COLS = [
     'fileDate',
     'caseID',
@@ -10,6 +17,108 @@ REQUIRED_COLS = [
 
 MAX_BATCH_SIZE = 5000
 
-GEOCODING_API_URL = 'https://geocoding.geo.census.gov/geocoder/locations/addressbatch'
+# Number of CSV rows parsed, standardized and staged at a time during an upload
+CSV_CHUNK_SIZE = 50000
+
+# Size of the process pool that parses distinct addresses during standardization
+ADDRESS_STANDARDIZATION_WORKERS = os.cpu_count()
+
+# Number of distinct addresses handed to a standardization worker at a time
+ADDRESS_STANDARDIZATION_CHUNK_SIZE = 2000
+
+# Below this many distinct addresses, standardization runs in-process since the pool overhead outweighs the speedup
+ADDRESS_STANDARDIZATION_PARALLEL_THRESHOLD = 5000
+
+# Number of leading bytes of an upload used to detect its encoding and delimiter and to estimate its row count
+CSV_SNIFF_SAMPLE_BYTES = 64 * 1024
+
+CSV_CANDIDATE_DELIMITERS = ',;\t|'
+
+# Tried in order; latin-1 is the fallback since it can decode any byte sequence
+CSV_CANDIDATE_ENCODINGS = ['utf-8', 'cp1252']
+
+# Pseudo-format for dates exported from Excel as serial day numbers
+EXCEL_SERIAL_DATE_FORMAT = 'excel'
+
+# Serial day number of 9999-12-31, the last date Excel can represent
+EXCEL_SERIAL_DATE_MAX = 2958466
+
+# Candidate fileDate formats, in order of preference when several parse a sample equally well
+FILEDATE_FORMATS = ['%m/%d/%y', '%m/%d/%Y', '%Y-%m-%d', '%Y/%m/%d', '%m-%d-%y', '%m-%d-%Y', '%Y%m%d',
+                    EXCEL_SERIAL_DATE_FORMAT]
+
+# Number of fileDate values used to detect the format of an upload chunk
+FILEDATE_SAMPLE_SIZE = 1000
+
+# Maximum number of rejected records listed in an upload summary
+MAX_REPORTED_INVALID_RECORDS = 100
+
+# Number of uploads ingested at the same time by each server process; further uploads wait in a queue
+MAX_CONCURRENT_INGEST_JOBS = 1
+
+# Minimum number of seconds between progress writes of a running ingest job
+INGEST_JOB_PROGRESS_INTERVAL = 1
+
+# Number of seconds between checks for progress when streaming ingest job events
+INGEST_JOB_EVENTS_INTERVAL = 1
+
+# Connections kept open by each server process, and how many more it may open under load. Property popups read on 6
+#   pooled connections at once and blocking work runs on at most 40 threads (anyio's default), so a burst of requests
+#   can be served without waiting on the pool, which would otherwise time out after 30 seconds
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 20
+
+# Server processes hold this transaction-level advisory lock while creating the schema on startup, so that concurrently
+#   starting workers apply it one at a time
+SCHEMA_LOCK_KEY = 7340
+
+# Each server process holds an advisory lock of this class for as long as it runs, keyed by the ownerKey of the ingest
+#   jobs it queued, so that jobs left behind by a process that is gone can be told apart
+INGEST_JOB_OWNER_LOCK_CLASS = 7341
+
+# Directory holding the copy of each upload until its ingest job finishes
+INGEST_UPLOAD_DIR = os.path.join(tempfile.gettempdir(), 'eviction-uploads')
+
+# Default and maximum number of rows returned when previewing an upload
+PREVIEW_NUM_ROWS = 5
+MAX_PREVIEW_NUM_ROWS = 100
+
+# Overridable so that uploads can be benchmarked against a local stand-in (see benchmarks/geocoder_standin.py)
+GEOCODING_API_URL = os.getenv('GEOCODING_API_URL',
+                              'https://geocoding.geo.census.gov/geocoder/locations/addressbatch')
+
+# Number of days a No_Match/Tie result in geocode_cache is reused before the address is sent to the geocoder again
+GEOCODE_NO_MATCH_TTL_DAYS = 90
+
+# Maximum number of geocoder batch requests in flight at once
+GEOCODER_MAX_IN_FLIGHT = 4
+
+# Number of seconds before a geocoder batch request is abandoned; timed-out batches are split in half and retried
+GEOCODER_REQUEST_TIMEOUT = 300
+
+# Number of times a failed geocoder batch is retried before its addresses are left ungeocoded
+GEOCODER_MAX_RETRIES = 3
+
+# Retries wait a random delay of up to GEOCODER_BACKOFF_BASE * 2^attempt seconds, capped at GEOCODER_BACKOFF_MAX
+GEOCODER_BACKOFF_BASE = 1
+GEOCODER_BACKOFF_MAX = 30
+
+# Timed-out batches are no longer split once they are smaller than this
+GEOCODER_MIN_BATCH_SIZE = 100
 
 PROXIMITY_RADIUS = 160
+
+# Number of CARES properties per page of pending suggestions, and of decisions per page of archived suggestions
+SUGGESTION_PAGE_SIZE = 50
+ARCHIVED_SUGGESTION_PAGE_SIZE = 100
+MAX_SUGGESTION_PAGE_SIZE = 500
+
+# Changes to the suggestion queue are broadcast on this PostgreSQL NOTIFY channel and pushed to clients over SSE
+SUGGESTION_EVENTS_CHANNEL = 'suggestion_changes'
+# Changes involving more CARES properties are broadcast without their ids, to stay within the NOTIFY payload limit
+SUGGESTION_EVENTS_MAX_CARES_IDS = 500
+SUGGESTION_EVENTS_QUEUE_SIZE = 100
+# Seconds between keepalive comments sent on idle event streams
+SUGGESTION_EVENTS_KEEPALIVE_INTERVAL = 15
+# Seconds to wait before reconnecting a lost listener connection
+SUGGESTION_EVENTS_RECONNECT_INTERVAL = 5
@@ -1,3 +1,10 @@
+from io import StringIO
+from typing import Callable
+
+import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
 from src.db.db import SessionLocal
 
 
@@ -7,3 +14,27 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Runs a blocking controller function on a worker thread with a session of its own, so that several can be awaited
+#   concurrently (e.g. with asyncio.gather), each on its own pooled connection
+async def run_with_session(fn: Callable, *args):
+    def run():
+        with SessionLocal() as db:
+            return fn(db, *args)
+
+    return await run_in_threadpool(run)
+
+
+# Bulk loads a DataFrame into a table with COPY FROM STDIN, within the session's current transaction. Missing values
+#   are loaded as NULL. A buffer can be passed in to be reused across calls
+def copy_dataframe(db: Session, table_name: str, df: pd.DataFrame, buffer: StringIO | None = None):
+    buffer = StringIO() if buffer is None else buffer
+    buffer.seek(0)
+    buffer.truncate()
+    df.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    columns = ', '.join([f'"{col}"' for col in df.columns])
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY "{table_name}" ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)